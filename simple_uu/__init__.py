@@ -1,21 +1,63 @@
-from simple_uu.decode import decode
-from simple_uu.encode import encode
+from simple_uu.archive import ArchiveEntry, encode_archive
+from simple_uu.batch import UUBatch, encode_batch
+from simple_uu.budget import (MemoryBudget, get_default_budget,
+                              set_default_budget)
+from simple_uu.cache import UUCache
+from simple_uu.decode import decode, decode_to_file, find_checkpoint
+from simple_uu.encode import encode, encode_to_file
 from simple_uu.exceptions import (FileExtensionNotDetected,
                                   FileExtensionNotFoundError,
                                   InvalidPermissionsMode,
                                   InvalidUUDecodingError,
-                                  InvalidUUEncodingError)
-from simple_uu.types import UUDecodedFile, UUEncodedFile
+                                  InvalidUUEncodingError, UUServiceError)
+from simple_uu.index import UUIndex
+from simple_uu.inspection import UUInspection, inspect
+from simple_uu.logger import set_logging_mode
+from simple_uu.parallel import decode_parallel, encode_parallel
+from simple_uu.scan import UUBlock, decode_all, iter_blocks, scan
+from simple_uu.stats import UUStats, UUStatsAggregator
+from simple_uu.tuning import TuningProfile, get_profile, set_profile
+from simple_uu.types import (UUDecodedFile, UUEncodedFile, UULineError,
+                             UUWrittenFile)
 
 __version__ = '0.2.0'
 __all__ = [
     'decode',
+    'decode_to_file',
+    'decode_all',
+    'decode_parallel',
     'encode',
+    'encode_archive',
+    'encode_batch',
+    'encode_parallel',
+    'encode_to_file',
+    'find_checkpoint',
+    'get_default_budget',
+    'get_profile',
+    'inspect',
+    'iter_blocks',
+    'scan',
+    'set_default_budget',
+    'set_profile',
+    'set_logging_mode',
+    'ArchiveEntry',
+    'MemoryBudget',
+    'TuningProfile',
+    'UUBatch',
+    'UUBlock',
+    'UUCache',
     'UUDecodedFile',
     'UUEncodedFile',
+    'UUIndex',
+    'UUInspection',
+    'UULineError',
+    'UUWrittenFile',
+    'UUStats',
+    'UUStatsAggregator',
     'FileExtensionNotDetected',
     'FileExtensionNotFoundError',
     'InvalidPermissionsMode',
     'InvalidUUDecodingError',
-    'InvalidUUEncodingError'
+    'InvalidUUEncodingError',
+    'UUServiceError'
 ]
@@ -0,0 +1,176 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import (BinaryIO, Deque, Iterable, Iterator, List, NamedTuple,
+                    Optional, Union)
+
+from simple_uu.encode import encode
+from simple_uu.scan import UUBlock
+from simple_uu.types import UUEncodedFile
+from simple_uu.utils import FSYNC_NONE, WRITE_BUFFER_SIZE, AtomicFileWriter
+
+# Separator written after the end line of each section
+_SECTION_SEPARATOR = b'\n'
+
+class ArchiveEntry(NamedTuple):
+    """
+    A single file to be encoded into an archive.
+
+    Args:
+        file_object (str | Path | bytes | bytearray): A file object is either a path
+            to a file, bytes object or bytearray object. All must contain binary data.
+        filename (str): The name of the file being encoded.
+        octal_permission (str | int | None): An octal permission as a string or integer.
+        extension (str | None): An extension for the file being encoded.
+    """
+    file_object: Union[str, Path, bytes, bytearray]
+    filename: str
+    octal_permission: Optional[Union[str, int]] = None
+    extension: Optional[str] = None
+
+
+def _encode_entry(
+    entry: ArchiveEntry, encoding_validation: bool, binary_validation: bool
+) -> UUEncodedFile:
+    """
+    A private function to encode a single archive entry.
+    """
+    return encode(
+        file_object=entry.file_object,
+        filename=entry.filename,
+        octal_permission=entry.octal_permission,
+        extension=entry.extension,
+        encoding_validation=encoding_validation,
+        binary_validation=binary_validation
+    )
+
+
+def _iter_encoded_entries(
+    entries: Iterable[ArchiveEntry],
+    encoding_validation: bool,
+    binary_validation: bool,
+    workers: Optional[int],
+    max_in_flight: int
+) -> Iterator[UUEncodedFile]:
+    """
+    A private generator to encode entries in parallel, yielding them in the order they
+    were given. At most max_in_flight entries are submitted ahead of the entry being
+    yielded, which bounds the encoded data held in memory.
+    """
+    if workers is None or workers <= 1:
+        for entry in entries:
+            yield _encode_entry(
+                entry=entry,
+                encoding_validation=encoding_validation,
+                binary_validation=binary_validation
+            )
+        return
+
+    pending: Deque['Future[UUEncodedFile]'] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for entry in entries:
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+
+                pending.append(
+                    executor.submit(
+                        _encode_entry,
+                        entry=entry,
+                        encoding_validation=encoding_validation,
+                        binary_validation=binary_validation
+                    )
+                )
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Entries that have not started are dropped if encoding fails
+            for future in pending:
+                future.cancel()
+
+
+def _write_sections(
+    encoded_files: Iterable[UUEncodedFile], sink: Union[AtomicFileWriter, BinaryIO]
+) -> List[UUBlock]:
+    """
+    A private function to write each encoded file as a begin/end section of a sink.
+    Returns the location of each section.
+    """
+    blocks: List[UUBlock] = []
+
+    offset = 0
+    for encoded_file in encoded_files:
+        uu_bytes = encoded_file.uu_bytes
+        header = bytes(uu_bytes[:uu_bytes.find(b'\n')])
+
+        sink.write(uu_bytes)
+        sink.write(_SECTION_SEPARATOR)
+
+        length = len(uu_bytes) + len(_SECTION_SEPARATOR)
+        blocks.append(UUBlock(offset=offset, length=length, header=header))
+        offset += length
+
+    return blocks
+
+
+def encode_archive(
+    entries: Iterable[ArchiveEntry],
+    dst: Union[str, Path, BinaryIO],
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    encoding_validation: bool = True,
+    binary_validation: bool = True,
+    buffer_size: int = WRITE_BUFFER_SIZE,
+    fsync: str = FSYNC_NONE
+) -> List[UUBlock]:
+    """
+    Encode many files into a single stream of concatenated begin/end sections, such
+    as a bundle attached to a message.
+
+    Entries are encoded in parallel while sections are written to the destination in
+    the order the entries were given, so the output is deterministic. Only a bounded
+    number of encoded entries are held in memory at once and entries may be given
+    lazily, so bundles of any number of files can be written. A path destination is
+    written to a temporary file which is atomically renamed once every entry has been
+    encoded, while a binary stream destination is written to as is.
+
+    Args:
+        entries (Iterable[ArchiveEntry]): The files to encode, in order.
+        dst (str | Path | BinaryIO): A path to the archive file or a binary stream.
+        workers (int | None): The number of threads used to encode entries in parallel.
+            If not provided, entries are encoded sequentially.
+        max_in_flight (int | None): The maximum number of entries being encoded or
+            waiting to be written at once. Defaults to twice the number of workers.
+        encoding_validation (bool): Boolean indicating whether to run encoding validation.
+        binary_validation (bool): Boolean indicating whether to run binary validation.
+        buffer_size (int): The size of the write buffer in bytes, for path destinations.
+        fsync (str): The fsync policy, either 'none', 'file' or 'directory', for path
+            destinations.
+
+    Returns:
+        List[UUBlock]: The offset, length and header of each section, in order, as
+            would be returned by scan for the archive.
+    """
+    if max_in_flight is None:
+        max_in_flight = 2 * max(workers or 1, 1)
+    elif max_in_flight < 1:
+        raise ValueError('Maximum number of entries in flight must be at least one')
+
+    encoded_files = _iter_encoded_entries(
+        entries=entries,
+        encoding_validation=encoding_validation,
+        binary_validation=binary_validation,
+        workers=workers,
+        max_in_flight=max_in_flight
+    )
+
+    if not isinstance(dst, (str, Path)):
+        return _write_sections(encoded_files=encoded_files, sink=dst)
+
+    dst = Path(dst)
+    with AtomicFileWriter(directory=dst.parent, buffer_size=buffer_size, fsync=fsync) as writer:
+        blocks = _write_sections(encoded_files=encoded_files, sink=writer)
+        writer.commit(filename=dst.name)
+
+    return blocks
@@ -0,0 +1,151 @@
+import binascii
+import zlib
+from array import array
+from typing import Iterator, Optional, Sequence, Union
+
+from simple_uu.budget import MemoryBudget, get_default_budget, reservation
+from simple_uu.encode import (_MAX_BINARY_LENGTH, _encoded_length,
+                              _file_extension, _permissions_mode)
+
+# Footer written after the lines of each item
+_FOOTER = b'\nend'
+
+class UUBatch:
+    """
+    The packed result of encoding many payloads at once. Encoded items are stored back
+    to back in a single buffer, with parallel arrays of offsets and metadata, so no
+    Python objects are created for each item.
+
+    Item i occupies data[offsets[i]:offsets[i + 1]] and has exactly the same content as
+    the uu_bytes of encoding the payload on its own.
+
+    Args:
+        data (bytearray): The encoded items, back to back.
+        offsets (array): The offset of each item within the data, followed by the
+            length of the data.
+        input_lengths (array): The length of each payload before encoding.
+        crc32s (array | None): The CRC32 checksum of each payload, if requested.
+    """
+    def __init__(
+        self,
+        data: bytearray,
+        offsets: 'array[int]',
+        input_lengths: 'array[int]',
+        crc32s: Optional['array[int]'] = None
+    ):
+        self.data = data
+        self.offsets = offsets
+        self.input_lengths = input_lengths
+        self.crc32s = crc32s
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'items={len(self)}, '
+            f'size={len(self.data)})'
+        )
+
+    def __len__(self) -> int:
+        return len(self.input_lengths)
+
+    def __iter__(self) -> Iterator[memoryview]:
+        for index in range(len(self)):
+            yield self.item(index=index)
+
+    def item(self, index: int) -> memoryview:
+        """
+        A view of a single encoded item, without copying it out of the batch.
+
+        Args:
+            index (int): The index of the item.
+
+        Returns:
+            memoryview: A read-only view of the encoded item.
+        """
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('Batch item index out of range')
+
+        return memoryview(self.data)[self.offsets[index]:self.offsets[index + 1]].toreadonly()
+
+
+def encode_batch(
+    buffers: Sequence[Union[bytes, bytearray, memoryview]],
+    filename: str = 'payload',
+    octal_permission: Optional[Union[str, int]] = None,
+    extension: str = 'bin',
+    checksums: bool = False,
+    budget: Optional[MemoryBudget] = None
+) -> UUBatch:
+    """
+    Encode many small payloads into a single packed batch, which avoids the cost of
+    creating a UUEncodedFile and copying its data for every payload.
+
+    Every item shares the same permissions mode and extension and item i is named
+    after the filename with its index (e.g., 'payload_0.bin'). As the batch is meant
+    for large numbers of small payloads, the encoding and binary validation and the
+    file type detection run by encode are skipped.
+
+    Args:
+        buffers (Sequence[bytes | bytearray | memoryview]): The payloads to encode.
+        filename (str): The name each item is given, followed by its index.
+        octal_permission (str | int | None): An octal permission as a string or integer.
+        extension (str): An extension for each item.
+        checksums (bool): Boolean indicating whether to compute a CRC32 checksum of
+            each payload.
+        budget (MemoryBudget | None): A memory budget the packed data of every item is
+            reserved from while the batch is built, defaults to the budget of the process
+            if one is set.
+
+    Returns:
+        UUBatch: A UUBatch instance containing every encoded item.
+    """
+    filename = '_'.join(item for item in filename.split())
+    permissions_mode = _permissions_mode(octal_permission=octal_permission)
+    _file_extension(extension=extension)
+
+    header_prefix = f'begin {permissions_mode} {filename}_'.encode('ascii')
+    header_suffix = f'.{extension}\n'.encode('ascii')
+
+    data = bytearray()
+    offsets = array('Q', [0])
+    input_lengths = array('Q')
+    crc32s: Optional['array[int]'] = array('L') if checksums else None
+
+    # Every item is reserved up front, as the packed data only grows until it is returned,
+    # the length is only computed when there is a budget to reserve it from
+    if budget is None:
+        budget = get_default_budget()
+
+    batch_length = 0
+    if budget is not None:
+        item_overhead = len(header_prefix) + len(header_suffix) + len(_FOOTER) + 20
+        batch_length = sum(
+            _encoded_length(binary_length=memoryview(buffer).nbytes) + item_overhead
+            for buffer in buffers
+        )
+
+    b2a_uu = binascii.b2a_uu
+    with reservation(budget=budget, nbytes=batch_length):
+        for index, buffer in enumerate(buffers):
+            buffer_view = memoryview(buffer)
+            buffer_length = len(buffer_view)
+
+            data += header_prefix
+            data += b'%d' % index
+            data += header_suffix
+            for line_start in range(0, buffer_length, _MAX_BINARY_LENGTH):
+                data += b2a_uu(buffer_view[line_start:line_start + _MAX_BINARY_LENGTH])
+            data += _FOOTER
+
+            offsets.append(len(data))
+            input_lengths.append(buffer_length)
+            if crc32s is not None:
+                crc32s.append(zlib.crc32(buffer_view))
+
+    return UUBatch(data=data, offsets=offsets, input_lengths=input_lengths, crc32s=crc32s)
@@ -0,0 +1,693 @@
+import argparse
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import tracemalloc
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from simple_uu.batch import encode_batch
+from simple_uu.decode import _BLOCK_LENGTH, decode, decode_to_file
+from simple_uu.encode import _CHUNK_LENGTH, encode, encode_to_file
+from simple_uu.logger import LIBRARY_LOGGING, set_logging_mode
+from simple_uu.parallel import (_DEFAULT_SPAN_LENGTH, decode_parallel,
+                                encode_parallel)
+from simple_uu.tuning import TuningProfile, get_profile, set_profile
+
+# Multipliers for the size suffixes accepted on the command line
+_SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+_DEFAULT_SIZES = ('1KB', '64KB', '1MB', '16MB')
+
+# Default allowed drop in throughput, as a fraction, before a case is a regression
+_DEFAULT_THRESHOLD = 0.1
+
+# Default number and size of payloads for the batch benchmark
+_DEFAULT_BATCH_ITEMS = 10000
+_DEFAULT_BATCH_ITEM_SIZE = 256
+
+# Default payload size for the thread scaling benchmark
+_DEFAULT_THREADS_SIZE = '16MB'
+
+# A jpeg signature is prepended so file type detection succeeds on random payloads
+_PAYLOAD_SIGNATURE = b'\xff\xd8\xff\xe0'
+
+# Default payload size for calibrating a tuning profile
+DEFAULT_TUNING_SIZE = '4MB'
+
+# Candidate settings tried when calibrating, including the built-in defaults
+_CHUNK_LENGTHS = tuple(45 * line_count for line_count in (256, 1024, 4096, 16384))
+_BLOCK_LENGTHS = (16 * 1024, 64 * 1024, 256 * 1024, 1024 * 1024)
+_SPAN_LENGTHS = (256 * 1024, 1024 * 1024, 4 * 1024 * 1024)
+
+# Fraction by which a setting must be faster than the built-in default to replace it
+_TUNING_TOLERANCE = 0.05
+
+def parse_size(size: str) -> int:
+    """
+    Parse a human readable size (e.g., '64KB', '1GB') into a number of bytes.
+
+    Args:
+        size (str): A size with an optional B, KB, MB or GB suffix.
+
+    Returns:
+        int: The size in bytes.
+    """
+    size = size.strip().upper()
+    for unit in sorted(_SIZE_UNITS, key=len, reverse=True):
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * _SIZE_UNITS[unit])
+
+    return int(size)
+
+
+def generate_payload(size: int, seed: int = 0) -> bytes:
+    """
+    Generate a deterministic random binary payload of a given size.
+
+    Args:
+        size (int): The size of the payload in bytes.
+        seed (int): The seed used for the random generator.
+
+    Returns:
+        bytes: A binary payload starting with a jpeg signature.
+    """
+    body = random.Random(seed).randbytes(max(size - len(_PAYLOAD_SIGNATURE), 0))
+    return (_PAYLOAD_SIGNATURE + body)[:size]
+
+
+def _case_name(operation: str, size: int, flags: Dict[str, Any]) -> str:
+    """
+    A private function to build a unique and stable name for a benchmark case.
+    """
+    flag_names = ','.join(f'{flag}={int(value)}' for flag, value in sorted(flags.items()))
+    return f'{operation}[size={size},{flag_names}]'
+
+
+def _measure(
+    operation: str,
+    size: int,
+    flags: Dict[str, Any],
+    function: Callable[[], Any],
+    repeat: int
+) -> Dict[str, Any]:
+    """
+    A private function to time a benchmark case and measure its peak memory.
+    """
+    latencies: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        latencies.append(perf_counter() - start)
+
+    # Peak memory is measured on a separate run so tracing does not skew timings
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median_latency = statistics.median(latencies)
+    return {
+        'name': _case_name(operation=operation, size=size, flags=flags),
+        'operation': operation,
+        'size': size,
+        'flags': flags,
+        'repeat': repeat,
+        'latency_min': min(latencies),
+        'latency_median': median_latency,
+        'throughput_mb_s': size / median_latency / 1024 ** 2 if median_latency else None,
+        'peak_memory': peak_memory
+    }
+
+
+def run_benchmarks(sizes: Sequence[int], repeat: int = 3) -> List[Dict[str, Any]]:
+    """
+    Run encode and decode benchmarks for each payload size with every combination
+    of validation flags turned on and off.
+
+    Args:
+        sizes (Sequence[int]): The payload sizes in bytes.
+        repeat (int): The number of timed runs for each case.
+
+    Returns:
+        List[Dict[str, Any]]: A list of results, one for each benchmark case.
+    """
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        payload = generate_payload(size=size)
+        uu_bytes = encode(
+            file_object=payload,
+            filename='bench',
+            octal_permission=0o644,
+            extension='jpg',
+            encoding_validation=False,
+            binary_validation=False
+        ).uu_bytes
+
+        for encoding_validation, binary_validation in itertools.product((True, False), repeat=2):
+            encode_flags = {
+                'encoding_validation': encoding_validation,
+                'binary_validation': binary_validation
+            }
+            results.append(
+                _measure(
+                    operation='encode',
+                    size=size,
+                    flags=encode_flags,
+                    function=partial(
+                        encode,
+                        file_object=payload,
+                        filename='bench',
+                        octal_permission=0o644,
+                        extension='jpg',
+                        encoding_validation=encoding_validation,
+                        binary_validation=binary_validation
+                    ),
+                    repeat=repeat
+                )
+            )
+
+        for encoding_validation in (True, False):
+            decode_flags = {'encoding_validation': encoding_validation}
+            results.append(
+                _measure(
+                    operation='decode',
+                    size=size,
+                    flags=decode_flags,
+                    function=partial(
+                        decode, file_object=uu_bytes, encoding_validation=encoding_validation
+                    ),
+                    repeat=repeat
+                )
+            )
+
+    return results
+
+
+def _encode_loop(payloads: Sequence[bytes]) -> None:
+    """
+    A private function calling encode once for each payload, as the baseline for
+    the batch benchmark.
+    """
+    for index, payload in enumerate(payloads):
+        encode(
+            file_object=payload,
+            filename=f'payload_{index}',
+            octal_permission=0o644,
+            extension='bin',
+            encoding_validation=False,
+            binary_validation=False
+        )
+
+
+def run_batch_benchmarks(
+    item_count: int, item_size: int, repeat: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Compare encoding many small payloads with encode_batch against calling encode
+    in a loop. Each result includes the median latency per payload.
+
+    Args:
+        item_count (int): The number of payloads.
+        item_size (int): The size of each payload in bytes.
+        repeat (int): The number of timed runs for each case.
+
+    Returns:
+        List[Dict[str, Any]]: A list of results, one for the loop and one for the batch.
+    """
+    payloads = [generate_payload(size=item_size, seed=seed) for seed in range(item_count)]
+    flags = {'items': item_count, 'item_size': item_size}
+
+    results = [
+        _measure(
+            operation='encode_loop',
+            size=item_count * item_size,
+            flags=flags,
+            function=partial(_encode_loop, payloads=payloads),
+            repeat=repeat
+        ),
+        _measure(
+            operation='encode_batch',
+            size=item_count * item_size,
+            flags=flags,
+            function=partial(
+                encode_batch, buffers=payloads, octal_permission=0o644, extension='bin'
+            ),
+            repeat=repeat
+        )
+    ]
+    for result in results:
+        result['latency_per_item'] = result['latency_median'] / item_count
+
+    return results
+
+
+def _thread_counts(max_threads: int) -> List[int]:
+    """
+    A private function to generate the thread counts to benchmark, doubling from one
+    up to and including the maximum.
+    """
+    thread_counts: List[int] = []
+    threads = 1
+    while threads < max_threads:
+        thread_counts.append(threads)
+        threads *= 2
+
+    thread_counts.append(max_threads)
+    return thread_counts
+
+
+def run_thread_scaling_benchmarks(
+    size: int, max_threads: int, repeat: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Measure how encode_parallel and decode_parallel scale from one thread up to the
+    maximum number of threads, with the payload split evenly between threads. Each
+    result includes the speedup over a single thread and whether the GIL was enabled,
+    as threads only run in parallel on free-threaded builds of Python.
+
+    Args:
+        size (int): The payload size in bytes.
+        max_threads (int): The maximum number of threads.
+        repeat (int): The number of timed runs for each case.
+
+    Returns:
+        List[Dict[str, Any]]: A list of results, one for each operation and thread count.
+    """
+    if max_threads < 1:
+        raise ValueError('Number of threads must be at least one')
+
+    gil_enabled: bool = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+    payload = generate_payload(size=size)
+    uu_bytes = bytes(
+        encode(
+            file_object=payload,
+            filename='bench',
+            octal_permission=0o644,
+            extension='jpg',
+            encoding_validation=False,
+            binary_validation=False
+        ).uu_bytes
+    )
+
+    results: List[Dict[str, Any]] = []
+    for operation in ('encode_parallel', 'decode_parallel'):
+        single_thread_latency: Optional[float] = None
+        for threads in _thread_counts(max_threads=max_threads):
+            if operation == 'encode_parallel':
+                function: Callable[[], Any] = partial(
+                    encode_parallel,
+                    file_object=payload,
+                    filename='bench',
+                    octal_permission=0o644,
+                    extension='jpg',
+                    encoding_validation=False,
+                    binary_validation=False,
+                    workers=threads,
+                    span_length=max(-(-size // threads), 1024)
+                )
+            else:
+                function = partial(
+                    decode_parallel,
+                    file_object=uu_bytes,
+                    encoding_validation=False,
+                    workers=threads,
+                    span_length=-(-len(uu_bytes) // threads)
+                )
+
+            result = _measure(
+                operation=operation,
+                size=size,
+                flags={'threads': threads},
+                function=function,
+                repeat=repeat
+            )
+            if single_thread_latency is None:
+                single_thread_latency = result['latency_median']
+
+            result['speedup'] = (
+                single_thread_latency / result['latency_median'] if result['latency_median'] else None
+            )
+            result['gil_enabled'] = gil_enabled
+            results.append(result)
+
+    return results
+
+
+def _select_setting(
+    results: List[Dict[str, Any]], setting: str, default: int
+) -> Optional[int]:
+    """
+    A private function to select the value of a setting with the lowest latency. The
+    built-in default is kept, as None, unless another value is faster by more than
+    the tolerance, so that noise does not replace it.
+    """
+    fastest = min(results, key=lambda result: result['latency_median'])
+    default_result = next(
+        (result for result in results if result['flags'][setting] == default), None
+    )
+
+    if default_result is not None and (
+        fastest['latency_median'] >= default_result['latency_median'] * (1 - _TUNING_TOLERANCE)
+    ):
+        return None
+
+    return fastest['flags'][setting]
+
+
+def _measure_setting(
+    operation: str,
+    size: int,
+    setting: str,
+    values: Sequence[int],
+    function: Callable[[], Any],
+    repeat: int,
+    profile: TuningProfile
+) -> List[Dict[str, Any]]:
+    """
+    A private function to time a benchmark case for each value of a setting, applied
+    to the profile of the process while it is measured.
+    """
+    results: List[Dict[str, Any]] = []
+    for value in values:
+        set_profile(profile=profile._replace(**{setting: value}))
+        results.append(
+            _measure(
+                operation=operation,
+                size=size,
+                flags={setting: value},
+                function=function,
+                repeat=repeat
+            )
+        )
+
+    return results
+
+
+def _parallel_round_trip(payload: bytes, uu_bytes: bytes) -> None:
+    """
+    A private function to encode and decode a payload with encode_parallel and
+    decode_parallel, using the settings of the profile of the process.
+    """
+    encode_parallel(
+        file_object=payload,
+        filename='bench',
+        octal_permission=0o644,
+        extension='jpg',
+        encoding_validation=False,
+        binary_validation=False
+    )
+    decode_parallel(file_object=uu_bytes, encoding_validation=False)
+
+
+def calibrate(
+    directory: Optional[Union[str, Path]] = None,
+    size: Optional[int] = None,
+    repeat: int = 3,
+    max_threads: Optional[int] = None
+) -> Tuple[TuningProfile, List[Dict[str, Any]]]:
+    """
+    Run short benchmarks on the host to calibrate a tuning profile. The chunk length
+    is chosen by timing encode_to_file and the block length by timing decode_to_file,
+    both reading from and writing to a temporary directory within the directory, so
+    the storage behind it is measured. The number of threads and then the span length
+    are chosen by timing encode_parallel and decode_parallel, where a single thread
+    selects the serial engine, as on builds of Python with the GIL.
+
+    Each setting is applied to the profile of the process while it is measured, so no
+    other encoding or decoding should run in the process during calibration.
+
+    Args:
+        directory (str | Path | None): The directory to calibrate storage against,
+            defaults to the temporary directory of the system.
+        size (int | None): The payload size in bytes, defaults to 4MB.
+        repeat (int): The number of timed runs for each case.
+        max_threads (int | None): The maximum number of threads, defaults to the
+            number of CPUs.
+
+    Returns:
+        Tuple[TuningProfile, List[Dict[str, Any]]]: The calibrated profile and the
+            results of each case.
+    """
+    max_threads = max_threads or os.cpu_count() or 1
+    if max_threads < 1:
+        raise ValueError('Number of threads must be at least one')
+
+    if size is None:
+        size = parse_size(size=DEFAULT_TUNING_SIZE)
+
+    payload = generate_payload(size=size)
+    encode_options: Dict[str, Any] = {
+        'filename': 'bench',
+        'octal_permission': 0o644,
+        'extension': 'jpg',
+        'encoding_validation': False,
+        'binary_validation': False
+    }
+    uu_bytes = bytes(encode(file_object=payload, **encode_options).uu_bytes)
+
+    results: List[Dict[str, Any]] = []
+    previous_profile = get_profile()
+    profile = TuningProfile()
+    try:
+        with tempfile.TemporaryDirectory(dir=directory) as calibration_directory:
+            payload_path = Path(calibration_directory) / 'payload.jpg'
+            payload_path.write_bytes(payload)
+            uu_path = Path(calibration_directory) / 'payload.txt'
+            uu_path.write_bytes(uu_bytes)
+            decoded_directory = Path(calibration_directory) / 'decoded'
+            decoded_directory.mkdir()
+
+            chunk_results = _measure_setting(
+                operation='encode_to_file',
+                size=size,
+                setting='chunk_length',
+                values=_CHUNK_LENGTHS,
+                function=partial(
+                    encode_to_file,
+                    file_object=payload_path,
+                    directory=calibration_directory,
+                    **encode_options
+                ),
+                repeat=repeat,
+                profile=profile
+            )
+            profile = profile._replace(
+                chunk_length=_select_setting(
+                    results=chunk_results, setting='chunk_length', default=_CHUNK_LENGTH
+                )
+            )
+
+            block_results = _measure_setting(
+                operation='decode_to_file',
+                size=size,
+                setting='block_length',
+                values=_BLOCK_LENGTHS,
+                function=partial(
+                    decode_to_file,
+                    file_object=uu_path,
+                    directory=decoded_directory,
+                    encoding_validation=False
+                ),
+                repeat=repeat,
+                profile=profile
+            )
+            profile = profile._replace(
+                block_length=_select_setting(
+                    results=block_results, setting='block_length', default=_BLOCK_LENGTH
+                )
+            )
+            results.extend(chunk_results + block_results)
+
+        round_trip = partial(_parallel_round_trip, payload=payload, uu_bytes=uu_bytes)
+        worker_results = _measure_setting(
+            operation='parallel',
+            size=size,
+            setting='workers',
+            values=_thread_counts(max_threads=max_threads),
+            function=round_trip,
+            repeat=repeat,
+            profile=profile
+        )
+        profile = profile._replace(
+            workers=_select_setting(
+                results=worker_results, setting='workers', default=os.cpu_count() or 1
+            )
+        )
+        results.extend(worker_results)
+
+        # The span length makes no difference to the serial engine
+        if (profile.workers or os.cpu_count() or 1) > 1:
+            span_results = _measure_setting(
+                operation='parallel',
+                size=size,
+                setting='span_length',
+                values=_SPAN_LENGTHS,
+                function=round_trip,
+                repeat=repeat,
+                profile=profile
+            )
+            profile = profile._replace(
+                span_length=_select_setting(
+                    results=span_results, setting='span_length', default=_DEFAULT_SPAN_LENGTH
+                )
+            )
+            results.extend(span_results)
+    finally:
+        set_profile(profile=previous_profile)
+
+    return profile, results
+
+
+def compare_to_baseline(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    threshold: float = _DEFAULT_THRESHOLD
+) -> List[str]:
+    """
+    Compare results against a stored baseline. A case is a regression when its
+    throughput has dropped by more than the threshold. Cases missing from the
+    baseline are ignored.
+
+    Args:
+        results (List[Dict[str, Any]]): The results of the current run.
+        baseline (List[Dict[str, Any]]): The results of a previous run.
+        threshold (float): The allowed drop in throughput as a fraction.
+
+    Returns:
+        List[str]: A description of each regression found.
+    """
+    baseline_by_name = {result['name']: result for result in baseline}
+
+    regressions: List[str] = []
+    for result in results:
+        baseline_result = baseline_by_name.get(result['name'])
+        if baseline_result is None:
+            continue
+
+        current, previous = result['throughput_mb_s'], baseline_result['throughput_mb_s']
+        if current is None or not previous:
+            continue
+
+        if current < previous * (1 - threshold):
+            regressions.append(
+                f"{result['name']}: {current:.2f} MB/s is more than {threshold:.0%} "
+                f"below baseline of {previous:.2f} MB/s"
+            )
+
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point for running the benchmark suite from the command line.
+
+    Args:
+        argv (Sequence[str] | None): Command line arguments, defaults to sys.argv.
+
+    Returns:
+        int: An exit code, 1 if any regressions were found otherwise 0.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m simple_uu.bench',
+        description='Benchmark encode/decode throughput, latency and peak memory.'
+    )
+    parser.add_argument(
+        '--sizes',
+        default=','.join(_DEFAULT_SIZES),
+        help='Comma separated payload sizes, e.g. 1KB,1MB,1GB'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3, help='Number of timed runs for each case'
+    )
+    parser.add_argument(
+        '--output', help='Path to write the JSON results to, defaults to stdout'
+    )
+    parser.add_argument(
+        '--baseline', help='Path to JSON results of a previous run to compare against'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=_DEFAULT_THRESHOLD,
+        help='Allowed drop in throughput as a fraction before failing'
+    )
+    parser.add_argument(
+        '--batch-items',
+        type=int,
+        default=_DEFAULT_BATCH_ITEMS,
+        help='Number of small payloads for the batch benchmark, 0 to skip it'
+    )
+    parser.add_argument(
+        '--batch-item-size',
+        default=f'{_DEFAULT_BATCH_ITEM_SIZE}B',
+        help='Size of each payload for the batch benchmark, e.g. 256B'
+    )
+    parser.add_argument(
+        '--max-threads',
+        type=int,
+        default=0,
+        help='Maximum number of threads for the thread scaling benchmark, 0 to skip it'
+    )
+    parser.add_argument(
+        '--threads-size',
+        default=_DEFAULT_THREADS_SIZE,
+        help='Size of the payload for the thread scaling benchmark, e.g. 16MB'
+    )
+    args = parser.parse_args(argv)
+
+    set_logging_mode(mode=LIBRARY_LOGGING)
+
+    sizes = [parse_size(size=size) for size in args.sizes.split(',') if size.strip()]
+    results = run_benchmarks(sizes=sizes, repeat=args.repeat)
+    if args.batch_items > 0:
+        results.extend(
+            run_batch_benchmarks(
+                item_count=args.batch_items,
+                item_size=parse_size(size=args.batch_item_size),
+                repeat=args.repeat
+            )
+        )
+    if args.max_threads > 0:
+        results.extend(
+            run_thread_scaling_benchmarks(
+                size=parse_size(size=args.threads_size),
+                max_threads=args.max_threads,
+                repeat=args.repeat
+            )
+        )
+
+    results_json = json.dumps(results, indent=2)
+    if args.output is not None:
+        with open(args.output, 'w') as output_file:
+            output_file.write(results_json)
+    else:
+        print(results_json)
+
+    if args.baseline is not None:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+        regressions = compare_to_baseline(
+            results=results, baseline=baseline, threshold=args.threshold
+        )
+        for regression in regressions:
+            print(f'Regression: {regression}', file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
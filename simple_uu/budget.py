@@ -0,0 +1,255 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from time import monotonic
+from typing import (Any, AsyncIterator, ContextManager, Dict, Iterator, List,
+                    Optional, Tuple)
+
+
+class MemoryBudget:
+    """
+    A limit on the number of bytes of working memory held at once by encode and decode
+    calls, shared between threads. Each call reserves the buffers it is about to build
+    and blocks, or awaits in async code, until enough of the budget has been released.
+
+    A reservation larger than the whole budget is reduced to the limit, so it waits
+    until the budget is free and then runs on its own rather than waiting forever.
+
+    Args:
+        limit (int): The number of bytes that can be reserved at once.
+    """
+    def __init__(self, limit: int):
+        if limit <= 0:
+            raise ValueError('Memory budget must be a positive number of bytes')
+
+        self.limit = limit
+
+        self._condition = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, 'asyncio.Future[None]']] = []
+
+        self._in_use = 0
+        self._peak = 0
+        self._acquisitions = 0
+        self._waits = 0
+        self._wait_time = 0.0
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(limit={self.limit}, in_use={self.in_use})'
+
+    @property
+    def in_use(self) -> int:
+        """The number of bytes currently reserved."""
+        return self._in_use
+
+    def _clamp(self, nbytes: int) -> int:
+        """
+        A private method to validate the size of a reservation and reduce it to the limit.
+        """
+        if nbytes < 0:
+            raise ValueError('Number of bytes reserved cannot be negative')
+
+        return min(nbytes, self.limit)
+
+    def _try_acquire(self, nbytes: int) -> bool:
+        """
+        A private method to reserve bytes if they are available, called with the lock held.
+        """
+        if self._in_use + nbytes > self.limit:
+            return False
+
+        self._in_use += nbytes
+        self._peak = max(self._peak, self._in_use)
+        self._acquisitions += 1
+        return True
+
+    def acquire(self, nbytes: int, timeout: Optional[float] = None) -> int:
+        """
+        Reserve bytes from the budget, blocking until they are available.
+
+        Args:
+            nbytes (int): The number of bytes to reserve.
+            timeout (float | None): The maximum number of seconds to wait, if provided.
+
+        Returns:
+            int: The number of bytes reserved, which must be passed to release.
+        """
+        nbytes = self._clamp(nbytes=nbytes)
+        with self._condition:
+            if self._try_acquire(nbytes=nbytes):
+                return nbytes
+
+            self._waits += 1
+            start = monotonic()
+            try:
+                if not self._condition.wait_for(
+                    lambda: self._try_acquire(nbytes=nbytes), timeout=timeout
+                ):
+                    raise TimeoutError('Timed out waiting for memory budget')
+            finally:
+                self._wait_time += monotonic() - start
+
+            return nbytes
+
+    async def acquire_async(self, nbytes: int) -> int:
+        """
+        Reserve bytes from the budget, awaiting until they are available without
+        blocking the event loop.
+
+        Args:
+            nbytes (int): The number of bytes to reserve.
+
+        Returns:
+            int: The number of bytes reserved, which must be passed to release.
+        """
+        nbytes = self._clamp(nbytes=nbytes)
+        loop = asyncio.get_running_loop()
+
+        start: Optional[float] = None
+        try:
+            while True:
+                with self._condition:
+                    if self._try_acquire(nbytes=nbytes):
+                        return nbytes
+
+                    if start is None:
+                        self._waits += 1
+                        start = monotonic()
+
+                    waiter: 'asyncio.Future[None]' = loop.create_future()
+                    self._async_waiters.append((loop, waiter))
+
+                await waiter
+        finally:
+            if start is not None:
+                with self._condition:
+                    self._wait_time += monotonic() - start
+
+    def release(self, nbytes: int) -> None:
+        """
+        Return reserved bytes to the budget, waking any waiting producers.
+
+        Args:
+            nbytes (int): The number of bytes returned by acquire.
+        """
+        with self._condition:
+            if nbytes > self._in_use:
+                raise ValueError('Cannot release more bytes than are reserved')
+
+            self._in_use -= nbytes
+            self._condition.notify_all()
+
+            async_waiters, self._async_waiters = self._async_waiters, []
+
+        # Every waiter checks the budget again, so none miss a release
+        for loop, waiter in async_waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                pass
+
+    @contextmanager
+    def reserve(self, nbytes: int) -> Iterator[int]:
+        """
+        A context manager reserving bytes for the duration of the block.
+
+        Args:
+            nbytes (int): The number of bytes to reserve.
+
+        Yields:
+            int: The number of bytes reserved.
+        """
+        reserved = self.acquire(nbytes=nbytes)
+        try:
+            yield reserved
+        finally:
+            self.release(nbytes=reserved)
+
+    @asynccontextmanager
+    async def reserve_async(self, nbytes: int) -> AsyncIterator[int]:
+        """
+        An async context manager reserving bytes for the duration of the block.
+
+        Args:
+            nbytes (int): The number of bytes to reserve.
+
+        Yields:
+            int: The number of bytes reserved.
+        """
+        reserved = await self.acquire_async(nbytes=nbytes)
+        try:
+            yield reserved
+        finally:
+            self.release(nbytes=reserved)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Export the utilization of the budget as a dictionary, suitable for a metrics system.
+
+        Returns:
+            Dict[str, Any]: A dictionary representation of the utilization.
+        """
+        with self._condition:
+            return {
+                'limit': self.limit,
+                'in_use': self._in_use,
+                'peak': self._peak,
+                'utilization': self._in_use / self.limit,
+                'peak_utilization': self._peak / self.limit,
+                'acquisitions': self._acquisitions,
+                'waits': self._waits,
+                'wait_time': self._wait_time
+            }
+
+
+def _wake(waiter: 'asyncio.Future[None]') -> None:
+    """
+    A private function to wake a producer awaiting the budget, unless it was cancelled.
+    """
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# Budget used by calls that are not given one, if set
+_default_budget: Optional[MemoryBudget] = None
+
+
+def set_default_budget(budget: Optional[MemoryBudget]) -> None:
+    """
+    Set the memory budget shared by every call in the process that is not given one.
+
+    Args:
+        budget (MemoryBudget | None): The default budget, or None to remove the limit.
+    """
+    global _default_budget
+    _default_budget = budget
+
+
+def get_default_budget() -> Optional[MemoryBudget]:
+    """
+    Get the memory budget shared by every call in the process that is not given one.
+
+    Returns:
+        MemoryBudget | None: The default budget, or None if there is no limit.
+    """
+    return _default_budget
+
+
+def reservation(budget: Optional[MemoryBudget], nbytes: int) -> ContextManager[Any]:
+    """
+    A context manager reserving bytes from a budget, falling back to the default budget
+    of the process. Without either, nothing is reserved.
+
+    Args:
+        budget (MemoryBudget | None): The budget given to a call, if any.
+        nbytes (int): The number of bytes to reserve.
+
+    Returns:
+        ContextManager: A context manager holding the reservation.
+    """
+    if budget is None:
+        budget = _default_budget
+
+    if budget is None:
+        return nullcontext()
+
+    return budget.reserve(nbytes=nbytes)
@@ -0,0 +1,227 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple, Union, cast
+
+from simple_uu.decode import decode
+from simple_uu.encode import encode
+from simple_uu.types import BaseUUFile, UUDecodedFile, UUEncodedFile
+from simple_uu.utils import VARIANT_UU, load_file_object
+
+# Default budget for the bytes held by a cache
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Size of the blake2b digest used to address content
+_DIGEST_SIZE = 16
+
+class UUCache:
+    """
+    A thread-safe, content-addressed cache of encode/decode results, for workloads
+    that encode or decode identical payloads many times.
+
+    Results are keyed by a blake2b hash of the input along with every parameter that
+    affects the result, so a path and a bytes object with the same content share an
+    entry. Entries are evicted in least recently used order once the encoded/decoded
+    bytes held exceed the byte budget, or the number of entries exceeds its limit.
+    Results larger than the byte budget are returned without being cached.
+
+    Results are frozen before they are cached, so the same instance is returned to
+    every caller and can be shared safely between threads.
+
+    Args:
+        max_bytes (int): The budget for the encoded/decoded bytes held by the cache.
+        max_entries (int | None): The maximum number of entries. If not provided, the
+            number of entries is only limited by the byte budget.
+    """
+    def __init__(self, max_bytes: int = _DEFAULT_MAX_BYTES, max_entries: Optional[int] = None):
+        if max_bytes < 0 or (max_entries is not None and max_entries < 0):
+            raise ValueError('Cache limits must not be negative')
+
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple[Hashable, ...], BaseUUFile]' = OrderedDict()
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'entries={len(self)}, '
+            f'current_bytes={self._current_bytes}, '
+            f'max_bytes={self.max_bytes})'
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _lookup(self, key: Tuple[Hashable, ...]) -> Optional[BaseUUFile]:
+        """
+        A private method to find an entry, marking it as the most recently used.
+        """
+        with self._lock:
+            cached_file = self._entries.get(key)
+            if cached_file is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+
+            return cached_file
+
+    def _store(self, key: Tuple[Hashable, ...], uu_file: BaseUUFile) -> BaseUUFile:
+        """
+        A private method to freeze and store a result, evicting the least recently used
+        entries to stay within the limits. If another thread stored the same result
+        first, that result is returned instead.
+        """
+        uu_file.freeze()
+        size = len(uu_file.uu_bytes)
+        if size > self.max_bytes:
+            return uu_file
+
+        with self._lock:
+            cached_file = self._entries.get(key)
+            if cached_file is not None:
+                return cached_file
+
+            self._entries[key] = uu_file
+            self._current_bytes += size
+
+            while self._entries and (
+                self._current_bytes > self.max_bytes or
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+            ):
+                _, evicted_file = self._entries.popitem(last=False)
+                self._current_bytes -= len(evicted_file.uu_bytes)
+                self._evictions += 1
+
+        return uu_file
+
+    def decode(
+        self,
+        file_object: Union[str, Path, bytes, bytearray],
+        encoding_validation: bool = True,
+        strict: bool = True
+    ) -> UUDecodedFile:
+        """
+        Decode a file from a uuencoded format, returning a cached result if the same
+        content has already been decoded with the same parameters.
+
+        Args:
+            file_object (str | Path | bytes | bytearray): A file object is either a path
+                to a file, bytes or bytearray object. All must contain uuencoded data.
+            encoding_validation (bool): Boolean indicating whether to run encoding validation.
+            strict (bool): Boolean indicating whether a malformed line raises an error.
+
+        Returns:
+            UUDecodedFile: A frozen UUDecodedFile instance providing the decoded data.
+        """
+        content: bytes = load_file_object(file_object=file_object)
+        key = (
+            'decode',
+            hashlib.blake2b(content, digest_size=_DIGEST_SIZE).digest(),
+            encoding_validation,
+            strict
+        )
+
+        cached_file = self._lookup(key=key)
+        if cached_file is None:
+            cached_file = self._store(
+                key=key,
+                uu_file=decode(
+                    file_object=content, encoding_validation=encoding_validation, strict=strict
+                )
+            )
+
+        return cast(UUDecodedFile, cached_file)
+
+    def encode(
+        self,
+        file_object: Union[str, Path, bytes, bytearray],
+        filename: str,
+        octal_permission: Optional[Union[str, int]] = None,
+        extension: Optional[str] = None,
+        encoding_validation: bool = True,
+        binary_validation: bool = True,
+        variant: str = VARIANT_UU
+    ) -> UUEncodedFile:
+        """
+        Encode binary data into a uuencoded format, returning a cached result if the
+        same content has already been encoded with the same parameters.
+
+        Args:
+            file_object (str | Path | bytes | bytearray): A file object is either a path
+                to a file, bytes object or bytearray object. All must contain binary data.
+            filename (str): The name of the file being encoded.
+            octal_permission (str | int | None): An octal permission as a string or integer.
+            extension (str | None): An extension for the file being encoded.
+            encoding_validation (bool): Boolean indicating whether to run encoding validation.
+            binary_validation (bool): Boolean indicating whether to run binary validation.
+            variant (str): The variant to encode with, either 'uu' or 'base64'.
+
+        Returns:
+            UUEncodedFile: A frozen UUEncodedFile instance providing the encoded data.
+        """
+        content: bytes = load_file_object(file_object=file_object)
+        key = (
+            'encode',
+            hashlib.blake2b(content, digest_size=_DIGEST_SIZE).digest(),
+            filename,
+            octal_permission,
+            extension,
+            encoding_validation,
+            binary_validation,
+            variant
+        )
+
+        cached_file = self._lookup(key=key)
+        if cached_file is None:
+            cached_file = self._store(
+                key=key,
+                uu_file=encode(
+                    file_object=content,
+                    filename=filename,
+                    octal_permission=octal_permission,
+                    extension=extension,
+                    encoding_validation=encoding_validation,
+                    binary_validation=binary_validation,
+                    variant=variant
+                )
+            )
+
+        return cast(UUEncodedFile, cached_file)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Export the hit/miss statistics and usage of the cache as a dictionary.
+
+        Returns:
+            Dict[str, Any]: A dictionary representation of the statistics.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'entries': len(self._entries),
+                'current_bytes': self._current_bytes,
+                'max_bytes': self.max_bytes
+            }
+
+    def clear(self) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = self._misses = self._evictions = 0
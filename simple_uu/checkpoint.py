@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, NamedTuple, Tuple, Union
+
+# Version of the persisted checkpoint format
+_CHECKPOINT_VERSION = 1
+
+# Number of bytes read at a time when validating partial output
+_VALIDATION_CHUNK_LENGTH = 1024 * 1024
+
+class UUCheckpoint(NamedTuple):
+    """
+    Progress of an interrupted decode, recorded at a line boundary of the input.
+
+    Args:
+        header (bytes): The header line of the uuencoded data.
+        part_name (str): The name of the file holding partial output within the directory.
+        input_offset (int): The offset within the input just after the last decoded line.
+        output_offset (int): The number of decoded bytes written to the partial output.
+        line_number (int): The number of lines read from the input, including the header.
+        sha256 (str): The sha256 digest of the partial output up to the output offset.
+    """
+    header: bytes
+    part_name: str
+    input_offset: int
+    output_offset: int
+    line_number: int
+    sha256: str
+
+
+def checkpoint_names(header_line: bytes) -> Tuple[str, str]:
+    """
+    Deterministic names of the partial output and checkpoint files for uuencoded data,
+    derived from its header line so that an interrupted decode can be found again.
+
+    Args:
+        header_line (bytes): The header line of the uuencoded data.
+
+    Returns:
+        Tuple[str, str]: A tuple containing the partial output and checkpoint filenames.
+    """
+    key = hashlib.sha256(header_line).hexdigest()[:16]
+    return f'.simple-uu-{key}.part', f'.simple-uu-{key}.checkpoint'
+
+
+def save_checkpoint(path: Union[str, Path], checkpoint: UUCheckpoint) -> None:
+    """
+    Atomically persist a checkpoint to a path as JSON, so an interruption while
+    saving leaves the previous checkpoint in place.
+
+    Args:
+        path (str | Path): A path to the checkpoint file as a string or Path object.
+        checkpoint (UUCheckpoint): The checkpoint to persist.
+    """
+    path = Path(path)
+    checkpoint_data: Dict[str, Any] = {
+        'version': _CHECKPOINT_VERSION,
+        **checkpoint._asdict(),
+        'header': checkpoint.header.decode('latin-1')
+    }
+
+    temp_path = path.with_name(f'{path.name}.tmp')
+    temp_path.write_text(json.dumps(checkpoint_data))
+    os.replace(temp_path, path)
+
+
+def load_checkpoint(path: Union[str, Path]) -> UUCheckpoint:
+    """
+    Load a checkpoint persisted with save_checkpoint.
+
+    Args:
+        path (str | Path): A path to the checkpoint file as a string or Path object.
+
+    Returns:
+        UUCheckpoint: A UUCheckpoint instance.
+    """
+    checkpoint_data: Dict[str, Any] = json.loads(Path(path).read_text())
+    if checkpoint_data.pop('version', None) != _CHECKPOINT_VERSION:
+        raise ValueError('Unsupported checkpoint version')
+
+    checkpoint_data['header'] = checkpoint_data['header'].encode('latin-1')
+
+    # The partial output must be the one named after the header, within the directory
+    part_name, _ = checkpoint_names(header_line=checkpoint_data['header'])
+    if checkpoint_data.get('part_name') != part_name:
+        raise ValueError('Checkpoint does not name the partial output of its header')
+
+    return UUCheckpoint(**checkpoint_data)
+
+
+def iter_partial_output(path: Union[str, Path], output_offset: int) -> Iterator[bytes]:
+    """
+    Read the partial output of an interrupted decode in chunks, up to the output offset
+    of its checkpoint. Anything written after the checkpoint was saved is not read.
+
+    Args:
+        path (str | Path): A path to the partial output as a string or Path object.
+        output_offset (int): The number of decoded bytes recorded by the checkpoint.
+
+    Yields:
+        bytes: Chunks of the partial output, in order.
+    """
+    if not os.path.isfile(path) or os.path.getsize(path) < output_offset:
+        raise ValueError('Partial output is missing or shorter than checkpoint')
+
+    remaining = output_offset
+    with open(path, 'rb') as partial_file:
+        while remaining:
+            chunk = partial_file.read(min(remaining, _VALIDATION_CHUNK_LENGTH))
+            if not chunk:
+                raise ValueError('Partial output is missing or shorter than checkpoint')
+
+            remaining -= len(chunk)
+            yield chunk
@@ -0,0 +1,699 @@
+import argparse
+import glob
+import json
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from mimetypes import types_map
+from pathlib import Path
+from time import perf_counter
+from typing import (Any, BinaryIO, Callable, Dict, Iterable, Iterator, List,
+                    NamedTuple, Optional, Sequence, TextIO)
+
+from simple_uu.bench import DEFAULT_TUNING_SIZE, calibrate, parse_size
+from simple_uu.compression import (COMPRESSION_AUTO, COMPRESSION_SUFFIXES,
+                                   open_compressed, open_decompressed)
+from simple_uu.decode import _decode_to_sink, decode_to_file
+from simple_uu.encode import (_encode_to_sink, _file_extension,
+                              _permissions_mode, encode_to_file)
+from simple_uu.inspection import inspect
+from simple_uu.logger import LIBRARY_LOGGING, set_logging_mode
+from simple_uu.serve import UNIX_SOCKETS_SUPPORTED, UUServer
+from simple_uu.stats import UUStats
+from simple_uu.tuning import save_profile
+from simple_uu.utils import VARIANT_BASE64, VARIANT_UU
+
+COMMAND_ENCODE = 'encode'
+COMMAND_DECODE = 'decode'
+COMMAND_WATCH = 'watch'
+COMMAND_SERVE = 'serve'
+COMMAND_TUNE = 'tune'
+
+# Path given in place of input files to stream from stdin to stdout
+STDIN_PATH = '-'
+
+# Characters that mark a path as a glob pattern
+_GLOB_CHARACTERS = frozenset('*?[')
+
+# Prefix of temporary files left by interrupted writes, which are never processed
+_PARTIAL_PREFIX = '.simple-uu-'
+
+_COMPRESSION_CHOICES = sorted(COMPRESSION_SUFFIXES)
+
+class FileResult(NamedTuple):
+    """
+    The outcome of processing a single file from the command line.
+
+    Args:
+        path (str): The path of the input file.
+        output (str | None): The path of the output file, if processing succeeded.
+        bytes_in (int): The size of the input file in bytes.
+        bytes_out (int): The size of the output file in bytes.
+        error (str | None): A description of the error, if processing failed.
+    """
+    path: str
+    output: Optional[str]
+    bytes_in: int
+    bytes_out: int
+    error: Optional[str]
+
+
+def expand_paths(paths: Iterable[str], recursive: bool = False) -> List[Path]:
+    """
+    Expand files, directories and glob patterns into a list of files. Directories
+    contribute the files directly inside them, or every file below them if recursive.
+    Each file is only included once, in the order it was first found.
+
+    Args:
+        paths (Iterable[str]): Paths to files or directories, or glob patterns.
+        recursive (bool): Boolean indicating whether to include files in subdirectories.
+
+    Returns:
+        List[Path]: The files found.
+    """
+    def _expand(path: str) -> Iterator[Path]:
+        if _GLOB_CHARACTERS.intersection(path):
+            for match in sorted(glob.glob(path, recursive=True)):
+                yield from _expand(match)
+        elif os.path.isdir(path):
+            pattern = '**/*' if recursive else '*'
+            yield from sorted(child for child in Path(path).glob(pattern) if child.is_file())
+        else:
+            yield Path(path)
+
+    files: Dict[Path, None] = dict()
+    for path in paths:
+        for file in _expand(path=path):
+            if not file.name.startswith(_PARTIAL_PREFIX):
+                files.setdefault(file, None)
+
+    return list(files)
+
+
+def _encoded_filename(path: Path) -> str:
+    """
+    A private function to derive the name of an encoded file from its input path,
+    dropping the file extension along with any compression suffix.
+    """
+    if path.suffix in COMPRESSION_SUFFIXES.values():
+        path = path.with_suffix('')
+
+    return path.stem
+
+
+def _input_extension(path: Path) -> Optional[str]:
+    """
+    A private function to use the extension of an input file as a hint for encoding,
+    as long as it is a known extension.
+    """
+    if path.suffix in COMPRESSION_SUFFIXES.values():
+        path = path.with_suffix('')
+
+    return path.suffix.lstrip('.') if path.suffix in types_map else None
+
+
+def _output_path(
+    command: str, path: Path, output_dir: Optional[Path], options: Dict[str, Any]
+) -> Optional[Path]:
+    """
+    A private function to predict the path a file is written to, using the header of
+    uuencoded data when decoding. Returns None if the path cannot be known in advance.
+    """
+    directory = path.parent if output_dir is None else output_dir
+    compression = options.get('compression')
+    compression_suffix = '' if compression is None else COMPRESSION_SUFFIXES[compression]
+
+    if command == COMMAND_ENCODE:
+        filename = '_'.join(_encoded_filename(path=path).split())
+        return directory / f'{filename}.txt{compression_suffix}'
+
+    try:
+        inspection = inspect(
+            file_object=path, compression=options.get('source_compression')
+        )
+    except Exception:
+        return None
+
+    # Without an extension in the header, it is only known once the data is decoded
+    if inspection.filename is None or inspection.file_extension is None:
+        return None
+
+    return directory / f'{inspection.filename}.{inspection.file_extension}{compression_suffix}'
+
+
+def _find_outputs(
+    command: str,
+    paths: Sequence[Path],
+    output_dir: Optional[Path],
+    options: Dict[str, Any],
+    named_paths: Iterable[Path] = ()
+) -> Dict[Path, Path]:
+    """
+    A private function to find files that another input is written to, which are the
+    outputs of an earlier run over the same files. Files named explicitly are always
+    processed. Returns a dictionary of each such file and the input written to it.
+    """
+    named = {path.resolve() for path in named_paths}
+
+    # A file written to itself is kept, so that replacing it is refused without force
+    outputs: Dict[Path, Path] = dict()
+    for path in paths:
+        output_path = _output_path(
+            command=command, path=path, output_dir=output_dir, options=options
+        )
+        if output_path is not None and output_path.resolve() != path.resolve():
+            outputs.setdefault(output_path.resolve(), path)
+
+    return {
+        path: outputs[path.resolve()] for path in paths
+        if path.resolve() in outputs and path.resolve() not in named
+    }
+
+
+def process_file(
+    command: str, path: Path, output_dir: Optional[Path], options: Dict[str, Any]
+) -> FileResult:
+    """
+    Encode or decode a single file into a directory, capturing any error rather than
+    raising it so that the remaining files can be processed.
+
+    Args:
+        command (str): The command to run, either 'encode' or 'decode'.
+        path (Path): The path of the input file.
+        output_dir (Path | None): The directory to write to, defaults to the directory
+            of the input file.
+        options (Dict[str, Any]): Keyword arguments passed on to encode_to_file or
+            decode_to_file.
+
+    Returns:
+        FileResult: The outcome of processing the file.
+    """
+    directory = path.parent if output_dir is None else output_dir
+    try:
+        bytes_in = path.stat().st_size
+        if command == COMMAND_ENCODE:
+            extension = options.get('extension') or _input_extension(path=path)
+            written_file = encode_to_file(
+                file_object=path,
+                directory=directory,
+                filename=_encoded_filename(path=path),
+                **{**options, 'extension': extension}
+            )
+        else:
+            written_file = decode_to_file(file_object=path, directory=directory, **options)
+    except Exception as exc_info:
+        return FileResult(
+            path=str(path),
+            output=None,
+            bytes_in=0,
+            bytes_out=0,
+            error=f'{type(exc_info).__name__}: {exc_info}'
+        )
+
+    return FileResult(
+        path=str(path),
+        output=str(written_file.path),
+        bytes_in=bytes_in,
+        bytes_out=written_file.path.stat().st_size,
+        error=None
+    )
+
+
+def format_summary(results: Sequence[FileResult], elapsed: float, skipped: int = 0) -> str:
+    """
+    Format a summary of the files processed and the throughput achieved.
+
+    Args:
+        results (Sequence[FileResult]): The outcome of each file.
+        elapsed (float): The wall clock time taken, in seconds.
+        skipped (int): The number of files that were not processed.
+
+    Returns:
+        str: A single line summary.
+    """
+    failed = sum(result.error is not None for result in results)
+    megabytes_in = sum(result.bytes_in for result in results) / 1024 ** 2
+    megabytes_out = sum(result.bytes_out for result in results) / 1024 ** 2
+    throughput = megabytes_in / elapsed if elapsed else 0.0
+
+    skipped_summary = f'{skipped} skipped, ' if skipped else ''
+    return (
+        f'{len(results) - failed} succeeded, {failed} failed, {skipped_summary}'
+        f'{megabytes_in:.2f} MB in, {megabytes_out:.2f} MB out '
+        f'in {elapsed:.2f}s ({throughput:.2f} MB/s)'
+    )
+
+
+def _file_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    A private function to collect the keyword arguments for encode_to_file or
+    decode_to_file from parsed arguments.
+    """
+    options: Dict[str, Any] = {
+        'encoding_validation': not args.no_validation,
+        'source_compression': args.decompress,
+        'compression': args.compress,
+        'overwrite': args.force
+    }
+    if args.command == COMMAND_ENCODE:
+        options.update(
+            octal_permission=args.mode,
+            extension=args.extension,
+            binary_validation=not args.no_validation,
+            variant=args.variant
+        )
+    else:
+        options.update(strict=not args.lenient)
+
+    return options
+
+
+def _run_files(args: argparse.Namespace, stderr: TextIO) -> int:
+    """
+    A private function to process files given on the command line with a pool of
+    worker processes, reporting each failure and a summary.
+    """
+    paths = expand_paths(paths=args.paths, recursive=args.recursive)
+    if not paths:
+        print('error: no input files matched', file=stderr)
+        return 2
+
+    output_dir: Optional[Path] = None
+    if args.output_dir is not None:
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Outputs of an earlier run found in directories or by glob patterns are skipped
+    options = _file_options(args=args)
+    skipped_paths = _find_outputs(
+        command=args.command,
+        paths=paths,
+        output_dir=output_dir,
+        options=options,
+        named_paths=[
+            Path(path) for path in args.paths
+            if not _GLOB_CHARACTERS.intersection(path) and not os.path.isdir(path)
+        ]
+    )
+    for skipped_path, input_path in skipped_paths.items():
+        print(f'skipped: {skipped_path}: output of {input_path}', file=stderr)
+    paths = [path for path in paths if path not in skipped_paths]
+
+    start = perf_counter()
+    results: List[FileResult]
+    if args.jobs <= 1 or len(paths) == 1:
+        results = [
+            process_file(
+                command=args.command, path=path, output_dir=output_dir, options=options
+            )
+            for path in paths
+        ]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=args.jobs, initializer=set_logging_mode, initargs=(LIBRARY_LOGGING,)
+        ) as executor:
+            results = list(
+                executor.map(
+                    process_file,
+                    [args.command] * len(paths),
+                    paths,
+                    [output_dir] * len(paths),
+                    [options] * len(paths)
+                )
+            )
+    elapsed = perf_counter() - start
+
+    for result in results:
+        if result.error is not None:
+            print(f'error: {result.path}: {result.error}', file=stderr)
+
+    print(
+        format_summary(results=results, elapsed=elapsed, skipped=len(skipped_paths)),
+        file=stderr
+    )
+    return 1 if any(result.error is not None for result in results) else 0
+
+
+def _run_stream(
+    args: argparse.Namespace, stdin: BinaryIO, stdout: BinaryIO, stderr: TextIO
+) -> int:
+    """
+    A private function to stream stdin to stdout, holding a single chunk or line in
+    memory at a time.
+    """
+    stats = UUStats(operation=args.command)
+    start = perf_counter()
+
+    source = stdin
+    if args.decompress is not None:
+        source = open_decompressed(binary_stream=stdin, compression=args.decompress)
+
+    sink = stdout
+    if args.compress is not None:
+        sink = open_compressed(binary_stream=stdout, compression=args.compress)
+
+    try:
+        if args.command == COMMAND_ENCODE:
+            _, _, stats.bytes_out = _encode_to_sink(
+                binary_stream=source,
+                sink=sink,
+                filename='_'.join(args.name.split()),
+                permissions_mode=_permissions_mode(octal_permission=args.mode),
+                file_extension=_file_extension(extension=args.extension),
+                encoding_validation=not args.no_validation,
+                binary_validation=not args.no_validation,
+                digest_set=None,
+                stats=stats,
+                variant=args.variant
+            )
+        else:
+            _decode_to_sink(
+                binary_stream=source,
+                sink=sink,
+                encoding_validation=not args.no_validation,
+                strict=not args.lenient,
+                stats=stats
+            )
+    except Exception as exc_info:
+        print(f'error: {STDIN_PATH}: {type(exc_info).__name__}: {exc_info}', file=stderr)
+        return 1
+    finally:
+        # Closing the compressed stream finishes the compressed data, not stdout
+        if sink is not stdout:
+            sink.close()
+        stdout.flush()
+
+    result = FileResult(
+        path=STDIN_PATH,
+        output=STDIN_PATH,
+        bytes_in=stats.bytes_in,
+        bytes_out=stats.bytes_out,
+        error=None
+    )
+    print(format_summary(results=[result], elapsed=perf_counter() - start), file=stderr)
+    return 0
+
+
+def _run_codec(args: argparse.Namespace) -> int:
+    """
+    A private function to run the encode or decode command.
+    """
+    if not args.paths or args.paths == [STDIN_PATH]:
+        return _run_stream(
+            args=args, stdin=sys.stdin.buffer, stdout=sys.stdout.buffer, stderr=sys.stderr
+        )
+    else:
+        return _run_files(args=args, stderr=sys.stderr)
+
+
+def _run_watch(args: argparse.Namespace) -> int:
+    """
+    A private function to run the watch command until it is interrupted, reporting the
+    counters of the watcher at a regular interval.
+    """
+    # The watch module builds on process_file, so it is imported when it is used
+    from simple_uu.watch import FolderWatcher
+
+    watcher = FolderWatcher(
+        directory=args.directory,
+        output_dir=args.output_dir,
+        workers=args.jobs,
+        poll_interval=args.interval,
+        pattern=args.pattern,
+        processed_dir=args.processed_dir,
+        failed_dir=args.failed_dir,
+        options={
+            'encoding_validation': not args.no_validation,
+            'strict': not args.lenient,
+            'source_compression': args.decompress,
+            'compression': args.compress,
+            'overwrite': args.force
+        }
+    )
+
+    # Interrupting the watcher lets the files already queued finish before it exits
+    previous_handlers = {
+        signal_number: signal.signal(signal_number, lambda *_: watcher.stop())
+        for signal_number in (signal.SIGINT, signal.SIGTERM)
+    }
+
+    stopped = threading.Event()
+
+    def _report() -> None:
+        while not stopped.wait(args.report_interval):
+            counters = watcher.counters.as_dict()
+            print(
+                f"queue depth {counters['queue_depth']}, "
+                f"{counters['processed']} processed, {counters['failed']} failed, "
+                f"{counters['files_per_second']:.2f} files/s "
+                f"({counters['throughput_mb_s']:.2f} MB/s)",
+                file=sys.stderr
+            )
+
+    reporter = threading.Thread(target=_report, daemon=True)
+    reporter.start()
+    try:
+        watcher.run()
+    finally:
+        stopped.set()
+        reporter.join()
+        for signal_number, previous_handler in previous_handlers.items():
+            signal.signal(signal_number, previous_handler)
+
+    counters = watcher.counters.as_dict()
+    print(
+        f"{counters['processed']} processed, {counters['failed']} failed "
+        f"in {counters['elapsed']:.2f}s",
+        file=sys.stderr
+    )
+    return 0
+
+
+def _run_serve(args: argparse.Namespace) -> int:
+    """
+    A private function to run the serve command until it is interrupted.
+    """
+    if not UNIX_SOCKETS_SUPPORTED:
+        print('error: Unix domain sockets are not supported on this platform', file=sys.stderr)
+        return 2
+
+    server = UUServer(socket_path=args.socket, workers=args.jobs, backlog=args.backlog)
+
+    previous_handlers = {
+        signal_number: signal.signal(signal_number, lambda *_: server.stop())
+        for signal_number in (signal.SIGINT, signal.SIGTERM)
+    }
+    try:
+        server.start()
+        print(
+            f'serving on {server.socket_path} with {server.workers} workers', file=sys.stderr
+        )
+        server.serve_forever()
+    finally:
+        for signal_number, previous_handler in previous_handlers.items():
+            signal.signal(signal_number, previous_handler)
+
+    return 0
+
+
+def _run_tune(args: argparse.Namespace) -> int:
+    """
+    A private function to run the tune command, calibrating and saving a profile.
+    """
+    profile, results = calibrate(
+        directory=args.directory,
+        size=parse_size(size=args.size),
+        repeat=args.repeat,
+        max_threads=args.max_threads
+    )
+    for result in results:
+        print(f"{result['name']}: {result['throughput_mb_s']:.2f} MB/s", file=sys.stderr)
+
+    print(json.dumps(profile._asdict(), indent=2))
+    if not args.dry_run:
+        path = save_profile(profile=profile, path=args.profile)
+        print(f'profile written to {path}', file=sys.stderr)
+
+    return 0
+
+
+def _add_codec_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    A private function to add the arguments shared by the encode and decode commands.
+    """
+    parser.add_argument(
+        'paths',
+        nargs='*',
+        help="Files, directories or glob patterns, or '-' to stream stdin to stdout"
+    )
+    parser.add_argument(
+        '-o', '--output-dir', help='Directory to write to, defaults to that of each input'
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1, help='Number of worker processes'
+    )
+    parser.add_argument(
+        '-r', '--recursive', action='store_true', help='Include files in subdirectories'
+    )
+    parser.add_argument(
+        '--no-validation', action='store_true', help='Skip encoding and binary validation'
+    )
+    parser.add_argument(
+        '--compress', choices=_COMPRESSION_CHOICES, help='Compress the output'
+    )
+    parser.add_argument(
+        '--force', action='store_true', help='Replace existing output files, even an input'
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the parser for the command line interface.
+
+    Returns:
+        argparse.ArgumentParser: The argument parser, with a subcommand for each command.
+    """
+    parser = argparse.ArgumentParser(
+        prog='simple-uu', description='Encode and decode files in uuencoded format.'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    encode_parser = subparsers.add_parser(COMMAND_ENCODE, help='Encode binary files')
+    _add_codec_arguments(parser=encode_parser)
+    encode_parser.add_argument('--mode', help='Permissions mode for the header, e.g. 644')
+    encode_parser.add_argument('--extension', help='File extension for the header')
+    encode_parser.add_argument(
+        '--name', default='stdin', help='Filename for the header when streaming stdin'
+    )
+    encode_parser.add_argument(
+        '--base64',
+        dest='variant',
+        action='store_const',
+        const=VARIANT_BASE64,
+        default=VARIANT_UU,
+        help='Encode with the begin-base64 variant, as uuencode -m does'
+    )
+    encode_parser.add_argument(
+        '--decompress',
+        choices=[COMPRESSION_AUTO, *_COMPRESSION_CHOICES],
+        help='Decompress the input before encoding it'
+    )
+    encode_parser.set_defaults(handler=_run_codec)
+
+    decode_parser = subparsers.add_parser(COMMAND_DECODE, help='Decode uuencoded files')
+    _add_codec_arguments(parser=decode_parser)
+    decode_parser.add_argument(
+        '--lenient', action='store_true', help='Repair malformed lines instead of failing'
+    )
+    decode_parser.add_argument(
+        '--decompress',
+        choices=[COMPRESSION_AUTO, *_COMPRESSION_CHOICES],
+        default=COMPRESSION_AUTO,
+        help='Compression of the input, detected by default'
+    )
+    decode_parser.set_defaults(handler=_run_codec)
+
+    watch_parser = subparsers.add_parser(
+        COMMAND_WATCH, help='Decode uuencoded files as they arrive in a directory'
+    )
+    watch_parser.add_argument('directory', help='Spool directory to watch')
+    watch_parser.add_argument(
+        '-o', '--output-dir', required=True, help='Directory to write decoded files to'
+    )
+    watch_parser.add_argument(
+        '-j', '--jobs', type=int, default=1, help='Number of worker processes'
+    )
+    watch_parser.add_argument(
+        '--interval', type=float, default=1.0, help='Seconds between polls of the directory'
+    )
+    watch_parser.add_argument(
+        '--pattern', default='*', help="Glob pattern filenames must match, e.g. '*.uue'"
+    )
+    watch_parser.add_argument(
+        '--processed-dir', help="Directory processed files are moved to, defaults to 'processed'"
+    )
+    watch_parser.add_argument(
+        '--failed-dir', help="Directory failed files are moved to, defaults to 'failed'"
+    )
+    watch_parser.add_argument(
+        '--report-interval', type=float, default=60.0, help='Seconds between counter reports'
+    )
+    watch_parser.add_argument(
+        '--no-validation', action='store_true', help='Skip encoding validation'
+    )
+    watch_parser.add_argument(
+        '--lenient', action='store_true', help='Repair malformed lines instead of failing'
+    )
+    watch_parser.add_argument(
+        '--decompress',
+        choices=[COMPRESSION_AUTO, *_COMPRESSION_CHOICES],
+        default=COMPRESSION_AUTO,
+        help='Compression of the input, detected by default'
+    )
+    watch_parser.add_argument(
+        '--compress', choices=_COMPRESSION_CHOICES, help='Compress the output'
+    )
+    watch_parser.add_argument(
+        '--force', action='store_true', help='Replace existing output files'
+    )
+    watch_parser.set_defaults(handler=_run_watch)
+
+    serve_parser = subparsers.add_parser(
+        COMMAND_SERVE, help='Serve encode and decode requests over a Unix domain socket'
+    )
+    serve_parser.add_argument('--socket', required=True, help='Path of the Unix domain socket')
+    serve_parser.add_argument(
+        '-j', '--jobs', type=int, help='Number of worker processes, defaults to the CPU count'
+    )
+    serve_parser.add_argument(
+        '--backlog', type=int, default=128, help='Number of pending connections to queue'
+    )
+    serve_parser.set_defaults(handler=_run_serve)
+
+    tune_parser = subparsers.add_parser(
+        COMMAND_TUNE, help='Calibrate chunk sizes and worker counts for this host'
+    )
+    tune_parser.add_argument(
+        '--directory', help='Directory on the storage to calibrate, defaults to the temporary directory'
+    )
+    tune_parser.add_argument(
+        '--size', default=DEFAULT_TUNING_SIZE, help='Size of the calibration payload, e.g. 4MB'
+    )
+    tune_parser.add_argument(
+        '--repeat', type=int, default=3, help='Number of timed runs for each setting'
+    )
+    tune_parser.add_argument(
+        '--max-threads', type=int, help='Maximum number of threads, defaults to the CPU count'
+    )
+    tune_parser.add_argument(
+        '--profile', help='Path to write the profile to, defaults to the user cache directory'
+    )
+    tune_parser.add_argument(
+        '--dry-run', action='store_true', help='Print the profile without saving it'
+    )
+    tune_parser.set_defaults(handler=_run_tune)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point for the command line interface.
+
+    Args:
+        argv (Sequence[str] | None): Command line arguments, defaults to sys.argv.
+
+    Returns:
+        int: An exit code, 0 on success, 1 if any file failed and 2 on usage errors.
+    """
+    args = build_parser().parse_args(argv)
+    set_logging_mode(mode=LIBRARY_LOGGING)
+
+    handler: Callable[[argparse.Namespace], int] = args.handler
+    return handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+import bz2
+import gzip
+import io
+import lzma
+from typing import BinaryIO, Dict, Optional, cast
+
+# Compression formats supported for sources and sinks
+COMPRESSION_AUTO = 'auto'
+COMPRESSION_GZIP = 'gzip'
+COMPRESSION_BZ2 = 'bz2'
+COMPRESSION_XZ = 'xz'
+COMPRESSION_ZSTD = 'zstd'
+
+_COMPRESSIONS = {COMPRESSION_GZIP, COMPRESSION_BZ2, COMPRESSION_XZ, COMPRESSION_ZSTD}
+
+# Suffixes appended to the names of compressed output files
+COMPRESSION_SUFFIXES: Dict[str, str] = {
+    COMPRESSION_GZIP: '.gz',
+    COMPRESSION_BZ2: '.bz2',
+    COMPRESSION_XZ: '.xz',
+    COMPRESSION_ZSTD: '.zst'
+}
+
+# Magic bytes at the start of each compressed format
+_MAGIC_NUMBERS: Dict[bytes, str] = {
+    b'\x1f\x8b': COMPRESSION_GZIP,
+    b'BZh': COMPRESSION_BZ2,
+    b'\xfd7zXZ\x00': COMPRESSION_XZ,
+    b'\x28\xb5\x2f\xfd': COMPRESSION_ZSTD
+}
+
+_MAGIC_LENGTH = max(len(magic_number) for magic_number in _MAGIC_NUMBERS)
+
+def _validate_compression(compression: str) -> None:
+    """
+    A private function to validate the name of a compression format.
+    """
+    if compression not in _COMPRESSIONS:
+        raise ValueError("Compression must be one of 'gzip', 'bz2', 'xz' or 'zstd'")
+
+
+def _open_zstd(binary_stream: BinaryIO, mode: str) -> BinaryIO:
+    """
+    A private function to open a zstd stream, using the standard library module where
+    available and otherwise the optional zstandard package.
+    """
+    # Only import zstd when it is actually used, as it may not be installed
+    try:
+        import compression.zstd as zstd  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        pass
+    else:
+        return cast(BinaryIO, zstd.ZstdFile(binary_stream, mode=mode))
+
+    try:
+        import zstandard  # type: ignore[import-not-found, unused-ignore]
+    except ImportError:
+        raise ImportError('zstd compression requires the zstandard package to be installed')
+
+    if mode == 'rb':
+        return cast(
+            BinaryIO,
+            io.BufferedReader(
+                zstandard.ZstdDecompressor().stream_reader(binary_stream, closefd=False)
+            )
+        )
+    else:
+        return cast(
+            BinaryIO, zstandard.ZstdCompressor().stream_writer(binary_stream, closefd=False)
+        )
+
+
+def detect_compression(binary_stream: BinaryIO) -> Optional[str]:
+    """
+    Detect the compression format of a binary stream from its magic bytes, without
+    consuming any data. Streams that can neither be peeked nor seeked are assumed to
+    be uncompressed.
+
+    Args:
+        binary_stream (BinaryIO): A binary stream positioned at the start of the data.
+
+    Returns:
+        str | None: The compression format, or None if the data is not compressed.
+    """
+    signature: bytes
+    if hasattr(binary_stream, 'peek'):
+        signature = binary_stream.peek(_MAGIC_LENGTH)[:_MAGIC_LENGTH]
+    elif binary_stream.seekable():
+        position = binary_stream.tell()
+        signature = binary_stream.read(_MAGIC_LENGTH)
+        binary_stream.seek(position)
+    else:
+        return None
+
+    for magic_number, compression in _MAGIC_NUMBERS.items():
+        if signature.startswith(magic_number):
+            return compression
+
+    return None
+
+
+def open_decompressed(binary_stream: BinaryIO, compression: str) -> BinaryIO:
+    """
+    Wrap a compressed binary stream so that reading from it yields decompressed data,
+    decompressing chunk by chunk as data is read. Either the format is given, or 'auto'
+    detects it from magic bytes and returns uncompressed streams as is.
+
+    Args:
+        binary_stream (BinaryIO): A binary stream containing compressed data.
+        compression (str): The compression format, either 'auto', 'gzip', 'bz2',
+            'xz' or 'zstd'.
+
+    Returns:
+        BinaryIO: A binary stream of decompressed data.
+    """
+    if compression == COMPRESSION_AUTO:
+        detected_compression = detect_compression(binary_stream=binary_stream)
+        if detected_compression is None:
+            return binary_stream
+
+        compression = detected_compression
+
+    _validate_compression(compression=compression)
+
+    if compression == COMPRESSION_GZIP:
+        return cast(BinaryIO, gzip.GzipFile(fileobj=binary_stream, mode='rb'))
+    elif compression == COMPRESSION_BZ2:
+        return cast(BinaryIO, bz2.BZ2File(binary_stream, mode='rb'))
+    elif compression == COMPRESSION_XZ:
+        return cast(BinaryIO, lzma.LZMAFile(binary_stream, mode='rb'))
+    else:
+        return _open_zstd(binary_stream=binary_stream, mode='rb')
+
+
+def open_compressed(binary_stream: BinaryIO, compression: str) -> BinaryIO:
+    """
+    Wrap a binary stream so that data written to it is compressed chunk by chunk.
+    Closing the returned stream finishes the compressed data without closing the
+    underlying stream.
+
+    Args:
+        binary_stream (BinaryIO): A binary stream the compressed data is written to.
+        compression (str): The compression format, either 'gzip', 'bz2', 'xz' or 'zstd'.
+
+    Returns:
+        BinaryIO: A binary stream accepting uncompressed data.
+    """
+    _validate_compression(compression=compression)
+
+    if compression == COMPRESSION_GZIP:
+        return cast(BinaryIO, gzip.GzipFile(fileobj=binary_stream, mode='wb'))
+    elif compression == COMPRESSION_BZ2:
+        return cast(BinaryIO, bz2.BZ2File(binary_stream, mode='wb'))
+    elif compression == COMPRESSION_XZ:
+        return cast(BinaryIO, lzma.LZMAFile(binary_stream, mode='wb'))
+    else:
+        return _open_zstd(binary_stream=binary_stream, mode='wb')
@@ -1,26 +1,68 @@
 import binascii
 from binascii import Error
 from io import BytesIO
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Optional, Union
+from typing import (BinaryIO, Callable, Iterable, Iterator, List, Optional,
+                    Tuple, Union, cast)
 
 import charset_normalizer
-import filetype # type: ignore[import-untyped]
+import filetype  # type: ignore[import-untyped]
 from unix_perms import InvalidOctalError, from_octal_to_permissions_mode
 
+from simple_uu.budget import MemoryBudget, reservation
+from simple_uu.checkpoint import (UUCheckpoint, checkpoint_names,
+                                  iter_partial_output, load_checkpoint,
+                                  save_checkpoint)
+from simple_uu.compression import COMPRESSION_AUTO, COMPRESSION_SUFFIXES
+from simple_uu.digests import DigestSet
 from simple_uu.exceptions import (FileExtensionNotFoundError,
                                   InvalidPermissionsMode,
                                   InvalidUUDecodingError)
-from simple_uu.logger import set_up_logger
-from simple_uu.types import UUDecodedFile
-from simple_uu.utils import (construct_filename, decompose_filename,
-                             load_file_object, parse_header)
+from simple_uu.logger import RateLimitedWarning, set_up_logger
+from simple_uu.stats import UUStats
+from simple_uu.tuning import get_profile
+from simple_uu.types import (SHARED_MEMORY_HEADER,
+                             SHARED_MEMORY_METADATA_LENGTH, UUDecodedFile,
+                             UULineError, UUWrittenFile, _create_shared_memory)
+from simple_uu.utils import (BEGIN_CLAUSES, END_CLAUSES, FSYNC_NONE,
+                             VARIANT_BASE64, VARIANT_UU, WRITE_BUFFER_SIZE,
+                             AtomicFileWriter, construct_filename,
+                             decompose_filename, load_file_object,
+                             open_file_object, parse_header)
 
 logger = set_up_logger(__name__)
+extension_mismatch_warning = RateLimitedWarning(logger=logger)
 
 # Maximum line length, including the length character
 _MAX_LINE_LENGTH = 61
 
+# Number of decoded bytes retained for file type detection when streaming
+_SIGNATURE_LENGTH = 8192
+
+# Number of decoded bytes collected before they are digested or written, unless the
+# tuning profile sets another length
+_BLOCK_LENGTH = 64 * 1024
+
+# Characters allowed in a line of uuencoded data, ascii codes ranging from 32 to 96
+_VALID_CHARACTERS = bytes(range(32, 97))
+
+# Table replacing every invalid character with a character representing zero bits
+_REPAIR_TABLE = bytes(
+    character if character in _VALID_CHARACTERS else ord('`') for character in range(256)
+)
+
+# Characters of the base64 alphabet, including padding, and every other character
+_BASE64_CHARACTERS = (
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/='
+)
+_INVALID_BASE64_CHARACTERS = bytes(
+    character for character in range(256) if character not in _BASE64_CHARACTERS
+)
+
+# Variant of each begin clause accepted in a header
+_VARIANTS = {begin_clause: variant for variant, begin_clause in BEGIN_CLAUSES.items()}
+
 def _decode_from_charset_normalizer(content: bytes, encoding_validation: bool) -> BytesIO:
     """
     A private function to validate that a bytes object has an ascii encoding.
@@ -42,49 +84,29 @@ def _decode_from_charset_normalizer(content: bytes, encoding_validation: bool) -
     return BytesIO(initial_bytes=content)
 
 
-def decode(
-    file_object: Union[str, Path, bytes, bytearray],
-    encoding_validation: bool = True
-) -> UUDecodedFile:
+def _block_length() -> int:
     """
-    Decode a file from a uuencoded format.
-
-    Args:
-        file_object (str | Path | bytes | bytearray): A file object is either a path
-            to a file, bytes or bytearray object. All must contain uuencoded data.
-        encoding_validation (bool): Boolean indicating whether to run encoding validation.
-
-    Returns:
-        UUDecodedFile: A UUDecodedFile instance providing the decoded data along with
-            a number of attributes, properties, and methods.
+    A private function to get the number of bytes collected into a block, from the
+    tuning profile if it sets one.
     """
-    binary_data = bytearray()
-
-    # Load file object into a BytesIO instance
-    uu_encoded_buffer: BytesIO = _decode_from_charset_normalizer(
-        content=load_file_object(file_object=file_object),
-        encoding_validation=encoding_validation
-    )
-    buffer_length = len(uu_encoded_buffer.getvalue())
-
-    # In case there are any issues, any excess white space before the header is skipped
-    for line in uu_encoded_buffer:
-        header_line: bytes = line.strip(b'\n\r')
-
-        if header_line:
-            break
+    return get_profile().block_length or _BLOCK_LENGTH
 
-    if uu_encoded_buffer.tell() == buffer_length:
-        raise InvalidUUDecodingError("There is no content in file, nothing was decoded")
 
-    # Parse header to extract all three key items
-    # (begin clause, permissions mode, and file name)
-    begin, permissions_mode_uu, filename_uu = parse_header(header=header_line)
+class _LineCounts:
+    """
+    A private structure to collect the number of decoded and repaired lines.
+    """
+    def __init__(self) -> None:
+        self.line_count = 0
+        self.repaired_line_count = 0
+        self.line_errors: List[UULineError] = []
 
-    # The header must start with 'begin' in order to move on with decoding
-    if begin != b'begin':
-        raise InvalidUUDecodingError("Missing 'begin' section of header at start of file")
 
+def _parse_permissions_mode(permissions_mode_uu: Optional[bytes]) -> str:
+    """
+    A private function to convert the permissions mode from a uu header into a
+    Unix permissions mode.
+    """
     # Confirm the permissions mode included is valid
     try:
         # If no permissions was found in header, then set default
@@ -98,57 +120,358 @@ def decode(
         else:
             permissions_mode_uu_parsed = permissions_mode_uu.decode('ascii')
 
-        permissions_mode: str = from_octal_to_permissions_mode(octal=permissions_mode_uu_parsed)
+        return from_octal_to_permissions_mode(octal=permissions_mode_uu_parsed)
     except InvalidOctalError:
         raise InvalidPermissionsMode('Permissions mode included is invalid')
 
-    # Iterate through each line of buffer and decode using binascii
-    for line in uu_encoded_buffer:
-        # Perform removal of new line and carriage return characters from the end of each line
-        uuencoded_line: bytes = line.rstrip(b'\n\r')
 
-        if uuencoded_line and not uuencoded_line.startswith(b'end'):
-            line_length: int = len(uuencoded_line)
+def _parse_header_line(header_line: bytes) -> Tuple[str, str, Optional[bytes]]:
+    """
+    A private function to validate a header line and extract the variant, permissions
+    mode and file name. The variant is detected from the begin clause, which is either
+    'begin' for classic uu or 'begin-base64'. Returns a tuple containing all three.
+    """
+    # Parse header to extract all three key items
+    # (begin clause, permissions mode, and file name)
+    begin, permissions_mode_uu, filename_uu = parse_header(header=header_line)
+
+    # The header must start with 'begin' in order to move on with decoding
+    variant = _VARIANTS.get(begin) if begin is not None else None
+    if variant is None:
+        raise InvalidUUDecodingError("Missing 'begin' section of header at start of file")
+
+    return (
+        variant, _parse_permissions_mode(permissions_mode_uu=permissions_mode_uu), filename_uu
+    )
 
-            # Raise an error if the length of a line is larger than the maximum allowed
-            if line_length > _MAX_LINE_LENGTH:
-                raise InvalidUUDecodingError(
-                    f"Length of {line_length} is larger than the maximum allowed for a line of uuencoded data"
-                )
 
-            # Run decoding from binascii
-            decoded_output: bytes
-            try:
-                decoded_output = binascii.a2b_uu(uuencoded_line)
-            except Error:
+def _decode_lines(lines: Iterable[bytes], line_counts: _LineCounts) -> Iterator[bytes]:
+    """
+    A private generator to decode each line of uuencoded data using binascii.
+    Blank lines and 'end' lines are skipped.
+    """
+    line_count = 0
+    repaired_line_count = 0
+
+    try:
+        for line in lines:
+            # Perform removal of new line and carriage return characters from the end of each line
+            uuencoded_line: bytes = line.rstrip(b'\n\r')
+
+            if uuencoded_line and not uuencoded_line.startswith(b'end'):
+                line_count += 1
+                line_length: int = len(uuencoded_line)
+
+                # Raise an error if the length of a line is larger than the maximum allowed
+                if line_length > _MAX_LINE_LENGTH:
+                    raise InvalidUUDecodingError(
+                        f"Length of {line_length} is larger than the maximum allowed for a line of uuencoded data"
+                    )
+
+                # Run decoding from binascii
+                decoded_output: bytes
                 try:
-                    # Taken from uu standard library
-                    nbytes: int = (((uuencoded_line[0] - 32) & 63) * 4 + 5) // 3
-                    decoded_output = binascii.a2b_uu(uuencoded_line[:nbytes])
-                except Error as exc_info:
-                    if str(exc_info) == 'Illegal char':
-                        raise InvalidUUDecodingError(
-                            "Invalid ascii character, characters should have ascii codes ranging from 32 to 96"
-                        )
-                    else:
-                        raise Error(exc_info)
-            binary_data.extend(decoded_output)
-
-    # Raise error if there was nothing was decoded
-    if not binary_data:
-        raise InvalidUUDecodingError(
-            "Apart from header there is no content in file, nothing was decoded"
+                    decoded_output = binascii.a2b_uu(uuencoded_line)
+                except Error:
+                    try:
+                        # Taken from uu standard library
+                        nbytes: int = (((uuencoded_line[0] - 32) & 63) * 4 + 5) // 3
+                        decoded_output = binascii.a2b_uu(uuencoded_line[:nbytes])
+                        repaired_line_count += 1
+                    except Error as exc_info:
+                        if str(exc_info) == 'Illegal char':
+                            raise InvalidUUDecodingError(
+                                "Invalid ascii character, characters should have ascii codes ranging from 32 to 96"
+                            )
+                        else:
+                            raise Error(exc_info)
+                yield decoded_output
+    finally:
+        line_counts.line_count = line_count
+        line_counts.repaired_line_count = repaired_line_count
+
+
+def _decode_lines_lenient(
+    lines: Iterable[bytes], line_counts: _LineCounts, first_line_number: int
+) -> Iterator[bytes]:
+    """
+    A private generator to decode each line of uuencoded data, repairing malformed
+    lines rather than raising an error. Each line is validated up front so that no
+    exceptions are raised while decoding. Lines that are too long or have trailing
+    characters are truncated to the length given by their length character, and
+    illegal characters are replaced so the number of decoded bytes is preserved.
+    Each repair is recorded along with its line number.
+    """
+    line_count = 0
+    line_errors: List[UULineError] = []
+
+    try:
+        for line_number, line in enumerate(lines, start=first_line_number):
+            # Perform removal of new line and carriage return characters from the end of each line
+            uuencoded_line: bytes = line.rstrip(b'\n\r')
+
+            if uuencoded_line and not uuencoded_line.startswith(b'end'):
+                line_count += 1
+
+                # Number of characters needed for the length given by the length character
+                nbytes: int = (((uuencoded_line[0] - 32) & 63) * 4 + 5) // 3
+                if len(uuencoded_line) > nbytes:
+                    if len(uuencoded_line) > _MAX_LINE_LENGTH:
+                        line_errors.append(UULineError(line_number, 'line too long'))
+                    elif uuencoded_line[nbytes:].strip(b' `'):
+                        line_errors.append(UULineError(line_number, 'trailing characters'))
+
+                    uuencoded_line = uuencoded_line[:nbytes]
+
+                if uuencoded_line.translate(None, _VALID_CHARACTERS):
+                    line_errors.append(UULineError(line_number, 'illegal characters'))
+                    uuencoded_line = uuencoded_line.translate(_REPAIR_TABLE)
+
+                yield binascii.a2b_uu(uuencoded_line)
+    finally:
+        line_counts.line_count = line_count
+        line_counts.repaired_line_count = len({error.line_number for error in line_errors})
+        line_counts.line_errors = line_errors
+
+
+def _decode_base64_block(block: Union[bytes, bytearray], strict: bool) -> bytes:
+    """
+    A private function to decode a block of base64 data using binascii. If strict,
+    characters outside of the alphabet and padding anywhere but the end of the block
+    raise an error, as the strict mode of binascii is not available before Python 3.11.
+    """
+    if strict:
+        if block.translate(None, _BASE64_CHARACTERS):
+            raise InvalidUUDecodingError("Invalid base64 data, only base64 data is allowed")
+
+        unpadded_block = block.rstrip(b'=')
+        if b'=' in unpadded_block or len(block) - len(unpadded_block) > 2:
+            raise InvalidUUDecodingError("Invalid base64 data, padding is misplaced")
+
+    try:
+        return binascii.a2b_base64(block)
+    except Error as exc_info:
+        raise InvalidUUDecodingError(f"Invalid base64 data, {exc_info}")
+
+
+def _decode_lines_base64(
+    lines: Iterable[bytes], line_counts: _LineCounts, strict: bool, first_line_number: int
+) -> Iterator[bytes]:
+    """
+    A private generator to decode lines of base64 data, as written by uuencode -m.
+    Lines are collected into blocks that are decoded with a single call to binascii,
+    which is much faster than decoding each line. A block is only decoded once it
+    ends on a whole number of base64 quanta, so every line read has been decoded when
+    a block is yielded. Decoding stops at the '====' line.
+
+    If not strict, characters outside of the base64 alphabet are removed rather than
+    raising an error, and a final incomplete quantum is dropped or padded. Each repair
+    is recorded along with its line number.
+    """
+    line_count = 0
+    line_errors: List[UULineError] = []
+    end_clause = END_CLAUSES[VARIANT_BASE64]
+
+    block = bytearray()
+    block_length = _block_length()
+    last_line_number = first_line_number
+    try:
+        for line_number, line in enumerate(lines, start=first_line_number):
+            # Perform removal of new line and carriage return characters from the end of each line
+            base64_line: bytes = line.rstrip(b'\n\r')
+
+            if base64_line == end_clause:
+                break
+            elif not base64_line:
+                continue
+
+            # Strict decoding of each block rejects characters outside of the alphabet
+            line_count += 1
+            last_line_number = line_number
+            if not strict and base64_line.translate(None, _BASE64_CHARACTERS):
+                line_errors.append(UULineError(line_number, 'illegal characters'))
+                base64_line = base64_line.translate(None, _INVALID_BASE64_CHARACTERS)
+
+            block.extend(base64_line)
+            if len(block) >= block_length and not len(block) % 4:
+                yield _decode_base64_block(block=block, strict=strict)
+                block.clear()
+
+        if block:
+            # binascii accepts padding after a whole quantum, so the length is checked here
+            if len(block) % 4:
+                if strict:
+                    raise InvalidUUDecodingError(
+                        "Invalid base64 data, length is not a multiple of four characters"
+                    )
+
+                line_errors.append(UULineError(last_line_number, 'incomplete base64 data'))
+
+                # Any padding is redone, a single character cannot be decoded
+                del block[len(block.rstrip(b'=')):]
+                if len(block) % 4 == 1:
+                    del block[-1:]
+                block.extend(b'=' * (-len(block) % 4))
+
+            yield _decode_base64_block(block=block, strict=strict)
+    finally:
+        line_counts.line_count = line_count
+        line_counts.repaired_line_count = len({error.line_number for error in line_errors})
+        line_counts.line_errors = line_errors
+
+
+def _select_line_decoder(
+    lines: Iterable[bytes],
+    line_counts: _LineCounts,
+    strict: bool,
+    first_line_number: int,
+    variant: str = VARIANT_UU
+) -> Iterator[bytes]:
+    """
+    A private function to select between the strict and lenient line decoders, and
+    the block decoder for the base64 variant.
+    """
+    if variant == VARIANT_BASE64:
+        return _decode_lines_base64(
+            lines=lines,
+            line_counts=line_counts,
+            strict=strict,
+            first_line_number=first_line_number
+        )
+    elif strict:
+        return _decode_lines(lines=lines, line_counts=line_counts)
+    else:
+        return _decode_lines_lenient(
+            lines=lines, line_counts=line_counts, first_line_number=first_line_number
         )
 
+
+def _decoded_length(lines: Iterable[bytes], variant: str) -> int:
+    """
+    A private function to compute the number of bytes decoded from lines of uuencoded
+    data without decoding them. For classic uu the length is exact, as each line starts
+    with a character giving its decoded length. For the base64 variant it is an upper
+    bound, from the number of characters before the '====' line.
+    """
+    decoded_length = 0
+
+    if variant == VARIANT_BASE64:
+        end_clause = END_CLAUSES[VARIANT_BASE64]
+        for line in lines:
+            base64_line: bytes = line.rstrip(b'\n\r')
+
+            if base64_line == end_clause:
+                break
+            decoded_length += len(base64_line)
+
+        return decoded_length * 3 // 4
+
+    for line in lines:
+        uuencoded_line: bytes = line.rstrip(b'\n\r')
+
+        if uuencoded_line and not uuencoded_line.startswith(b'end'):
+            decoded_length += (uuencoded_line[0] - 32) & 63
+
+    return decoded_length
+
+
+def _validate_ascii_lines(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    A private generator to validate that each line has an ascii encoding. Used in place
+    of charset_normalizer when data is streamed.
+    """
+    for line in lines:
+        if not line.isascii():
+            raise InvalidUUDecodingError(
+                "Invalid character encoding, file must have an ascii character encoding"
+            )
+        yield line
+
+
+class _StreamPosition:
+    """
+    A private structure to track the offset and number of lines read from a stream.
+    """
+    def __init__(self, offset: int = 0, line_number: int = 0) -> None:
+        self.offset = offset
+        self.line_number = line_number
+
+
+def _track_position(lines: Iterable[bytes], position: _StreamPosition) -> Iterator[bytes]:
+    """
+    A private generator to track the position within a stream as each line is read.
+    Offsets are tracked from line lengths, as iteration reads ahead of tell.
+    """
+    for line in lines:
+        position.offset += len(line)
+        position.line_number += 1
+        yield line
+
+
+def _count_line_bytes(lines: Iterable[bytes], stats: UUStats) -> Iterator[bytes]:
+    """
+    A private generator to count the number of bytes read when data is streamed.
+    """
+    for line in lines:
+        stats.bytes_in += len(line)
+        yield line
+
+
+def _read_header_line(lines: Iterator[bytes]) -> Tuple[bytes, int]:
+    """
+    A private function to read the header line from a stream, skipping any excess
+    white space before the header. Returns a tuple containing the header line and
+    its line number.
+    """
+    for header_line_number, line in enumerate(lines, start=1):
+        header_line: bytes = line.strip(b'\n\r')
+
+        if header_line:
+            return header_line, header_line_number
+
+    raise InvalidUUDecodingError("There is no content in file, nothing was decoded")
+
+
+def _write_block(
+    writer: AtomicFileWriter,
+    block: bytearray,
+    head: bytearray,
+    digest_set: Optional[DigestSet]
+) -> int:
+    """
+    A private function to write a block of decoded data, updating the digests and
+    the start of the data retained for detection. The block is cleared afterwards.
+    Returns the number of bytes written.
+    """
+    if len(head) < _SIGNATURE_LENGTH:
+        head.extend(block[:_SIGNATURE_LENGTH - len(head)])
+
+    if digest_set is not None:
+        digest_set.update(block)
+
+    bytes_written = writer.write(block)
+    block.clear()
+
+    return bytes_written
+
+
+def _resolve_file_details(
+    filename_uu: Optional[bytes], head: Union[bytes, bytearray]
+) -> Tuple[str, str, Optional[str]]:
+    """
+    A private function to determine the filename, file extension and mime type from
+    the filename in the header and the signature at the start of the decoded data.
+    Returns a tuple containing the filename, file extension and mime type.
+    """
     # Extract name and extension from filename
     filename_from_uu, file_extension_from_uu = decompose_filename(filename_from_uu=filename_uu)
 
     # Detect mime type and file extension from binary
-    file_mime_type_from_detection: Optional[str] = filetype.guess_mime(binary_data)
-    file_extension_from_detection: Optional[str] = filetype.guess_extension(binary_data)
+    file_mime_type_from_detection: Optional[str] = filetype.guess_mime(head)
+    file_extension_from_detection: Optional[str] = filetype.guess_extension(head)
 
     if file_extension_from_uu != file_extension_from_detection:
-        logger.warning(
+        extension_mismatch_warning.warning(
             "the file extension from file type detection does not match the extension from uu header"
         )
 
@@ -163,14 +486,507 @@ def decode(
         )
 
     filename: str = construct_filename(filename_from_uu=filename_from_uu)
+    return filename, file_extension, file_mime_type_from_detection
+
+
+def _export_to_shared_memory(
+    decoded_file: UUDecodedFile, shared_block: SharedMemory, length: int
+) -> None:
+    """
+    A private function to back a decoded file with the shared memory block it was
+    decoded into, and write the metadata alongside. If there is not enough room left
+    for the metadata, the data is moved to a new block and the original is unlinked.
+    """
+    decoded_file._attach_view(block=shared_block, length=length)
+
+    exported_block = decoded_file.to_shared_memory()
+    if exported_block is not shared_block:
+        decoded_file.close()
+        shared_block.unlink()
+        decoded_file._attach_view(block=exported_block, length=length)
+
+
+def decode(
+    file_object: Union[str, Path, bytes, bytearray],
+    encoding_validation: bool = True,
+    strict: bool = True,
+    digests: Optional[Iterable[str]] = None,
+    stats_callback: Optional[Callable[[UUStats], None]] = None,
+    budget: Optional[MemoryBudget] = None,
+    shared_memory: bool = False
+) -> UUDecodedFile:
+    """
+    Decode a file from a uuencoded format.
+
+    Args:
+        file_object (str | Path | bytes | bytearray): A file object is either a path
+            to a file, bytes or bytearray object. All must contain uuencoded data.
+        encoding_validation (bool): Boolean indicating whether to run encoding validation.
+        strict (bool): Boolean indicating whether a malformed line raises an error. If
+            False, malformed lines are repaired and recorded in line_errors instead.
+        digests (Iterable[str] | None): Names of digest algorithms (e.g., 'crc32', 'sha256')
+            to compute over the decoded data as it is decoded.
+        stats_callback (Callable[[UUStats], None] | None): An optional callback receiving
+            per-stage durations and byte counts once decoding has completed.
+        budget (MemoryBudget | None): A memory budget the decoded data is reserved from
+            while it is built, defaults to the budget of the process if one is set.
+        shared_memory (bool): Boolean indicating whether to decode straight into a
+            shared memory block, sized from the line lengths before decoding. The block
+            is available from the shared_memory attribute of the result, and the caller
+            must close and unlink it.
+
+    Returns:
+        UUDecodedFile: A UUDecodedFile instance providing the decoded data along with
+            a number of attributes, properties, and methods.
+    """
+    # Statistics are only collected when a callback is provided
+    stats: Optional[UUStats] = None
+    if stats_callback is not None:
+        stats = UUStats(operation='decode')
+
+    digest_set: Optional[DigestSet] = None if digests is None else DigestSet(names=digests)
+
+    content: bytes = load_file_object(file_object=file_object)
+    if stats is not None:
+        stats.bytes_in = len(content)
+        stats.stage('load')
+
+    # Load file object into a BytesIO instance
+    uu_encoded_buffer: BytesIO = _decode_from_charset_normalizer(
+        content=content, encoding_validation=encoding_validation
+    )
+    buffer_length = len(content)
+    if stats is not None:
+        stats.stage('validation')
+
+    # In case there are any issues, any excess white space before the header is skipped
+    for header_line_number, line in enumerate(uu_encoded_buffer, start=1):
+        header_line: bytes = line.strip(b'\n\r')
+
+        if header_line:
+            break
+
+    if uu_encoded_buffer.tell() == buffer_length:
+        raise InvalidUUDecodingError("There is no content in file, nothing was decoded")
+
+    variant, permissions_mode, filename_uu = _parse_header_line(header_line=header_line)
+
+    # The shared memory block is sized before decoding, with room for the metadata after
+    binary_data = bytearray()
+    shared_block: Optional[SharedMemory] = None
+    shared_view: Optional[memoryview] = None
+    if shared_memory:
+        data_start = uu_encoded_buffer.tell()
+        shared_block = _create_shared_memory(
+            size=(
+                SHARED_MEMORY_HEADER.size +
+                _decoded_length(lines=uu_encoded_buffer, variant=variant) +
+                SHARED_MEMORY_METADATA_LENGTH
+            )
+        )
+        shared_view = cast(memoryview, shared_block.buf)[SHARED_MEMORY_HEADER.size:]
+        uu_encoded_buffer.seek(data_start)
+
+    # Iterate through each line of buffer and decode using binascii
+    # Digests are updated in blocks while the decoded data is still in cache
+    decoded_length = 0
+    digested_length = 0
+    block_length = _block_length()
+    line_counts = _LineCounts()
+    try:
+        with reservation(budget=budget, nbytes=buffer_length * 3 // 4):
+            for decoded_output in _select_line_decoder(
+                lines=uu_encoded_buffer,
+                line_counts=line_counts,
+                strict=strict,
+                first_line_number=header_line_number + 1,
+                variant=variant
+            ):
+                if shared_view is None:
+                    binary_data.extend(decoded_output)
+                else:
+                    shared_view[decoded_length:decoded_length + len(decoded_output)] = decoded_output
+                decoded_length += len(decoded_output)
+
+                if digest_set is not None and decoded_length - digested_length >= block_length:
+                    digested_length = digest_set.update_from(
+                        buffer=binary_data if shared_view is None else shared_view,
+                        start=digested_length,
+                        end=decoded_length
+                    )
+
+        if digest_set is not None:
+            digest_set.update_from(
+                buffer=binary_data if shared_view is None else shared_view,
+                start=digested_length,
+                end=decoded_length
+            )
+
+        if stats is not None:
+            stats.line_count = line_counts.line_count
+            stats.repaired_line_count = line_counts.repaired_line_count
+            stats.stage('decode')
+
+        # Raise error if there was nothing was decoded
+        if not decoded_length:
+            raise InvalidUUDecodingError(
+                "Apart from header there is no content in file, nothing was decoded"
+            )
+
+        filename, file_extension, file_mime_type = _resolve_file_details(
+            filename_uu=filename_uu,
+            head=binary_data if shared_view is None else bytes(shared_view[:_SIGNATURE_LENGTH])
+        )
+    except BaseException:
+        if shared_block is not None and shared_view is not None:
+            shared_view.release()
+            shared_block.close()
+            shared_block.unlink()
+        raise
 
     # Structure all related variables in a UUDecodedFile instance
     decoded_file = UUDecodedFile(
         filename=filename,
         permissions_mode=permissions_mode,
-        file_mime_type=file_mime_type_from_detection,
+        file_mime_type=file_mime_type,
         file_extension=file_extension
     )
     decoded_file.uu_bytes = binary_data
+    decoded_file.line_errors = line_counts.line_errors
+    if digest_set is not None:
+        decoded_file.digests = digest_set.hexdigests()
+
+    if shared_block is not None and shared_view is not None:
+        shared_view.release()
+        _export_to_shared_memory(
+            decoded_file=decoded_file, shared_block=shared_block, length=decoded_length
+        )
+
+    if stats is not None and stats_callback is not None:
+        stats.bytes_out = decoded_length
+        stats.stage('detection')
+        stats_callback(stats)
 
     return decoded_file
+
+
+def _decode_to_sink(
+    binary_stream: BinaryIO,
+    sink: BinaryIO,
+    encoding_validation: bool,
+    strict: bool,
+    stats: Optional[UUStats]
+) -> Tuple[str, Optional[bytes], int]:
+    """
+    A private function to stream uuencoded data from a stream into a sink as decoded
+    data, holding a single line in memory at a time. As nothing is retained for file
+    type detection, this is used where no filename is needed, such as a pipe. Returns
+    a tuple containing the permissions mode, filename from the header and number of
+    bytes written.
+    """
+    lines: Iterator[bytes] = iter(binary_stream)
+    if stats is not None:
+        lines = _count_line_bytes(lines=lines, stats=stats)
+    if encoding_validation:
+        lines = _validate_ascii_lines(lines=lines)
+
+    header_line, header_line_number = _read_header_line(lines=lines)
+    variant, permissions_mode, filename_uu = _parse_header_line(header_line=header_line)
+
+    bytes_written = 0
+    line_counts = _LineCounts()
+    for decoded_output in _select_line_decoder(
+        lines=lines,
+        line_counts=line_counts,
+        strict=strict,
+        first_line_number=header_line_number + 1,
+        variant=variant
+    ):
+        bytes_written += sink.write(decoded_output)
+
+    if stats is not None:
+        stats.line_count = line_counts.line_count
+        stats.repaired_line_count = line_counts.repaired_line_count
+        stats.bytes_out = bytes_written
+        stats.stage('decode')
+
+    return permissions_mode, filename_uu, bytes_written
+
+
+def find_checkpoint(
+    file_object: Union[str, Path, bytes, bytearray, BinaryIO],
+    directory: Union[str, Path],
+    source_compression: Optional[str] = COMPRESSION_AUTO
+) -> Optional[Path]:
+    """
+    Find the checkpoint left in a directory by an interrupted decode_to_file of a
+    file object, which can be passed to decode_to_file as resume_from.
+
+    Args:
+        file_object (str | Path | bytes | bytearray | BinaryIO): A file object is either
+            a path to a file, bytes, bytearray or binary stream object. All must contain
+            uuencoded data.
+        directory (str | Path): A path to the directory the file object was decoded into.
+        source_compression (str | None): The compression format of the file object,
+            either 'auto', 'gzip', 'bz2', 'xz' or 'zstd'.
+
+    Returns:
+        Path | None: The path of the checkpoint, or None if there is no checkpoint.
+    """
+    with open_file_object(
+        file_object=file_object, compression=source_compression
+    ) as uu_encoded_stream:
+        header_line, _ = _read_header_line(lines=iter(uu_encoded_stream))
+
+    _, checkpoint_name = checkpoint_names(header_line=header_line)
+    checkpoint_path = Path(directory) / checkpoint_name
+
+    return checkpoint_path if checkpoint_path.is_file() else None
+
+
+def decode_to_file(
+    file_object: Union[str, Path, bytes, bytearray, BinaryIO],
+    directory: Union[str, Path],
+    encoding_validation: bool = True,
+    strict: bool = True,
+    buffer_size: int = WRITE_BUFFER_SIZE,
+    fsync: str = FSYNC_NONE,
+    checkpoint_interval: Optional[int] = None,
+    resume_from: Optional[Union[str, Path]] = None,
+    source_compression: Optional[str] = COMPRESSION_AUTO,
+    compression: Optional[str] = None,
+    digests: Optional[Iterable[str]] = None,
+    stats_callback: Optional[Callable[[UUStats], None]] = None,
+    budget: Optional[MemoryBudget] = None,
+    overwrite: bool = True
+) -> UUWrittenFile:
+    """
+    Decode a file from a uuencoded format, streaming the decoded data directly into
+    a directory without holding it in memory.
+
+    The filename is derived from the header. Decoded data is written to a temporary
+    file in the directory, the permissions mode from the header is applied and the
+    file is then atomically renamed, so a partially decoded file is never visible.
+    When data is streamed, encoding validation checks that each line is ascii rather
+    than running charset_normalizer over the whole file.
+
+    With a checkpoint interval, the temporary file is given a name derived from the
+    header and is kept if decoding fails. A checkpoint recording the input offset,
+    output offset and sha256 digest of the output is saved next to it as each interval
+    of decoded data is written, and is removed once the file has been committed. An
+    interrupted decode is continued by passing the checkpoint, which can be found
+    with find_checkpoint, as resume_from. The partial output is rehashed and checked
+    against the checkpoint before decoding continues from the input offset, so the
+    file object must be seekable. Line errors and statistics only cover the lines
+    decoded after resuming.
+
+    Compressed sources are decompressed and the output can be compressed chunk by
+    chunk as data is decoded, so neither is held in memory. By default, the format
+    of the source is detected from its magic bytes. Compressed output is named with
+    the suffix of its format (e.g., '.gz') and cannot be checkpointed.
+
+    Args:
+        file_object (str | Path | bytes | bytearray | BinaryIO): A file object is either
+            a path to a file, bytes, bytearray or binary stream object. All must contain
+            uuencoded data.
+        directory (str | Path): A path to an existing directory as a string or Path object.
+        encoding_validation (bool): Boolean indicating whether to run encoding validation.
+        strict (bool): Boolean indicating whether a malformed line raises an error. If
+            False, malformed lines are repaired and recorded in line_errors instead.
+        buffer_size (int): The size of the write buffer in bytes.
+        fsync (str): The fsync policy, either 'none', 'file' or 'directory'.
+        checkpoint_interval (int | None): The number of decoded bytes written between
+            checkpoints. If not provided, no checkpoints are saved.
+        resume_from (str | Path | None): A path to the checkpoint of an interrupted
+            decode of the same file object into the same directory.
+        source_compression (str | None): The compression format of the file object,
+            either 'auto', 'gzip', 'bz2', 'xz' or 'zstd'. If not provided, the file object
+            is read as is.
+        compression (str | None): The compression format of the output file, either
+            'gzip', 'bz2', 'xz' or 'zstd'. If not provided, the output is not compressed.
+        digests (Iterable[str] | None): Names of digest algorithms (e.g., 'crc32', 'sha256')
+            to compute over the decoded data as it is decoded.
+        stats_callback (Callable[[UUStats], None] | None): An optional callback receiving
+            per-stage durations and byte counts once decoding has completed.
+        budget (MemoryBudget | None): A memory budget a block of decoded data is reserved
+            from while streaming, defaults to the budget of the process if one is set.
+        overwrite (bool): Boolean indicating whether an existing file of the same name
+            is replaced. If False, FileExistsError is raised instead.
+
+    Returns:
+        UUWrittenFile: A UUWrittenFile instance describing the decoded file on disk.
+    """
+    if checkpoint_interval is not None and checkpoint_interval <= 0:
+        raise ValueError('Checkpoint interval must be a positive number of bytes')
+
+    if compression is not None and (checkpoint_interval is not None or resume_from is not None):
+        raise ValueError('Compressed output cannot be checkpointed')
+
+    directory = Path(directory)
+
+    # Statistics are only collected when a callback is provided
+    stats: Optional[UUStats] = None
+    if stats_callback is not None:
+        stats = UUStats(operation='decode_to_file')
+
+    digest_set: Optional[DigestSet] = None if digests is None else DigestSet(names=digests)
+
+    checkpoint: Optional[UUCheckpoint] = None
+    if resume_from is not None:
+        checkpoint = load_checkpoint(path=resume_from)
+
+    with open_file_object(
+        file_object=file_object, compression=source_compression
+    ) as uu_encoded_stream:
+        position = _StreamPosition()
+        lines: Iterator[bytes] = _track_position(lines=uu_encoded_stream, position=position)
+        if stats is not None:
+            lines = _count_line_bytes(lines=lines, stats=stats)
+        if encoding_validation:
+            lines = _validate_ascii_lines(lines=lines)
+
+        header_line, header_line_number = _read_header_line(lines=lines)
+        variant, permissions_mode, filename_uu = _parse_header_line(header_line=header_line)
+
+        # The output digest is only needed to validate checkpoints on resume
+        head = bytearray()
+        bytes_written = 0
+        first_line_number = header_line_number + 1
+        temp_name: Optional[str] = None
+        checkpoint_path: Optional[Path] = None
+        output_digest: Optional[DigestSet] = None
+        if checkpoint_interval is not None or checkpoint is not None:
+            temp_name, checkpoint_name = checkpoint_names(header_line=header_line)
+            checkpoint_path = directory / checkpoint_name
+            output_digest = DigestSet(names=['sha256'])
+
+        if checkpoint is not None and output_digest is not None:
+            if checkpoint.header != header_line:
+                raise ValueError('Checkpoint does not match the header of the file object')
+
+            for chunk in iter_partial_output(
+                path=directory / checkpoint.part_name, output_offset=checkpoint.output_offset
+            ):
+                if len(head) < _SIGNATURE_LENGTH:
+                    head.extend(chunk[:_SIGNATURE_LENGTH - len(head)])
+                if digest_set is not None:
+                    digest_set.update(chunk)
+                output_digest.update(chunk)
+
+            if output_digest.hexdigests()['sha256'] != checkpoint.sha256:
+                raise ValueError('Partial output does not match checkpoint')
+
+            # Lines are read again from just after the last line that was decoded
+            uu_encoded_stream.seek(checkpoint.input_offset)
+            position.offset = checkpoint.input_offset
+            position.line_number = checkpoint.line_number
+            first_line_number = checkpoint.line_number + 1
+            temp_name = checkpoint.part_name
+            bytes_written = checkpoint.output_offset
+
+            if stats is not None:
+                stats.stage('resume')
+
+        block_length = _block_length()
+        with reservation(
+            budget=budget, nbytes=block_length + _SIGNATURE_LENGTH + buffer_size
+        ), AtomicFileWriter(
+            directory=directory,
+            buffer_size=buffer_size,
+            fsync=fsync,
+            temp_name=temp_name,
+            offset=bytes_written,
+            compression=compression
+        ) as writer:
+            # Decoded lines are collected into blocks which are digested and written,
+            # retaining only the start of the data for detection
+            block = bytearray()
+            checkpoint_offset = bytes_written
+            line_counts = _LineCounts()
+            for decoded_output in _select_line_decoder(
+                lines=lines,
+                line_counts=line_counts,
+                strict=strict,
+                first_line_number=first_line_number,
+                variant=variant
+            ):
+                block.extend(decoded_output)
+
+                if len(block) >= block_length:
+                    if output_digest is not None:
+                        output_digest.update(block)
+                    bytes_written += _write_block(
+                        writer=writer, block=block, head=head, digest_set=digest_set
+                    )
+
+                    # The position is just after the line that completed the block
+                    if (
+                        checkpoint_interval is not None and
+                        checkpoint_path is not None and
+                        output_digest is not None and
+                        bytes_written - checkpoint_offset >= checkpoint_interval
+                    ):
+                        writer.flush()
+                        save_checkpoint(
+                            path=checkpoint_path,
+                            checkpoint=UUCheckpoint(
+                                header=header_line,
+                                part_name=writer.temp_path.name,
+                                input_offset=position.offset,
+                                output_offset=bytes_written,
+                                line_number=position.line_number,
+                                sha256=output_digest.hexdigests()['sha256']
+                            )
+                        )
+                        checkpoint_offset = bytes_written
+
+            bytes_written += _write_block(
+                writer=writer, block=block, head=head, digest_set=digest_set
+            )
+
+            if stats is not None:
+                stats.line_count = line_counts.line_count
+                stats.repaired_line_count = line_counts.repaired_line_count
+                stats.stage('decode')
+
+            # Raise error if there was nothing was decoded
+            if not bytes_written:
+                raise InvalidUUDecodingError(
+                    "Apart from header there is no content in file, nothing was decoded"
+                )
+
+            filename, file_extension, file_mime_type = _resolve_file_details(
+                filename_uu=filename_uu, head=head
+            )
+            if stats is not None:
+                stats.stage('detection')
+
+            compression_suffix = '' if compression is None else COMPRESSION_SUFFIXES[compression]
+            path: Path = writer.commit(
+                filename=f'{filename}.{file_extension}{compression_suffix}',
+                permissions_mode=permissions_mode,
+                overwrite=overwrite
+            )
+
+    if checkpoint_path is not None:
+        checkpoint_path.unlink(missing_ok=True)
+
+    # Structure all related variables in a UUWrittenFile instance
+    written_file = UUWrittenFile(
+        filename=filename,
+        permissions_mode=permissions_mode,
+        file_mime_type=file_mime_type,
+        file_extension=file_extension,
+        path=path,
+        size=bytes_written
+    )
+    written_file.line_errors = line_counts.line_errors
+    if digest_set is not None:
+        written_file.digests = digest_set.hexdigests()
+
+    if stats is not None and stats_callback is not None:
+        stats.bytes_out = bytes_written
+        stats.stage('write')
+        stats_callback(stats)
+
+    return written_file
@@ -0,0 +1,94 @@
+import hashlib
+import zlib
+from typing import Dict, Iterable, Optional, Protocol, Union
+
+
+class _Digest(Protocol):
+    """
+    A private protocol for incremental digests, as implemented by hashlib objects.
+    """
+    def update(self, data: Union[bytes, bytearray, memoryview], /) -> None:
+        ...
+
+    def hexdigest(self) -> str:
+        ...
+
+
+class _CRC32:
+    """
+    A private incremental CRC32 digest with the same interface as hashlib objects.
+    """
+    def __init__(self) -> None:
+        self._value = 0
+
+    def update(self, data: Union[bytes, bytearray, memoryview], /) -> None:
+        self._value = zlib.crc32(data, self._value)
+
+    def hexdigest(self) -> str:
+        return f'{self._value:08x}'
+
+
+class DigestSet:
+    """
+    A set of digests computed incrementally as blocks of data are produced, so that
+    data does not need to be read a second time to be verified. Any algorithm supported
+    by hashlib can be requested along with 'crc32'.
+
+    Args:
+        names (Iterable[str]): The names of the digest algorithms (e.g., 'crc32', 'sha256').
+    """
+    def __init__(self, names: Iterable[str]):
+        self._digests: Dict[str, _Digest] = dict()
+
+        for name in names:
+            name = name.lower()
+            if name == 'crc32':
+                self._digests[name] = _CRC32()
+            else:
+                try:
+                    self._digests[name] = hashlib.new(name)
+                except ValueError:
+                    raise ValueError(f'Unsupported digest algorithm {name}')
+
+    def update(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Update every digest with a block of data.
+
+        Args:
+            data (bytes | bytearray | memoryview): A block of data.
+        """
+        for digest in self._digests.values():
+            digest.update(data)
+
+    def update_from(
+        self, buffer: Union[bytearray, memoryview], start: int, end: Optional[int] = None
+    ) -> int:
+        """
+        Update every digest with the data in a growing buffer from a start offset,
+        without copying the data.
+
+        Args:
+            buffer (bytearray | memoryview): The buffer data is being added to.
+            start (int): The offset up to which data has already been digested.
+            end (int | None): The offset up to which data has been added, defaults to
+                the length of the buffer.
+
+        Returns:
+            int: The offset up to which data has now been digested.
+        """
+        end = len(buffer) if end is None else end
+
+        # The view is released straight away so the buffer can continue to grow
+        with memoryview(buffer) as buffer_view:
+            self.update(buffer_view[start:end])
+
+        return end
+
+    def hexdigests(self) -> Dict[str, str]:
+        """
+        The hexadecimal value of every digest.
+
+        Returns:
+            Dict[str, str]: A dictionary mapping each algorithm name to its hexadecimal digest.
+        """
+        return {name: digest.hexdigest() for name, digest in self._digests.items()}
@@ -2,24 +2,55 @@ import binascii
 from io import BytesIO
 from mimetypes import types_map
 from pathlib import Path
-from typing import cast, Optional, Tuple, Union
+from typing import (BinaryIO, Callable, Iterable, Iterator, Optional, Protocol,
+                    Tuple, Union, cast)
 
 import charset_normalizer
-import filetype # type: ignore[import-untyped]
+import filetype  # type: ignore[import-untyped]
 from unix_perms import InvalidOctalError, from_octal_to_permissions_mode
 
+from simple_uu.budget import MemoryBudget, reservation
+from simple_uu.compression import COMPRESSION_SUFFIXES
+from simple_uu.digests import DigestSet
 from simple_uu.exceptions import (FileExtensionNotDetected,
                                   InvalidPermissionsMode,
                                   InvalidUUEncodingError)
-from simple_uu.logger import set_up_logger
-from simple_uu.types import UUEncodedFile
-from simple_uu.utils import load_file_object
+from simple_uu.logger import RateLimitedWarning, set_up_logger
+from simple_uu.stats import UUStats
+from simple_uu.tuning import get_profile
+from simple_uu.types import UUEncodedFile, UUWrittenFile
+from simple_uu.utils import (BEGIN_CLAUSES, FSYNC_NONE, VARIANT_BASE64,
+                             VARIANT_UU, WRITE_BUFFER_SIZE, AtomicFileWriter,
+                             load_file_object, open_file_object,
+                             validate_variant)
 
 logger = set_up_logger(__name__)
+extension_mismatch_warning = RateLimitedWarning(logger=logger)
 
 # Maximum length of binary for a given line of uuencoded data
 _MAX_BINARY_LENGTH = 45
 
+# Footer written after the lines of each variant, as with uuencode -m the lines of
+# both variants hold up to the same number of bytes
+_FOOTERS = {VARIANT_UU: b'\nend', VARIANT_BASE64: b'===='}
+
+# Number of bytes read at a time when streaming, a multiple of the line length,
+# unless the tuning profile sets another length
+_CHUNK_LENGTH = _MAX_BINARY_LENGTH * 4096
+
+# Number of bytes used for validation and file type detection when streaming,
+# a multiple of the line length that covers the signature read by filetype
+_SIGNATURE_LENGTH = _MAX_BINARY_LENGTH * 183
+
+class _Sink(Protocol):
+    """
+    A private protocol for anything encoded data can be written to, such as a binary
+    stream or an AtomicFileWriter.
+    """
+    def write(self, data: bytes, /) -> int:
+        ...
+
+
 def _permissions_mode(octal_permission: Optional[Union[str, int]]) -> str:
     """
     A private function to convert an octal into a Unix permissions mode.
@@ -59,10 +90,10 @@ def _encode_from_charset_normalizer(
     content: bytes,
     encoding_validation: bool,
     binary_validation: bool
-) -> Tuple[BytesIO, Optional[str], Optional[str]]:
+) -> BytesIO:
     """
-    A private function to validate that a bytes object is binary and detect mime and extension.
-    Returns a tuple containing a BytesIO instance along with the detected mime type and file extension.
+    A private function to validate that a bytes object is binary.
+    Returns a BytesIO instance.
     """
     # Ensure that file object passed is in binary form
     if binary_validation:
@@ -80,13 +111,159 @@ def _encode_from_charset_normalizer(
                 "Binary file cannot have a character encoding"
             )
 
-    # Detect mime type and file extension from binary
-    file_mime_type_from_detection: Optional[str] = filetype.guess_mime(content)
-    file_extension_from_detection: Optional[str] = filetype.guess_extension(content)
+    return BytesIO(content)
+
+
+def _resolve_file_extension(
+    file_extension: Optional[str], file_extension_from_detection: Optional[str]
+) -> str:
+    """
+    A private function to choose between the extension provided and the extension
+    detected from the binary data.
+    """
+    # If no file extension was provided and there was not a successful detection
+    # raise a FileExtensionNotDetected error
+    if file_extension is None and file_extension_from_detection is None:
+        raise FileExtensionNotDetected(
+            'File extension was not provided and could not be detected from signature'
+        )
+    else:
+        if file_extension != file_extension_from_detection:
+            extension_mismatch_warning.warning(
+                "The file extension generated from file type detection does not match extension provided"
+            )
+
+    # By default, use extension from detection over that provided by user
+    # If file extension cannot be detected, then the extension provided  is used
+    return cast(
+        str,
+        file_extension_from_detection if file_extension_from_detection is not None
+        else file_extension
+    )
+
+
+def _encode_chunk(chunk: Union[bytes, bytearray], variant: str = VARIANT_UU) -> bytes:
+    """
+    A private function to encode a chunk of binary data into uuencoded lines.
+    """
+    chunk_view = memoryview(chunk)
+    if variant == VARIANT_BASE64:
+        return b''.join(
+            binascii.b2a_base64(chunk_view[index:index + _MAX_BINARY_LENGTH])
+            for index in range(0, len(chunk_view), _MAX_BINARY_LENGTH)
+        )
+
+    return b''.join(
+        binascii.b2a_uu(chunk_view[index:index + _MAX_BINARY_LENGTH])
+        for index in range(0, len(chunk_view), _MAX_BINARY_LENGTH)
+    )
+
+
+def _encoded_length(binary_length: int) -> int:
+    """
+    A private function to estimate the number of bytes of encoded lines for a number of
+    bytes of binary data, used to reserve memory before encoding.
+    """
+    line_count = (binary_length + _MAX_BINARY_LENGTH - 1) // _MAX_BINARY_LENGTH
+    return line_count * (_MAX_BINARY_LENGTH * 4 // 3 + 2)
+
+
+def _chunk_length() -> int:
+    """
+    A private function to get the number of bytes encoded at a time, from the tuning
+    profile if it sets one.
+    """
+    return get_profile().chunk_length or _CHUNK_LENGTH
+
+
+def _header(permissions_mode: str, full_filename: str, variant: str) -> bytes:
+    """
+    A private function to generate the header line of a variant.
+    """
+    return BEGIN_CLAUSES[variant] + f' {permissions_mode} {full_filename}\n'.encode('ascii')
+
 
-    return (
-        BytesIO(content), file_mime_type_from_detection, file_extension_from_detection
+def _read_chunks(binary_stream: BinaryIO, chunk_length: int) -> Iterator[bytes]:
+    """
+    A private generator to read a stream in chunks of an exact length, so that
+    every chunk except the last is aligned to the line length.
+    """
+    while True:
+        chunk = binary_stream.read(chunk_length)
+        if not chunk:
+            return
+
+        # Short reads are topped up so that lines are not split across chunks
+        while len(chunk) < chunk_length:
+            remainder = binary_stream.read(chunk_length - len(chunk))
+            if not remainder:
+                break
+            chunk += remainder
+
+        yield chunk
+
+
+def _encode_to_sink(
+    binary_stream: BinaryIO,
+    sink: _Sink,
+    filename: str,
+    permissions_mode: str,
+    file_extension: Optional[str],
+    encoding_validation: bool,
+    binary_validation: bool,
+    digest_set: Optional[DigestSet],
+    stats: Optional[UUStats],
+    variant: str = VARIANT_UU
+) -> Tuple[Optional[str], str, int]:
+    """
+    A private function to stream binary data from a stream into a sink as uuencoded
+    data, holding a single chunk in memory at a time. Validation and file type
+    detection are run on the start of the data only. Returns a tuple containing the
+    mime type, file extension and number of bytes written.
+    """
+    head: bytes = next(
+        _read_chunks(binary_stream=binary_stream, chunk_length=_SIGNATURE_LENGTH), b''
+    )
+    _encode_from_charset_normalizer(
+        content=head,
+        encoding_validation=encoding_validation,
+        binary_validation=binary_validation
     )
+    if stats is not None:
+        stats.stage('validation')
+
+    file_mime_type_from_detection: Optional[str] = filetype.guess_mime(head)
+    file_extension_final: str = _resolve_file_extension(
+        file_extension=file_extension,
+        file_extension_from_detection=filetype.guess_extension(head)
+    )
+    if stats is not None:
+        stats.stage('detection')
+
+    # Write header, followed by each encoded chunk and then the footer
+    full_filename: str = filename + '.' + file_extension_final
+    bytes_written = sink.write(
+        _header(permissions_mode=permissions_mode, full_filename=full_filename, variant=variant)
+    )
+    bytes_written += sink.write(_encode_chunk(chunk=head, variant=variant))
+    if digest_set is not None:
+        digest_set.update(head)
+
+    bytes_read = len(head)
+    for chunk in _read_chunks(binary_stream=binary_stream, chunk_length=_chunk_length()):
+        if digest_set is not None:
+            digest_set.update(chunk)
+
+        bytes_read += len(chunk)
+        bytes_written += sink.write(_encode_chunk(chunk=chunk, variant=variant))
+
+    bytes_written += sink.write(_FOOTERS[variant])
+    if stats is not None:
+        stats.bytes_in = bytes_read
+        stats.line_count = (bytes_read + _MAX_BINARY_LENGTH - 1) // _MAX_BINARY_LENGTH
+        stats.stage('encode')
+
+    return file_mime_type_from_detection, file_extension_final, bytes_written
 
 
 def encode(
@@ -95,7 +272,11 @@ def encode(
     octal_permission: Optional[Union[str, int]] = None,
     extension: Optional[str] = None,
     encoding_validation: bool = True,
-    binary_validation: bool = True
+    binary_validation: bool = True,
+    digests: Optional[Iterable[str]] = None,
+    stats_callback: Optional[Callable[[UUStats], None]] = None,
+    variant: str = VARIANT_UU,
+    budget: Optional[MemoryBudget] = None
 ) -> UUEncodedFile:
     """
     Encode binary data into a uuencoded format.
@@ -110,6 +291,9 @@ def encode(
     is not provided, the default octal literal 0o644 will be used. If an extension is
     not provided the it will be detected based off of the binary data.
 
+    The variant selects between classic uu and the base64 variant written by
+    uuencode -m, which has a 'begin-base64' header and a '====' footer.
+
     Args:
         file_object (str | Path | bytes | bytearray): A file object is either a path
             to a file, bytes object or bytearray object. All must contain binary data.
@@ -118,59 +302,82 @@ def encode(
         extension (str | None): An extension for the file being encoded.
         encoding_validation (bool): Boolean indicating whether to run encoding validation.
         binary_validation (bool): Boolean indicating whether to run binary validation.
+        digests (Iterable[str] | None): Names of digest algorithms (e.g., 'crc32', 'sha256')
+            to compute over the binary data as it is encoded.
+        stats_callback (Callable[[UUStats], None] | None): An optional callback receiving
+            per-stage durations and byte counts once encoding has completed.
+        variant (str): The variant to encode with, either 'uu' or 'base64'.
+        budget (MemoryBudget | None): A memory budget the encoded data is reserved from
+            while it is built, defaults to the budget of the process if one is set.
 
     Returns:
         UUEncodedFile: A UUEncodedFile instance providing the encoded data along with
             a number of attributes, properties, and methods.
     """
+    # Statistics are only collected when a callback is provided
+    stats: Optional[UUStats] = None
+    if stats_callback is not None:
+        stats = UUStats(operation='encode')
+
+    digest_set: Optional[DigestSet] = None if digests is None else DigestSet(names=digests)
+
+    validate_variant(variant=variant)
     filename = '_'.join(item for item in filename.split())
     permissions_mode = _permissions_mode(octal_permission=octal_permission)
     file_extension = _file_extension(extension=extension)
 
     # Load file and collection objects
     binary_data = bytearray()
-    binary_buffer, file_mime_type_from_detection, file_extension_from_detection  = _encode_from_charset_normalizer(
-        content=load_file_object(file_object=file_object),
+    content: bytes = load_file_object(file_object=file_object)
+    if stats is not None:
+        stats.bytes_in = len(content)
+        stats.stage('load')
+
+    binary_buffer: BytesIO = _encode_from_charset_normalizer(
+        content=content,
         encoding_validation=encoding_validation,
         binary_validation=binary_validation
     )
+    if stats is not None:
+        stats.stage('validation')
 
-    # If no file extension was provided and there was not a successful detection
-    # raise a FileExtensionNotDetected error
-    if file_extension is None and file_extension_from_detection is None:
-        raise FileExtensionNotDetected(
-            'File extension was not provided and could not be detected from signature'
-        )
-    else:
-        if file_extension != file_extension_from_detection:
-            logger.warning(
-                "The file extension generated from file type detection does not match extension provided"
-            )
+    # Detect mime type and file extension from binary
+    file_mime_type_from_detection: Optional[str] = filetype.guess_mime(content)
+    file_extension_from_detection: Optional[str] = filetype.guess_extension(content)
 
-    # By default, use extension from detection over that provided by user
-    # If file extension cannot be detected, then the extension provided  is used
-    file_extension_final = cast(
-        str,
-        file_extension_from_detection if file_extension_from_detection is not None
-        else file_extension
+    file_extension_final: str = _resolve_file_extension(
+        file_extension=file_extension,
+        file_extension_from_detection=file_extension_from_detection
     )
 
     # Generate header for uuencoded file and add to bytearray
     full_filename: str = filename + '.' + file_extension_final
-    uu_header: bytes = f'begin {permissions_mode} {full_filename}\n'.encode('ascii')
+    uu_header: bytes = _header(
+        permissions_mode=permissions_mode, full_filename=full_filename, variant=variant
+    )
     binary_data.extend(uu_header)
 
+    if stats is not None:
+        stats.stage('detection')
+
     # Original length of buffer
-    buffer_length = len(binary_buffer.getvalue())
+    buffer_length = len(content)
+
+    # Iterate through chunks of complete 45 byte lines and encode with binascii
+    with reservation(budget=budget, nbytes=_encoded_length(binary_length=buffer_length)):
+        for chunk in _read_chunks(binary_stream=binary_buffer, chunk_length=_chunk_length()):
+            if digest_set is not None:
+                digest_set.update(chunk)
 
-    # Iterate through every 45 bits of the binary data and encode with binascii
-    while binary_buffer.tell() != buffer_length:
-        bytes_line: bytes = binary_buffer.read(_MAX_BINARY_LENGTH)
-        encoded_bytes: bytes = binascii.b2a_uu(bytes_line)
-        binary_data.extend(encoded_bytes)
+            binary_data.extend(_encode_chunk(chunk=chunk, variant=variant))
 
     # Add footer to bytearray
-    binary_data.extend(b'\nend')
+    binary_data.extend(_FOOTERS[variant])
+
+    if stats is not None:
+        stats.line_count = (buffer_length + _MAX_BINARY_LENGTH - 1) // _MAX_BINARY_LENGTH
+        stats.bytes_out = len(binary_data)
+        stats.stage('encode')
 
     # Structure all related variables in a UUEncodedFile instance
     encoded_file = UUEncodedFile(
@@ -180,5 +387,133 @@ def encode(
         file_extension=file_extension_final
     )
     encoded_file.uu_bytes = binary_data
+    if digest_set is not None:
+        encoded_file.digests = digest_set.hexdigests()
+
+    if stats is not None and stats_callback is not None:
+        stats_callback(stats)
 
     return encoded_file
+
+
+def encode_to_file(
+    file_object: Union[str, Path, bytes, bytearray, BinaryIO],
+    directory: Union[str, Path],
+    filename: str,
+    octal_permission: Optional[Union[str, int]] = None,
+    extension: Optional[str] = None,
+    encoding_validation: bool = True,
+    binary_validation: bool = True,
+    buffer_size: int = WRITE_BUFFER_SIZE,
+    fsync: str = FSYNC_NONE,
+    source_compression: Optional[str] = None,
+    compression: Optional[str] = None,
+    digests: Optional[Iterable[str]] = None,
+    stats_callback: Optional[Callable[[UUStats], None]] = None,
+    variant: str = VARIANT_UU,
+    budget: Optional[MemoryBudget] = None,
+    overwrite: bool = True
+) -> UUWrittenFile:
+    """
+    Encode binary data into a uuencoded format, streaming the encoded data directly
+    into a directory without holding it in memory. The output file is named after the
+    filename with a txt extension, as with UUEncodedFile.write_file.
+
+    Encoded data is written through a write buffer to a temporary file in the directory,
+    which is then atomically renamed. The fsync policy controls durability: 'none'
+    leaves flushing to the operating system, 'file' flushes the file before the rename
+    and 'directory' also flushes the directory after the rename. When data is streamed,
+    validation and file type detection are run on the start of the data only.
+
+    A compressed source can be decompressed and the output can be compressed chunk
+    by chunk as data is encoded, so neither is held in memory. As the binary data
+    may itself be compressed, the source is only decompressed when a format is given,
+    which can be 'auto' to detect it from magic bytes. Compressed output is named
+    with the suffix of its format (e.g., '.txt.gz').
+
+    Args:
+        file_object (str | Path | bytes | bytearray | BinaryIO): A file object is either
+            a path to a file, bytes, bytearray or binary stream object. All must contain
+            binary data.
+        directory (str | Path): A path to an existing directory as a string or Path object.
+        filename (str): The name of the file being encoded.
+        octal_permission (str | int | None): An octal permission as a string or integer.
+        extension (str | None): An extension for the file being encoded.
+        encoding_validation (bool): Boolean indicating whether to run encoding validation.
+        binary_validation (bool): Boolean indicating whether to run binary validation.
+        buffer_size (int): The size of the write buffer in bytes.
+        fsync (str): The fsync policy, either 'none', 'file' or 'directory'.
+        source_compression (str | None): The compression format of the file object,
+            either 'auto', 'gzip', 'bz2', 'xz' or 'zstd'. If not provided, the file object
+            is read as is.
+        compression (str | None): The compression format of the output file, either
+            'gzip', 'bz2', 'xz' or 'zstd'. If not provided, the output is not compressed.
+        digests (Iterable[str] | None): Names of digest algorithms (e.g., 'crc32', 'sha256')
+            to compute over the binary data as it is encoded.
+        stats_callback (Callable[[UUStats], None] | None): An optional callback receiving
+            per-stage durations and byte counts once encoding has completed.
+        variant (str): The variant to encode with, either 'uu' or 'base64'.
+        budget (MemoryBudget | None): A memory budget a chunk and its encoding are reserved
+            from while streaming, defaults to the budget of the process if one is set.
+        overwrite (bool): Boolean indicating whether an existing file of the same name
+            is replaced. If False, FileExistsError is raised instead.
+
+    Returns:
+        UUWrittenFile: A UUWrittenFile instance describing the encoded file on disk.
+    """
+    # Statistics are only collected when a callback is provided
+    stats: Optional[UUStats] = None
+    if stats_callback is not None:
+        stats = UUStats(operation='encode_to_file')
+
+    digest_set: Optional[DigestSet] = None if digests is None else DigestSet(names=digests)
+
+    validate_variant(variant=variant)
+    filename = '_'.join(item for item in filename.split())
+    permissions_mode = _permissions_mode(octal_permission=octal_permission)
+    file_extension = _file_extension(extension=extension)
+
+    # A chunk and its encoding are reserved from the memory budget along with the buffer
+    with open_file_object(
+        file_object=file_object, compression=source_compression
+    ) as binary_stream, reservation(
+        budget=budget, nbytes=_chunk_length() * 5 // 2 + buffer_size
+    ), AtomicFileWriter(
+        directory=directory, buffer_size=buffer_size, fsync=fsync, compression=compression
+    ) as writer:
+        file_mime_type_from_detection, file_extension_final, bytes_written = _encode_to_sink(
+            binary_stream=binary_stream,
+            sink=writer,
+            filename=filename,
+            permissions_mode=permissions_mode,
+            file_extension=file_extension,
+            encoding_validation=encoding_validation,
+            binary_validation=binary_validation,
+            digest_set=digest_set,
+            stats=stats,
+            variant=variant
+        )
+
+        compression_suffix = '' if compression is None else COMPRESSION_SUFFIXES[compression]
+        path: Path = writer.commit(
+            filename=filename + '.txt' + compression_suffix, overwrite=overwrite
+        )
+
+    # Structure all related variables in a UUWrittenFile instance
+    written_file = UUWrittenFile(
+        filename=filename,
+        permissions_mode=permissions_mode,
+        file_mime_type=file_mime_type_from_detection,
+        file_extension=file_extension_final,
+        path=path,
+        size=bytes_written
+    )
+    if digest_set is not None:
+        written_file.digests = digest_set.hexdigests()
+
+    if stats is not None and stats_callback is not None:
+        stats.bytes_out = bytes_written
+        stats.stage('write')
+        stats_callback(stats)
+
+    return written_file
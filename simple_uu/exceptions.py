@@ -41,3 +41,9 @@ class FileExtensionNotDetected(BaseError):
     """
     def __init__(self, message: str):
         super().__init__(message=message)
+
+
+class UUServiceError(BaseError):
+    """Error returned by a simple_uu service for a request it could not process."""
+    def __init__(self, message: str):
+        super().__init__(message=message)
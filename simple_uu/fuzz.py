@@ -0,0 +1,463 @@
+import argparse
+import json
+import random
+import sys
+import tempfile
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+from time import perf_counter
+from typing import (Any, Callable, Dict, List, NamedTuple, Optional, Sequence,
+                    Tuple)
+
+from simple_uu.batch import encode_batch
+from simple_uu.bench import generate_payload, parse_size
+from simple_uu.decode import decode, decode_to_file
+from simple_uu.encode import encode, encode_to_file
+from simple_uu.logger import LIBRARY_LOGGING, set_logging_mode
+from simple_uu.parallel import decode_parallel, encode_parallel
+from simple_uu.reference import reference_decode, reference_encode
+from simple_uu.scan import decode_all
+from simple_uu.utils import VARIANT_BASE64, VARIANT_UU
+
+# Filename and permissions mode of every payload, the payloads start with a jpeg signature
+_FILENAME = 'fuzz'
+_FULL_FILENAME = 'fuzz.jpg'
+_PERMISSIONS_MODE = '644'
+
+# Kinds of generated cases
+_KINDS = ('valid', 'crlf', 'header', 'malformed')
+
+# Span length used by the parallel engines, small so that every case spans many threads
+_SPAN_LENGTH = 45 * 8
+
+_DEFAULT_MAX_SIZE = '16KB'
+
+class FuzzCase(NamedTuple):
+    """
+    A single generated case of the differential harness.
+
+    Args:
+        name (str): A unique name describing how the case was generated.
+        kind (str): The kind of case, either 'valid', 'crlf', 'header' or 'malformed'.
+        variant (str): The variant the payload was encoded with, either 'uu' or 'base64'.
+        payload (bytes): The binary payload.
+        uu_bytes (bytes): The uuencoded payload, after any changes made for the case.
+    """
+    name: str
+    kind: str
+    variant: str
+    payload: bytes
+    uu_bytes: bytes
+
+
+def _payload_size(rng: random.Random, max_size: int) -> int:
+    """
+    A private function to choose a payload size, mostly on either side of a multiple
+    of the 45 bytes in each line.
+    """
+    if rng.random() < 0.75:
+        line_count = rng.randint(0, max(max_size // 45, 1))
+        return max(line_count * 45 + rng.randint(-2, 2), 1)
+
+    return rng.randint(1, max_size)
+
+
+def _change_header(rng: random.Random, uu_bytes: bytes) -> Tuple[str, bytes]:
+    """
+    A private function to rewrite the header line in one of the forms accepted by
+    decoders. Returns a description of the change and the uuencoded data.
+    """
+    header, separator, body = uu_bytes.partition(b'\n')
+    begin_clause = header.split(b' ')[0]
+
+    change = rng.choice(['blank_lines', 'spaces', 'filename_spaces', 'trailing_space'])
+    if change == 'blank_lines':
+        header = b'\n' * rng.randint(1, 3) + header
+    elif change == 'spaces':
+        header = b'  '.join([begin_clause, _PERMISSIONS_MODE.encode('ascii'), b'fuzz.jpg'])
+    elif change == 'filename_spaces':
+        header = b' '.join([begin_clause, _PERMISSIONS_MODE.encode('ascii'), b'fuzz file.jpg'])
+    else:
+        header += b' '
+
+    return change, header + separator + body
+
+
+def _malform(rng: random.Random, uu_bytes: bytes, variant: str) -> Tuple[str, bytes]:
+    """
+    A private function to damage a single line of data. Returns a description of the
+    damage and the uuencoded data.
+    """
+    lines = uu_bytes.split(b'\n')
+
+    # The header and the footer, along with the blank line before the uu footer, are kept
+    data_lines = range(1, len(lines) - (1 if variant == VARIANT_BASE64 else 2))
+    if not data_lines:
+        return 'none', uu_bytes
+
+    index = rng.choice(data_lines)
+    line = lines[index]
+    position = rng.randint(1, max(len(line) - 1, 1))
+
+    damage = rng.choice(['illegal_character', 'trailing_characters', 'truncated', 'blank_line'])
+    if variant == VARIANT_UU:
+        damage = rng.choice([damage, 'long_line'])
+
+    if damage == 'illegal_character':
+        illegal_character = rng.choice(b'abcxyz{|}~\x7f' if variant == VARIANT_UU else b'!*-.:@_')
+        lines[index] = line[:position] + bytes([illegal_character]) + line[position + 1:]
+    elif damage == 'trailing_characters':
+        lines[index] = line + bytes(rng.choice(b'!#$%&') for _ in range(rng.randint(1, 4)))
+    elif damage == 'truncated':
+        lines[index] = line[:position]
+    elif damage == 'long_line':
+        lines[index] = line + b'M' * (62 - len(line) + rng.randint(0, 4))
+    else:
+        lines.insert(index, b'')
+
+    return damage, b'\n'.join(lines)
+
+
+def generate_cases(count: int, seed: int = 0, max_size: int = 16 * 1024) -> List[FuzzCase]:
+    """
+    Generate cases for the differential harness from a seed. Payload sizes are mostly
+    close to a multiple of the line length and each case is either valid, has CRLF
+    line endings, has a header in another accepted form or has a damaged line.
+
+    Args:
+        count (int): The number of cases.
+        seed (int): The seed of the random number generator.
+        max_size (int): The maximum payload size in bytes.
+
+    Returns:
+        List[FuzzCase]: The generated cases.
+    """
+    rng = random.Random(seed)
+
+    cases: List[FuzzCase] = []
+    for index in range(count):
+        size = _payload_size(rng=rng, max_size=max_size)
+        payload = generate_payload(size=size, seed=rng.randrange(2 ** 32))
+        variant = rng.choice([VARIANT_UU, VARIANT_BASE64])
+        uu_bytes = reference_encode(
+            data=payload,
+            full_filename=_FULL_FILENAME,
+            permissions_mode=_PERMISSIONS_MODE,
+            variant=variant
+        )
+
+        kind = _KINDS[index % len(_KINDS)]
+        change = ''
+        if kind == 'crlf':
+            uu_bytes = uu_bytes.replace(b'\n', b'\r\n')
+        elif kind == 'header':
+            change, uu_bytes = _change_header(rng=rng, uu_bytes=uu_bytes)
+        elif kind == 'malformed':
+            change, uu_bytes = _malform(rng=rng, uu_bytes=uu_bytes, variant=variant)
+
+        name = f'{kind}[{variant},size={size}' + (f',{change}]' if change else ']')
+        cases.append(
+            FuzzCase(
+                name=f'{index}:{name}',
+                kind=kind,
+                variant=variant,
+                payload=payload,
+                uu_bytes=uu_bytes
+            )
+        )
+
+    return cases
+
+
+def _decode_to_file(uu_bytes: bytes, strict: bool, directory: Path, stream: bool) -> bytes:
+    """
+    A private function to decode to a file, either from bytes or from a stream, and
+    read the decoded data back.
+    """
+    written_file = decode_to_file(
+        file_object=BytesIO(uu_bytes) if stream else uu_bytes,
+        directory=directory,
+        encoding_validation=False,
+        strict=strict,
+        source_compression=None
+    )
+    try:
+        return written_file.path.read_bytes()
+    finally:
+        written_file.path.unlink()
+
+
+def _decode_all(uu_bytes: bytes, strict: bool) -> bytes:
+    """
+    A private function to decode the single section located by scanning.
+    """
+    decoded_files = decode_all(file_object=uu_bytes, encoding_validation=False, strict=strict)
+    if len(decoded_files) != 1:
+        raise ValueError(f'Expected one section, but found {len(decoded_files)}')
+
+    return decoded_files[0].uu_bytes
+
+
+def _decode_engines(directory: Path) -> Dict[str, Callable[[bytes, bool], bytes]]:
+    """
+    A private function to build every decoding engine, each taking the uuencoded
+    data and whether to decode strictly and returning the decoded data.
+    """
+    return {
+        'decode': lambda uu_bytes, strict: decode(
+            file_object=uu_bytes, encoding_validation=False, strict=strict
+        ).uu_bytes,
+        'decode_parallel': lambda uu_bytes, strict: decode_parallel(
+            file_object=uu_bytes,
+            encoding_validation=False,
+            strict=strict,
+            workers=4,
+            span_length=_SPAN_LENGTH
+        ).uu_bytes,
+        'decode_to_file': partial(_decode_to_file, directory=directory, stream=False),
+        'decode_to_file_stream': partial(_decode_to_file, directory=directory, stream=True),
+        'decode_all': _decode_all
+    }
+
+
+def _encode_to_file(payload: bytes, variant: str, directory: Path) -> bytes:
+    """
+    A private function to encode to a file and read the encoded data back.
+    """
+    written_file = encode_to_file(
+        file_object=payload,
+        directory=directory,
+        filename=_FILENAME,
+        octal_permission=_PERMISSIONS_MODE,
+        extension='jpg',
+        encoding_validation=False,
+        binary_validation=False,
+        variant=variant
+    )
+    try:
+        return written_file.path.read_bytes()
+    finally:
+        written_file.path.unlink()
+
+
+def _encode_engines(directory: Path) -> Dict[str, Callable[[bytes, str], bytes]]:
+    """
+    A private function to build every encoding engine, each taking the payload and
+    the variant and returning the encoded data. The batch only supports classic uu.
+    """
+    options: Dict[str, Any] = dict(
+        filename=_FILENAME,
+        octal_permission=_PERMISSIONS_MODE,
+        extension='jpg',
+        encoding_validation=False,
+        binary_validation=False
+    )
+    return {
+        'encode': lambda payload, variant: encode(
+            file_object=payload, variant=variant, **options
+        ).uu_bytes,
+        'encode_parallel': lambda payload, variant: encode_parallel(
+            file_object=payload, variant=variant, workers=4, span_length=_SPAN_LENGTH, **options
+        ).uu_bytes,
+        'encode_to_file': partial(_encode_to_file, directory=directory),
+        'encode_batch': lambda payload, variant: bytes(
+            encode_batch(
+                buffers=[payload],
+                filename=_FILENAME,
+                octal_permission=_PERMISSIONS_MODE,
+                extension='jpg'
+            ).item(index=0)
+        ).replace(f'{_FILENAME}_0.jpg'.encode('ascii'), _FULL_FILENAME.encode('ascii'), 1)
+    }
+
+
+def _run_engine(function: Callable[[], bytes]) -> Tuple[Optional[bytes], Optional[str], float]:
+    """
+    A private function to time an engine. Returns a tuple containing the output or
+    the error raised, along with the latency in seconds.
+    """
+    start = perf_counter()
+    try:
+        output: Optional[bytes] = bytes(function())
+        error: Optional[str] = None
+    except Exception as exc_info:
+        output, error = None, f'{type(exc_info).__name__}: {exc_info}'
+
+    return output, error, perf_counter() - start
+
+
+def _result(
+    case: FuzzCase,
+    engine: str,
+    strict: Optional[bool],
+    size: int,
+    expected: Optional[bytes],
+    outcome: Tuple[Optional[bytes], Optional[str], float]
+) -> Dict[str, Any]:
+    """
+    A private function to compare the outcome of an engine with the reference. The
+    outcomes match when both produced the same output or both raised an error.
+    """
+    output, error, latency = outcome
+    return {
+        'case': case.name,
+        'kind': case.kind,
+        'variant': case.variant,
+        'engine': engine,
+        'strict': strict,
+        'size': size,
+        'match': output == expected,
+        'error': error,
+        'latency': latency,
+        'throughput_mb_s': size / latency / 1024 ** 2 if latency else None
+    }
+
+
+def run_fuzz(cases: Sequence[FuzzCase]) -> List[Dict[str, Any]]:
+    """
+    Run every encoding and decoding engine on each case and compare the output with
+    the reference codec, recording the latency and throughput of every run so that
+    correctness and speed regressions show up together.
+
+    Valid payloads are encoded by every engine. The uuencoded data of each case is
+    decoded by every engine both strictly and leniently, where the reference either
+    gives the decoded data or raises an error, in which case the engine must also
+    raise an error.
+
+    Args:
+        cases (Sequence[FuzzCase]): The cases to run.
+
+    Returns:
+        List[Dict[str, Any]]: A list of results, one for each case, engine and mode,
+            with a 'match' key that is False for any difference from the reference.
+    """
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as directory:
+        encode_engines = _encode_engines(directory=Path(directory))
+        decode_engines = _decode_engines(directory=Path(directory))
+
+        for case in cases:
+            if case.kind == 'valid':
+                expected_encoding = reference_encode(
+                    data=case.payload,
+                    full_filename=_FULL_FILENAME,
+                    permissions_mode=_PERMISSIONS_MODE,
+                    variant=case.variant
+                )
+                for engine, encode_function in encode_engines.items():
+                    if engine == 'encode_batch' and case.variant != VARIANT_UU:
+                        continue
+
+                    outcome = _run_engine(partial(encode_function, case.payload, case.variant))
+                    results.append(
+                        _result(
+                            case=case,
+                            engine=engine,
+                            strict=None,
+                            size=len(case.payload),
+                            expected=expected_encoding,
+                            outcome=outcome
+                        )
+                    )
+
+            for strict in (True, False):
+                try:
+                    expected: Optional[bytes] = reference_decode(
+                        uu_bytes=case.uu_bytes, strict=strict
+                    )[2]
+                except Exception:
+                    expected = None
+
+                for engine, decode_function in decode_engines.items():
+                    outcome = _run_engine(partial(decode_function, case.uu_bytes, strict))
+                    results.append(
+                        _result(
+                            case=case,
+                            engine=engine,
+                            strict=strict,
+                            size=len(case.uu_bytes),
+                            expected=expected,
+                            outcome=outcome
+                        )
+                    )
+
+    return results
+
+
+def summarize(results: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize the results of the harness by engine.
+
+    Args:
+        results (Sequence[Dict[str, Any]]): The results of run_fuzz.
+
+    Returns:
+        Dict[str, Any]: The number of runs and mismatches, along with the total
+            throughput, of each engine and the names of all mismatched runs.
+    """
+    engines: Dict[str, Dict[str, Any]] = dict()
+    for result in results:
+        summary = engines.setdefault(
+            result['engine'], {'runs': 0, 'mismatches': 0, 'size': 0, 'latency': 0.0}
+        )
+        summary['runs'] += 1
+        summary['mismatches'] += not result['match']
+        summary['size'] += result['size']
+        summary['latency'] += result['latency']
+
+    for summary in engines.values():
+        summary['throughput_mb_s'] = (
+            summary['size'] / summary['latency'] / 1024 ** 2 if summary['latency'] else None
+        )
+
+    return {
+        'engines': engines,
+        'mismatches': [
+            f"{result['case']} {result['engine']} strict={result['strict']}: {result['error']}"
+            for result in results if not result['match']
+        ]
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point for running the differential harness from the command line.
+
+    Args:
+        argv (Sequence[str] | None): Command line arguments, defaults to sys.argv.
+
+    Returns:
+        int: An exit code, 1 if any engine differed from the reference otherwise 0.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m simple_uu.fuzz',
+        description='Compare every engine against the reference codec on generated cases.'
+    )
+    parser.add_argument('--cases', type=int, default=200, help='Number of cases')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for generating cases')
+    parser.add_argument(
+        '--max-size', default=_DEFAULT_MAX_SIZE, help='Maximum payload size, e.g. 16KB'
+    )
+    parser.add_argument(
+        '--output', help='Path to write the JSON results of every run to'
+    )
+    args = parser.parse_args(argv)
+
+    set_logging_mode(mode=LIBRARY_LOGGING)
+
+    cases = generate_cases(
+        count=args.cases, seed=args.seed, max_size=parse_size(size=args.max_size)
+    )
+    results = run_fuzz(cases=cases)
+    if args.output is not None:
+        with open(args.output, 'w') as output_file:
+            output_file.write(json.dumps(results, indent=2))
+
+    summary = summarize(results=results)
+    print(json.dumps(summary, indent=2))
+    return 1 if summary['mismatches'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,254 @@
+import json
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from simple_uu.decode import _decode_lines, _LineCounts, _parse_header_line
+from simple_uu.exceptions import InvalidUUDecodingError
+from simple_uu.utils import VARIANT_UU, open_file_object
+
+# Version of the persisted index format
+_INDEX_VERSION = 1
+
+class _LineRun(NamedTuple):
+    """
+    A private structure describing consecutive lines of equal length that decode to
+    an equal number of bytes, which covers almost every line of a uuencoded file.
+    """
+    line_offset: int
+    line_stride: int
+    line_count: int
+    decoded_offset: int
+    decoded_length: int
+
+
+class UUIndex:
+    """
+    An index mapping byte ranges of decoded data to the lines of uuencoded data that
+    contain them, allowing a range to be decoded without decoding the whole file.
+
+    Lines of equal length are stored as runs, so the index of a typical file only holds
+    a handful of entries regardless of its size.
+
+    Args:
+        header (bytes): The header line of the uuencoded data.
+        runs (List[_LineRun]): Runs of lines in the order they appear.
+        file_object (str | Path | bytes | bytearray | None): The uuencoded data that
+            was indexed, used when reading ranges.
+    """
+    def __init__(
+        self,
+        header: bytes,
+        runs: List[_LineRun],
+        file_object: Optional[Union[str, Path, bytes, bytearray]] = None
+    ):
+        self.header = header
+        self.file_object = file_object
+
+        self._runs = runs
+        self._decoded_offsets = [run.decoded_offset for run in runs]
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'header={self.header!r}, '
+            f'decoded_size={self.decoded_size}, '
+            f'runs={len(self._runs)})'
+        )
+
+    @property
+    def decoded_size(self) -> int:
+        """Size of the decoded data in bytes."""
+        if not self._runs:
+            return 0
+
+        last_run = self._runs[-1]
+        return last_run.decoded_offset + last_run.line_count * last_run.decoded_length
+
+    @classmethod
+    def build(cls, file_object: Union[str, Path, bytes, bytearray]) -> 'UUIndex':
+        """
+        Build an index with a single scan over uuencoded data. Only the length character
+        of each line is inspected, nothing is decoded. As the base64 variant has no
+        length character, only classic uu can be indexed.
+
+        Args:
+            file_object (str | Path | bytes | bytearray): A file object is either a path
+                to a file, bytes or bytearray object. All must contain uuencoded data.
+
+        Returns:
+            UUIndex: A UUIndex instance for the file object.
+        """
+        runs: List[_LineRun] = []
+
+        with open_file_object(file_object=file_object) as uu_encoded_stream:
+            # Offsets are tracked from line lengths, as iteration reads ahead of tell
+            offset = 0
+            header_line: Optional[bytes] = None
+            for line in uu_encoded_stream:
+                offset += len(line)
+                if line.strip(b'\n\r'):
+                    header_line = line.strip(b'\n\r')
+                    break
+
+            if header_line is None:
+                raise InvalidUUDecodingError("There is no content in file, nothing was decoded")
+
+            variant, _, _ = _parse_header_line(header_line=header_line)
+            if variant != VARIANT_UU:
+                raise ValueError('Only classic uuencoded data can be indexed')
+
+            # The current run is held in local variables until it is broken
+            run_line_offset = run_line_stride = run_line_count = 0
+            run_decoded_offset = run_decoded_length = 0
+            decoded_offset = 0
+
+            for line in uu_encoded_stream:
+                line_offset = offset
+                offset += len(line)
+
+                uuencoded_line: bytes = line.rstrip(b'\n\r')
+                if not uuencoded_line or uuencoded_line.startswith(b'end'):
+                    continue
+
+                decoded_length: int = (uuencoded_line[0] - 32) & 63
+                if not decoded_length:
+                    continue
+
+                if (
+                    run_line_count and
+                    len(line) == run_line_stride and
+                    decoded_length == run_decoded_length and
+                    line_offset == run_line_offset + run_line_count * run_line_stride
+                ):
+                    run_line_count += 1
+                else:
+                    if run_line_count:
+                        runs.append(
+                            _LineRun(
+                                run_line_offset,
+                                run_line_stride,
+                                run_line_count,
+                                run_decoded_offset,
+                                run_decoded_length
+                            )
+                        )
+
+                    run_line_offset, run_line_stride, run_line_count = line_offset, len(line), 1
+                    run_decoded_offset, run_decoded_length = decoded_offset, decoded_length
+
+                decoded_offset += decoded_length
+
+            if run_line_count:
+                runs.append(
+                    _LineRun(
+                        run_line_offset,
+                        run_line_stride,
+                        run_line_count,
+                        run_decoded_offset,
+                        run_decoded_length
+                    )
+                )
+
+        return cls(header=header_line, runs=runs, file_object=file_object)
+
+    def read_range(self, offset: int, length: int) -> bytes:
+        """
+        Decode a byte range of the original data, only reading and decoding the lines
+        that cover the range. Ranges extending past the end of the data are truncated.
+
+        Args:
+            offset (int): The offset of the range within the decoded data.
+            length (int): The length of the range in bytes.
+
+        Returns:
+            bytes: The decoded bytes within the range.
+        """
+        if offset < 0 or length < 0:
+            raise ValueError('Offset and length must not be negative')
+
+        if self.file_object is None:
+            raise ValueError('Index does not have a file object to read from')
+
+        range_end = min(offset + length, self.decoded_size)
+        if offset >= range_end:
+            return b''
+
+        decoded_data = bytearray()
+        run_index = bisect_right(self._decoded_offsets, offset) - 1
+        decoded_start: Optional[int] = None
+        position = offset
+
+        with open_file_object(file_object=self.file_object) as uu_encoded_stream:
+            while position < range_end:
+                run = self._runs[run_index]
+
+                # Lines within the run covering the remainder of the range
+                first_line = (position - run.decoded_offset) // run.decoded_length
+                last_line = min(
+                    run.line_count,
+                    -(-(range_end - run.decoded_offset) // run.decoded_length)
+                )
+                if decoded_start is None:
+                    decoded_start = run.decoded_offset + first_line * run.decoded_length
+
+                uu_encoded_stream.seek(run.line_offset + first_line * run.line_stride)
+                uu_encoded_data = uu_encoded_stream.read(
+                    (last_line - first_line) * run.line_stride
+                )
+                lines = [
+                    uu_encoded_data[index:index + run.line_stride]
+                    for index in range(0, len(uu_encoded_data), run.line_stride)
+                ]
+                for decoded_output in _decode_lines(lines=lines, line_counts=_LineCounts()):
+                    decoded_data.extend(decoded_output)
+
+                position = run.decoded_offset + last_line * run.decoded_length
+                run_index += 1
+
+        range_start = offset - (decoded_start or 0)
+        return bytes(decoded_data[range_start:range_start + range_end - offset])
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Persist the index to a path as JSON.
+
+        Args:
+            path (str | Path): A path to the index file as a string or Path object.
+        """
+        index_data: Dict[str, Any] = {
+            'version': _INDEX_VERSION,
+            'header': self.header.decode('latin-1'),
+            'runs': [list(run) for run in self._runs]
+        }
+        Path(path).write_text(json.dumps(index_data))
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        file_object: Optional[Union[str, Path, bytes, bytearray]] = None
+    ) -> 'UUIndex':
+        """
+        Load an index persisted with save.
+
+        Args:
+            path (str | Path): A path to the index file as a string or Path object.
+            file_object (str | Path | bytes | bytearray | None): The uuencoded data that
+                was indexed, used when reading ranges.
+
+        Returns:
+            UUIndex: A UUIndex instance.
+        """
+        index_data: Dict[str, Any] = json.loads(Path(path).read_text())
+        if index_data.get('version') != _INDEX_VERSION:
+            raise ValueError('Unsupported index version')
+
+        return cls(
+            header=index_data['header'].encode('latin-1'),
+            runs=[_LineRun(*run) for run in index_data['runs']],
+            file_object=file_object
+        )
@@ -0,0 +1,194 @@
+from pathlib import Path
+from typing import (BinaryIO, Iterable, List, NamedTuple, Optional, Sequence,
+                    Tuple, Union)
+
+from simple_uu.decode import (_BASE64_CHARACTERS, _MAX_LINE_LENGTH,
+                              _VALID_CHARACTERS, _parse_header_line,
+                              _read_header_line, _StreamPosition,
+                              _track_position)
+from simple_uu.types import UULineError
+from simple_uu.utils import (END_CLAUSES, VARIANT_BASE64, VARIANT_UU,
+                             decompose_filename, open_file_object)
+
+
+class UUInspection(NamedTuple):
+    """
+    Metadata of uuencoded data read from its header, along with the results of a
+    structural scan of the lines that follow if one was run. Nothing is decoded.
+
+    Args:
+        variant (str): The variant of the data, either 'uu' or 'base64'.
+        filename (str | None): The filename from the header without its extension,
+            if the header includes one.
+        file_extension (str | None): The file extension from the header, if included.
+        permissions_mode (str): The Unix permissions mode from the header.
+        decoded_size (int | None): The number of bytes the data decodes to, if scanned.
+            Exact for classic uu, and for the base64 variant when it is well formed.
+        line_count (int | None): The number of lines of data before the end line, if scanned.
+        end_offset (int | None): The offset just after the end line, if scanned and found.
+        line_errors (Sequence[UULineError]): Malformed lines found by the scan, with the
+            same reasons as decoding in lenient mode.
+    """
+    variant: str
+    filename: Optional[str]
+    file_extension: Optional[str]
+    permissions_mode: str
+    decoded_size: Optional[int] = None
+    line_count: Optional[int] = None
+    end_offset: Optional[int] = None
+    line_errors: Sequence[UULineError] = ()
+
+    @property
+    def scanned(self) -> bool:
+        """Whether a structural scan was run."""
+        return self.decoded_size is not None
+
+    @property
+    def valid(self) -> Optional[bool]:
+        """
+        Whether the scan found data, an end line and no malformed lines, or None if
+        no scan was run.
+        """
+        if not self.scanned:
+            return None
+
+        return bool(self.decoded_size) and self.end_offset is not None and not self.line_errors
+
+
+def _scan_lines(
+    lines: Iterable[bytes], first_line_number: int
+) -> Tuple[int, int, bool, List[UULineError]]:
+    """
+    A private function to scan lines of classic uu data up to the end line, summing
+    the length character of each line and checking its structure without decoding
+    it. Returns a tuple containing the decoded size, the number of lines, whether the
+    end line was found and the malformed lines.
+    """
+    decoded_size = 0
+    line_count = 0
+    line_errors: List[UULineError] = []
+
+    for line_number, line in enumerate(lines, start=first_line_number):
+        uuencoded_line: bytes = line.rstrip(b'\n\r')
+
+        if not uuencoded_line:
+            continue
+        elif uuencoded_line.startswith(b'end'):
+            if uuencoded_line.rstrip() == END_CLAUSES[VARIANT_UU]:
+                return decoded_size, line_count, True, line_errors
+            continue
+
+        line_count += 1
+        decoded_size += (uuencoded_line[0] - 32) & 63
+
+        # Number of characters needed for the length given by the length character
+        nbytes: int = (((uuencoded_line[0] - 32) & 63) * 4 + 5) // 3
+        if len(uuencoded_line) > _MAX_LINE_LENGTH:
+            line_errors.append(UULineError(line_number, 'line too long'))
+        elif uuencoded_line[nbytes:].strip(b' `'):
+            line_errors.append(UULineError(line_number, 'trailing characters'))
+
+        if uuencoded_line[:nbytes].translate(None, _VALID_CHARACTERS):
+            line_errors.append(UULineError(line_number, 'illegal characters'))
+
+    return decoded_size, line_count, False, line_errors
+
+
+def _scan_lines_base64(
+    lines: Iterable[bytes], first_line_number: int
+) -> Tuple[int, int, bool, List[UULineError]]:
+    """
+    A private function to scan lines of base64 data up to the '====' line, counting
+    characters and checking them against the alphabet without decoding them. Returns
+    a tuple containing the decoded size, the number of lines, whether the end line was
+    found and the malformed lines.
+    """
+    character_count = 0
+    padding_count = 0
+    line_count = 0
+    line_errors: List[UULineError] = []
+    end_clause = END_CLAUSES[VARIANT_BASE64]
+
+    found_end = False
+    last_line_number = first_line_number
+    for line_number, line in enumerate(lines, start=first_line_number):
+        base64_line: bytes = line.rstrip(b'\n\r')
+
+        if base64_line == end_clause:
+            found_end = True
+            break
+        elif not base64_line:
+            continue
+
+        line_count += 1
+        last_line_number = line_number
+        if base64_line.translate(None, _BASE64_CHARACTERS):
+            line_errors.append(UULineError(line_number, 'illegal characters'))
+
+        character_count += len(base64_line)
+        padding_count = len(base64_line) - len(base64_line.rstrip(b'='))
+
+    if character_count % 4:
+        line_errors.append(UULineError(last_line_number, 'incomplete base64 data'))
+
+    decoded_size = max(character_count * 3 // 4 - padding_count, 0)
+    return decoded_size, line_count, found_end, line_errors
+
+
+def inspect(
+    file_object: Union[str, Path, bytes, bytearray, BinaryIO],
+    scan: bool = False,
+    compression: Optional[str] = None
+) -> UUInspection:
+    """
+    Inspect uuencoded data without decoding it. Only the header is read, which gives
+    the filename, file extension, permissions mode and variant at a constant cost.
+    Neither encoding validation nor file type detection are run, so the extension is
+    the one given in the header.
+
+    If a scan is requested, every line up to the end line is read but not decoded.
+    The length character of each line is summed to give the exact decoded size, and
+    the structure of each line is checked.
+
+    Args:
+        file_object (str | Path | bytes | bytearray | BinaryIO): A file object is either
+            a path to a file, bytes, bytearray or binary stream object.
+        scan (bool): Boolean indicating whether to scan the lines following the header.
+        compression (str | None): The compression format of the data, either 'auto',
+            'gzip', 'bz2', 'xz' or 'zstd'. If not provided, data is read as is.
+
+    Returns:
+        UUInspection: A UUInspection instance with the metadata from the header, and
+            the decoded size, end offset and malformed lines if scanned.
+    """
+    with open_file_object(file_object=file_object, compression=compression) as uu_encoded_stream:
+        position = _StreamPosition()
+        lines = _track_position(lines=uu_encoded_stream, position=position)
+
+        header_line, header_line_number = _read_header_line(lines=lines)
+        variant, permissions_mode, filename_uu = _parse_header_line(header_line=header_line)
+        filename, file_extension = decompose_filename(filename_from_uu=filename_uu)
+
+        if not scan:
+            return UUInspection(
+                variant=variant,
+                filename=filename,
+                file_extension=file_extension,
+                permissions_mode=permissions_mode
+            )
+
+        scan_lines = _scan_lines_base64 if variant == VARIANT_BASE64 else _scan_lines
+        decoded_size, line_count, found_end, line_errors = scan_lines(
+            lines=lines, first_line_number=header_line_number + 1
+        )
+
+        return UUInspection(
+            variant=variant,
+            filename=filename,
+            file_extension=file_extension,
+            permissions_mode=permissions_mode,
+            decoded_size=decoded_size,
+            line_count=line_count,
+            end_offset=position.offset if found_end else None,
+            line_errors=tuple(line_errors)
+        )
@@ -0,0 +1,168 @@
+import argparse
+import json
+import math
+import statistics
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Sequence
+
+from simple_uu.bench import generate_payload, parse_size
+from simple_uu.encode import encode
+from simple_uu.exceptions import UUServiceError
+from simple_uu.logger import LIBRARY_LOGGING, set_logging_mode
+from simple_uu.serve import SERVICE_DECODE, SERVICE_ENCODE, UUClient, UUServer
+
+_COMMANDS = {'encode': SERVICE_ENCODE, 'decode': SERVICE_DECODE}
+
+def _percentile(latencies: Sequence[float], fraction: float) -> float:
+    """
+    A private function to find a percentile of sorted latencies by the nearest rank.
+    """
+    rank = max(math.ceil(fraction * len(latencies)), 1)
+    return latencies[rank - 1]
+
+
+def run_load_test(
+    socket_path: Path,
+    command: str = 'decode',
+    payload_size: int = 64 * 1024,
+    clients: int = 8,
+    requests: int = 1000
+) -> Dict[str, Any]:
+    """
+    Send requests to a running service from many concurrent clients, each with its
+    own connection, and measure the latency of each request.
+
+    Args:
+        socket_path (Path): The path of the Unix domain socket of the service.
+        command (str): The command to send, either 'encode' or 'decode'.
+        payload_size (int): The size of the binary payload in bytes, which is encoded
+            first when decoding.
+        clients (int): The number of concurrent clients.
+        requests (int): The total number of requests, split between the clients.
+
+    Returns:
+        Dict[str, Any]: The requests per second and latency percentiles in seconds.
+    """
+    if command not in _COMMANDS:
+        raise ValueError("Command must be either 'encode' or 'decode'")
+
+    if clients < 1 or requests < 1:
+        raise ValueError('Number of clients and requests must be at least one')
+
+    payload = generate_payload(size=payload_size)
+    if command == 'decode':
+        payload = bytes(encode(file_object=payload, filename='payload').uu_bytes)
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    def _client(request_count: int) -> None:
+        client_latencies: List[float] = []
+        client_errors: List[str] = []
+        with UUClient(socket_path=socket_path) as client:
+            for _ in range(request_count):
+                start = perf_counter()
+                try:
+                    if command == 'encode':
+                        client.encode(data=payload, filename='payload')
+                    else:
+                        client.decode(data=payload)
+                except (UUServiceError, OSError) as exc_info:
+                    client_errors.append(f'{type(exc_info).__name__}: {exc_info}')
+                client_latencies.append(perf_counter() - start)
+
+        with lock:
+            latencies.extend(client_latencies)
+            errors.extend(client_errors)
+
+    # Requests are split as evenly as possible between the clients
+    threads = [
+        threading.Thread(
+            target=_client, args=(requests // clients + (index < requests % clients),)
+        )
+        for index in range(clients)
+    ]
+
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = perf_counter() - start
+
+    latencies.sort()
+    return {
+        'command': command,
+        'payload_size': payload_size,
+        'clients': clients,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'elapsed': elapsed,
+        'requests_per_second': len(latencies) / elapsed if elapsed else None,
+        'latency_mean': statistics.fmean(latencies) if latencies else None,
+        'latency_p50': _percentile(latencies=latencies, fraction=0.5) if latencies else None,
+        'latency_p99': _percentile(latencies=latencies, fraction=0.99) if latencies else None
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point for load testing the service from the command line.
+
+    Args:
+        argv (Sequence[str] | None): Command line arguments, defaults to sys.argv.
+
+    Returns:
+        int: An exit code, 1 if any request failed otherwise 0.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m simple_uu.loadtest',
+        description='Measure the latency and requests per second of the service.'
+    )
+    parser.add_argument(
+        '--socket',
+        help='Path of the socket of a running service, one is started if not provided'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of worker processes when starting a service, defaults to the CPU count'
+    )
+    parser.add_argument('--command', choices=sorted(_COMMANDS), default='decode')
+    parser.add_argument('--size', default='64KB', help='Size of the payload, e.g. 64KB')
+    parser.add_argument(
+        '--clients', type=int, default=8, help='Number of concurrent clients'
+    )
+    parser.add_argument(
+        '--requests', type=int, default=1000, help='Total number of requests'
+    )
+    args = parser.parse_args(argv)
+
+    set_logging_mode(mode=LIBRARY_LOGGING)
+
+    options: Dict[str, Any] = dict(
+        command=args.command,
+        payload_size=parse_size(size=args.size),
+        clients=args.clients,
+        requests=args.requests
+    )
+    if args.socket is not None:
+        results = run_load_test(socket_path=Path(args.socket), **options)
+    else:
+        with tempfile.TemporaryDirectory() as socket_dir:
+            with UUServer(
+                socket_path=Path(socket_dir) / 'simple_uu.sock', workers=args.workers
+            ) as server:
+                results = run_load_test(socket_path=server.socket_path, **options)
+
+    print(json.dumps(results, indent=2))
+    return 1 if results['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
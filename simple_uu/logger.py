@@ -1,35 +1,141 @@
 import logging
+import os
+import threading
+import time
+from typing import Dict, Tuple
+
+# Logging modes supported by the package
+RICH_LOGGING = 'rich'
+LIBRARY_LOGGING = 'library'
+
+# Environment variable that can be used to select the logging mode at import time
+_LOGGING_MODE_ENV = 'SIMPLE_UU_LOGGING'
+
+_PACKAGE_LOGGER_NAME = 'simple_uu'
+
+# Serializes configuration of the package logger, so handlers are never attached twice
+_CONFIGURE_LOCK = threading.Lock()
+
+def _configure_package_logger(mode: str) -> None:
+    """
+    A private function to attach handlers to the package logger based on the logging mode.
+    """
+    package_logger = logging.getLogger(_PACKAGE_LOGGER_NAME)
+
+    for existing_handler in list(package_logger.handlers):
+        package_logger.removeHandler(existing_handler)
+
+    if mode == RICH_LOGGING:
+        # Only import rich when it is actually used
+        from rich.logging import RichHandler
+
+        handler: logging.Handler = RichHandler(rich_tracebacks=True, markup=False)
+        formatter = logging.Formatter("%(name)s - %(message)s")
+        handler.setFormatter(formatter)
+
+        package_logger.setLevel(level=logging.DEBUG)
+        package_logger.propagate = False
+    else:
+        # Library mode defers entirely to the configuration of the host application
+        handler = logging.NullHandler()
+
+        package_logger.setLevel(level=logging.NOTSET)
+        package_logger.propagate = True
+
+    package_logger.addHandler(handler)
+
+
+def set_logging_mode(mode: str) -> None:
+    """
+    Set the logging mode for the package.
+
+    In 'rich' mode (the default) a RichHandler is attached to the package logger and
+    records are not propagated. In 'library' mode a NullHandler is attached and records
+    propagate, so the level and handlers of the host application are respected.
+
+    Args:
+        mode (str): The logging mode, either 'rich' or 'library'.
+    """
+    if mode not in {RICH_LOGGING, LIBRARY_LOGGING}:
+        raise ValueError("Logging mode must be either 'rich' or 'library'")
+
+    with _CONFIGURE_LOCK:
+        _configure_package_logger(mode=mode)
 
-from rich.logging import RichHandler
 
 def set_up_logger(name: str) -> logging.Logger:
     """
     The setup for the package logger. Logger only has streaming capabilities.
 
+    Handlers are only ever attached to the package logger, module loggers propagate
+    to it so that the logging mode can be switched with set_logging_mode.
+
     Args:
         name (str): The name of the module in which the logger resides.
 
     Returns:
         Logger: A Logger instance.
     """
-    root_logger = logging.getLogger('simple_uu')
+    root_logger = logging.getLogger(_PACKAGE_LOGGER_NAME)
 
     if name != root_logger.name:
         logger = root_logger.getChild(name)
     else:
         logger = root_logger
 
-    # Set handler for logger if none exist
-    if not logger.handlers:
-        logger.handlers.clear()
+    # Set handler for package logger if none exist
+    with _CONFIGURE_LOCK:
+        if not root_logger.handlers:
+            _configure_package_logger(
+                mode=os.environ.get(_LOGGING_MODE_ENV, RICH_LOGGING).lower()
+            )
 
-        handler = RichHandler(rich_tracebacks=True, markup=False)
-        formatter = logging.Formatter("%(name)s - %(message)s")
-        handler.setFormatter(formatter)
+    return logger
+
+
+class RateLimitedWarning:
+    """
+    Emits a warning at most once per interval, aggregating the number of suppressed
+    warnings into the next emitted message. Intended for warnings that fire on every
+    call in batch runs.
+
+    Args:
+        logger (Logger): The logger used to emit the warning.
+        interval (float): The minimum number of seconds between emitted warnings.
+    """
+    def __init__(self, logger: logging.Logger, interval: float = 60.0):
+        self.logger = logger
+        self.interval = interval
+
+        self._lock = threading.Lock()
+        self._state: Dict[str, Tuple[float, int]] = dict()
+
+    def warning(self, message: str) -> None:
+        """
+        Emit a warning if the interval for the message has elapsed.
+
+        Args:
+            message (str): The warning message, also used to group suppressed warnings.
+        """
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
 
-        logger.setLevel(level=logging.DEBUG)
+        now = time.monotonic()
+        with self._lock:
+            suppressed = 0
+            state = self._state.get(message)
+            if state is not None:
+                last_emitted, suppressed = state
+                if now - last_emitted < self.interval:
+                    self._state[message] = (last_emitted, suppressed + 1)
+                    return
 
-        logger.addHandler(handler)
-        logger.propagate = False
+            self._state[message] = (now, 0)
 
-    return logger
\ No newline at end of file
+        # Attribute the record to the caller rather than this method
+        if suppressed:
+            self.logger.warning(
+                "%s (%d similar warnings suppressed)", message, suppressed, stacklevel=2
+            )
+        else:
+            self.logger.warning(message, stacklevel=2)
@@ -0,0 +1,320 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+import filetype  # type: ignore[import-untyped]
+
+from simple_uu.budget import MemoryBudget, reservation
+from simple_uu.decode import (_decode_from_charset_normalizer, _LineCounts,
+                              _parse_header_line, _resolve_file_details,
+                              _select_line_decoder, decode)
+from simple_uu.digests import DigestSet
+from simple_uu.encode import (_FOOTERS, _MAX_BINARY_LENGTH, _encode_chunk,
+                              _encode_from_charset_normalizer, _encoded_length,
+                              _file_extension, _header, _permissions_mode,
+                              _resolve_file_extension)
+from simple_uu.exceptions import InvalidUUDecodingError
+from simple_uu.tuning import get_profile
+from simple_uu.types import UUDecodedFile, UUEncodedFile, UULineError
+from simple_uu.utils import (VARIANT_BASE64, VARIANT_UU, load_file_object,
+                             validate_variant)
+
+# Default number of bytes handled by each task, unless the tuning profile sets another
+_DEFAULT_SPAN_LENGTH = 1024 * 1024
+
+def _resolve_settings(workers: Optional[int], span_length: Optional[int]) -> Tuple[int, int]:
+    """
+    A private function to fill in the number of threads and span length when not given,
+    from the tuning profile if it sets them. Returns a tuple containing both.
+    """
+    profile = get_profile()
+    return (
+        workers or profile.workers or os.cpu_count() or 1,
+        span_length if span_length is not None else profile.span_length or _DEFAULT_SPAN_LENGTH
+    )
+
+
+def _find_data_start(content: bytes) -> Tuple[bytes, int, int]:
+    """
+    A private function to find the header line, skipping any excess white space before
+    it. Returns a tuple containing the header line, its line number and the offset of
+    the line after it.
+    """
+    offset = 0
+    header_line_number = 0
+    while offset < len(content):
+        line_end = content.find(b'\n', offset)
+        line_end = len(content) if line_end == -1 else line_end + 1
+
+        header_line_number += 1
+        header_line = content[offset:line_end].strip(b'\n\r')
+        offset = line_end
+
+        if header_line:
+            if offset == len(content):
+                break
+            return header_line, header_line_number, offset
+
+    raise InvalidUUDecodingError("There is no content in file, nothing was decoded")
+
+
+def _split_spans(content: bytes, start: int, span_length: int) -> List[Tuple[int, int]]:
+    """
+    A private function to split data into spans of roughly equal length that each
+    end on a line ending, so that no line is split between spans.
+    """
+    spans: List[Tuple[int, int]] = []
+    while start < len(content):
+        end = content.find(b'\n', min(start + span_length, len(content)) - 1)
+        end = len(content) if end == -1 else end + 1
+
+        spans.append((start, end))
+        start = end
+
+    return spans
+
+
+def _decode_span(
+    span: bytes, strict: bool, first_line_number: int, budget: Optional[MemoryBudget]
+) -> Tuple[bytes, _LineCounts]:
+    """
+    A private function to decode the lines of a single span, reserving memory for the
+    copy of the span and its decoded data. Returns a tuple containing the decoded data
+    and the line counts.
+    """
+    line_counts = _LineCounts()
+    with reservation(budget=budget, nbytes=len(span) * 2):
+        decoded_data = b''.join(
+            _select_line_decoder(
+                lines=BytesIO(span),
+                line_counts=line_counts,
+                strict=strict,
+                first_line_number=first_line_number
+            )
+        )
+    return decoded_data, line_counts
+
+
+def _encode_span(
+    span: bytes, variant: str, budget: Optional[MemoryBudget]
+) -> bytes:
+    """
+    A private function to encode a single span, reserving memory for its encoded data.
+    """
+    with reservation(budget=budget, nbytes=_encoded_length(binary_length=len(span))):
+        return _encode_chunk(chunk=span, variant=variant)
+
+
+def decode_parallel(
+    file_object: Union[str, Path, bytes, bytearray],
+    encoding_validation: bool = True,
+    strict: bool = True,
+    digests: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    span_length: Optional[int] = None,
+    budget: Optional[MemoryBudget] = None
+) -> UUDecodedFile:
+    """
+    Decode a file from a uuencoded format, splitting the lines into spans that are
+    decoded by a pool of threads. The result is identical to that of decode, including
+    any line errors and the error raised for the first malformed line.
+
+    As binascii holds the global interpreter lock, spans are only decoded in parallel
+    on free-threaded builds of Python, on other builds this is no faster than decode.
+    The base64 variant is decoded in large blocks by decode, which is already fast.
+
+    Args:
+        file_object (str | Path | bytes | bytearray): A file object is either a path
+            to a file, bytes or bytearray object. All must contain uuencoded data.
+        encoding_validation (bool): Boolean indicating whether to run encoding validation.
+        strict (bool): Boolean indicating whether a malformed line raises an error. If
+            False, malformed lines are repaired and recorded in line_errors instead.
+        digests (Iterable[str] | None): Names of digest algorithms (e.g., 'crc32', 'sha256')
+            to compute over the decoded data.
+        workers (int | None): The number of threads, defaults to that of the tuning
+            profile or else the number of CPUs.
+        span_length (int | None): The number of bytes of uuencoded data decoded by each
+            task, defaults to that of the tuning profile or else 1MB.
+        budget (MemoryBudget | None): A memory budget each task reserves its buffers from,
+            defaults to the budget of the process if one is set.
+
+    Returns:
+        UUDecodedFile: A UUDecodedFile instance providing the decoded data along with
+            a number of attributes, properties, and methods.
+    """
+    workers, span_length = _resolve_settings(workers=workers, span_length=span_length)
+    if span_length <= 0:
+        raise ValueError('Span length must be a positive number of bytes')
+
+    content: bytes = load_file_object(file_object=file_object)
+    _decode_from_charset_normalizer(content=content, encoding_validation=encoding_validation)
+
+    header_line, header_line_number, data_start = _find_data_start(content=content)
+    variant, permissions_mode, filename_uu = _parse_header_line(header_line=header_line)
+
+    spans = _split_spans(content=content, start=data_start, span_length=span_length)
+    if variant == VARIANT_BASE64 or workers <= 1 or len(spans) <= 1:
+        return decode(
+            file_object=content,
+            encoding_validation=False,
+            strict=strict,
+            digests=digests,
+            budget=budget
+        )
+
+    # Line numbers are counted up front so that each span can report its line errors
+    first_line_numbers: List[int] = []
+    line_number = header_line_number + 1
+    for start, end in spans:
+        first_line_numbers.append(line_number)
+        line_number += content.count(b'\n', start, end)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                lambda span, first_line_number: _decode_span(
+                    span=content[span[0]:span[1]],
+                    strict=strict,
+                    first_line_number=first_line_number,
+                    budget=budget
+                ),
+                spans,
+                first_line_numbers
+            )
+        )
+
+    binary_data = b''.join(decoded_data for decoded_data, _ in results)
+    line_errors: List[UULineError] = [
+        line_error for _, line_counts in results for line_error in line_counts.line_errors
+    ]
+
+    # Raise error if there was nothing was decoded
+    if not binary_data:
+        raise InvalidUUDecodingError(
+            "Apart from header there is no content in file, nothing was decoded"
+        )
+
+    filename, file_extension, file_mime_type = _resolve_file_details(
+        filename_uu=filename_uu, head=binary_data
+    )
+
+    # Structure all related variables in a UUDecodedFile instance
+    decoded_file = UUDecodedFile(
+        filename=filename,
+        permissions_mode=permissions_mode,
+        file_mime_type=file_mime_type,
+        file_extension=file_extension
+    )
+    decoded_file.uu_bytes = binary_data
+    decoded_file.line_errors = line_errors
+    if digests is not None:
+        digest_set = DigestSet(names=digests)
+        digest_set.update(binary_data)
+        decoded_file.digests = digest_set.hexdigests()
+
+    return decoded_file
+
+
+def encode_parallel(
+    file_object: Union[str, Path, bytes, bytearray],
+    filename: str,
+    octal_permission: Optional[Union[str, int]] = None,
+    extension: Optional[str] = None,
+    encoding_validation: bool = True,
+    binary_validation: bool = True,
+    digests: Optional[Iterable[str]] = None,
+    variant: str = VARIANT_UU,
+    workers: Optional[int] = None,
+    span_length: Optional[int] = None,
+    budget: Optional[MemoryBudget] = None
+) -> UUEncodedFile:
+    """
+    Encode binary data into a uuencoded format, splitting the data into spans of whole
+    lines that are encoded by a pool of threads. The result is identical to that of
+    encode.
+
+    As binascii holds the global interpreter lock, spans are only encoded in parallel
+    on free-threaded builds of Python, on other builds this is no faster than encode.
+
+    Args:
+        file_object (str | Path | bytes | bytearray): A file object is either a path
+            to a file, bytes object or bytearray object. All must contain binary data.
+        filename (str): The name of the file being encoded.
+        octal_permission (str | int | None): An octal permission as a string or integer.
+        extension (str | None): An extension for the file being encoded.
+        encoding_validation (bool): Boolean indicating whether to run encoding validation.
+        binary_validation (bool): Boolean indicating whether to run binary validation.
+        digests (Iterable[str] | None): Names of digest algorithms (e.g., 'crc32', 'sha256')
+            to compute over the binary data.
+        variant (str): The variant to encode with, either 'uu' or 'base64'.
+        workers (int | None): The number of threads, defaults to that of the tuning
+            profile or else the number of CPUs.
+        span_length (int | None): The number of bytes of binary data encoded by each task,
+            rounded down to a whole number of lines. Defaults to that of the tuning
+            profile or else 1MB.
+        budget (MemoryBudget | None): A memory budget each task reserves its buffers from,
+            defaults to the budget of the process if one is set.
+
+    Returns:
+        UUEncodedFile: A UUEncodedFile instance providing the encoded data along with
+            a number of attributes, properties, and methods.
+    """
+    workers, span_length = _resolve_settings(workers=workers, span_length=span_length)
+    if span_length < _MAX_BINARY_LENGTH:
+        raise ValueError('Span length must be at least the length of a line')
+
+    validate_variant(variant=variant)
+    filename = '_'.join(item for item in filename.split())
+    permissions_mode = _permissions_mode(octal_permission=octal_permission)
+    file_extension = _file_extension(extension=extension)
+
+    content: bytes = load_file_object(file_object=file_object)
+    _encode_from_charset_normalizer(
+        content=content,
+        encoding_validation=encoding_validation,
+        binary_validation=binary_validation
+    )
+
+    file_mime_type_from_detection: Optional[str] = filetype.guess_mime(content)
+    file_extension_final: str = _resolve_file_extension(
+        file_extension=file_extension,
+        file_extension_from_detection=filetype.guess_extension(content)
+    )
+
+    # Spans hold whole lines, so encoded spans join into the same lines as encode
+    span_length -= span_length % _MAX_BINARY_LENGTH
+    span_starts = range(0, len(content), span_length)
+
+    binary_data = bytearray(
+        _header(
+            permissions_mode=permissions_mode,
+            full_filename=filename + '.' + file_extension_final,
+            variant=variant
+        )
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for encoded_span in executor.map(
+            lambda start: _encode_span(
+                span=content[start:start + span_length], variant=variant, budget=budget
+            ),
+            span_starts
+        ):
+            binary_data.extend(encoded_span)
+    binary_data.extend(_FOOTERS[variant])
+
+    # Structure all related variables in a UUEncodedFile instance
+    encoded_file = UUEncodedFile(
+        filename=filename,
+        permissions_mode=permissions_mode,
+        file_mime_type=file_mime_type_from_detection,
+        file_extension=file_extension_final
+    )
+    encoded_file.uu_bytes = binary_data
+    if digests is not None:
+        digest_set = DigestSet(names=digests)
+        digest_set.update(content)
+        encoded_file.digests = digest_set.hexdigests()
+
+    return encoded_file
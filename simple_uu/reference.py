@@ -0,0 +1,224 @@
+from typing import List, Tuple
+
+from simple_uu.exceptions import InvalidUUDecodingError
+from simple_uu.utils import (BEGIN_CLAUSES, END_CLAUSES, VARIANT_BASE64,
+                             VARIANT_UU)
+
+# Number of bytes of binary data in each line
+_LINE_LENGTH = 45
+
+# Maximum line length of classic uu, including the length character
+_MAX_LINE_LENGTH = 61
+
+# Alphabet of the base64 variant, the padding character is handled separately
+_BASE64_ALPHABET = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+_BASE64_VALUES = {character: value for value, character in enumerate(_BASE64_ALPHABET)}
+
+# Variant of each begin clause accepted in a header
+_VARIANTS = {begin_clause: variant for variant, begin_clause in BEGIN_CLAUSES.items()}
+
+
+def _uu_character(value: int) -> int:
+    """
+    A private function to map six bits to a character of classic uu, where zero
+    is written as a space.
+    """
+    return 32 + value
+
+
+def _uu_value(character: int, strict: bool) -> int:
+    """
+    A private function to map a character of classic uu to six bits. Line endings
+    represent zero bits, as do illegal characters when not strict.
+    """
+    if character in b'\n\r':
+        return 0
+    elif 32 <= character <= 96:
+        return (character - 32) & 63
+    elif strict:
+        raise InvalidUUDecodingError(
+            "Invalid ascii character, characters should have ascii codes ranging from 32 to 96"
+        )
+    else:
+        return 0
+
+
+def _encode_uu_line(line: bytes) -> bytes:
+    """
+    A private function to encode up to 45 bytes of binary data as a line of classic uu.
+    """
+    characters = bytearray([_uu_character(len(line))])
+    for index in range(0, len(line), 3):
+        group = line[index:index + 3].ljust(3, b'\x00')
+        bits = (group[0] << 16) | (group[1] << 8) | group[2]
+        characters.extend(_uu_character((bits >> shift) & 63) for shift in (18, 12, 6, 0))
+
+    return bytes(characters) + b'\n'
+
+
+def _encode_base64_line(line: bytes) -> bytes:
+    """
+    A private function to encode up to 45 bytes of binary data as a line of base64.
+    """
+    characters = bytearray()
+    for index in range(0, len(line), 3):
+        group = line[index:index + 3]
+        bits = int.from_bytes(group.ljust(3, b'\x00'), 'big')
+        quantum = bytes(_BASE64_ALPHABET[(bits >> shift) & 63] for shift in (18, 12, 6, 0))
+        characters.extend(quantum[:len(group) + 1].ljust(4, b'='))
+
+    return bytes(characters) + b'\n'
+
+
+def reference_encode(
+    data: bytes, full_filename: str, permissions_mode: str = '644', variant: str = VARIANT_UU
+) -> bytes:
+    """
+    Encode binary data one bit group at a time without binascii, as a reference that
+    faster engines are checked against. The output has the same layout as encode,
+    a header, a line for every 45 bytes and the footer of the variant.
+
+    Args:
+        data (bytes): The binary data to encode.
+        full_filename (str): The filename, including its extension, for the header.
+        permissions_mode (str): The permissions mode for the header, such as '644'.
+        variant (str): The variant to encode with, either 'uu' or 'base64'.
+
+    Returns:
+        bytes: The uuencoded data.
+    """
+    if variant not in BEGIN_CLAUSES:
+        raise ValueError("Variant must be either 'uu' or 'base64'")
+
+    encode_line = _encode_base64_line if variant == VARIANT_BASE64 else _encode_uu_line
+    lines: List[bytes] = [
+        encode_line(data[index:index + _LINE_LENGTH])
+        for index in range(0, len(data), _LINE_LENGTH)
+    ]
+    header = BEGIN_CLAUSES[variant] + f' {permissions_mode} {full_filename}\n'.encode('ascii')
+    footer = b'\nend' if variant == VARIANT_UU else END_CLAUSES[variant]
+    return header + b''.join(lines) + footer
+
+
+def _decode_uu_line(line: bytes, strict: bool) -> bytes:
+    """
+    A private function to decode a line of classic uu. The length character gives
+    the number of bytes, missing characters are zero bits and any characters beyond
+    those needed are ignored. When not strict, an illegal length character gives an
+    empty line.
+    """
+    if strict and len(line) > _MAX_LINE_LENGTH:
+        raise InvalidUUDecodingError(
+            f"Length of {len(line)} is larger than the maximum allowed for a line of uuencoded data"
+        )
+
+    length_character = line[0]
+    if not strict and not 32 <= length_character <= 96:
+        return b''
+
+    length = (length_character - 32) & 63
+    characters = line[1:1 + (length * 4 + 2) // 3].ljust((length + 2) // 3 * 4, b' ')
+
+    decoded = bytearray()
+    for index in range(0, len(characters), 4):
+        bits = 0
+        for character in characters[index:index + 4]:
+            bits = (bits << 6) | _uu_value(character=character, strict=strict)
+        decoded.extend(bits.to_bytes(3, 'big'))
+
+    return bytes(decoded[:length])
+
+
+def _decode_uu(lines: List[bytes], strict: bool) -> bytes:
+    """
+    A private function to decode the lines of classic uu up to the end line.
+    """
+    decoded = bytearray()
+    for line in lines:
+        if line.strip() == END_CLAUSES[VARIANT_UU]:
+            break
+        elif line:
+            decoded.extend(_decode_uu_line(line=line, strict=strict))
+
+    return bytes(decoded)
+
+
+def _decode_base64(lines: List[bytes], strict: bool) -> bytes:
+    """
+    A private function to decode the lines of base64 up to the '====' line. When
+    strict, every character must be in the alphabet and padding may only end the
+    data. Otherwise other characters are dropped and decoding stops at padding.
+    """
+    characters = bytearray()
+    for line in lines:
+        if line == END_CLAUSES[VARIANT_BASE64]:
+            break
+        characters.extend(line)
+
+    padding_start = characters.find(b'=')
+    if padding_start == -1:
+        padding_start = len(characters)
+
+    if strict:
+        padding = characters[padding_start:]
+        if (
+            len(characters) % 4
+            or padding != b'=' * len(padding)
+            or len(padding) > 2
+            or any(character not in _BASE64_VALUES for character in characters[:padding_start])
+        ):
+            raise InvalidUUDecodingError('Invalid base64 data')
+
+    values = [
+        _BASE64_VALUES[character] for character in characters[:padding_start]
+        if character in _BASE64_VALUES
+    ]
+
+    # Characters are decoded as a stream of six bit values, incomplete bytes are dropped
+    bits = 0
+    for value in values:
+        bits = (bits << 6) | value
+    byte_count = len(values) * 6 // 8
+    return (bits >> (len(values) * 6 - byte_count * 8)).to_bytes(byte_count, 'big')
+
+
+def reference_decode(uu_bytes: bytes, strict: bool = True) -> Tuple[str, bytes, bytes]:
+    """
+    Decode uuencoded data one character at a time without binascii, as a reference
+    that faster engines are checked against. Blank lines before the header and
+    between lines of data are skipped and lines may end with a carriage return.
+
+    When strict, a line of classic uu longer than 61 characters or with an illegal
+    character among those it needs raises an error, and characters beyond those
+    needed are ignored. When not strict, illegal characters are zero bits. Base64
+    data is checked as a whole.
+
+    Args:
+        uu_bytes (bytes): The uuencoded data.
+        strict (bool): Boolean indicating whether a malformed line raises an error.
+
+    Returns:
+        Tuple[str, bytes, bytes]: The variant, the permissions mode from the header
+            and the decoded data.
+    """
+    lines = [line.rstrip(b'\r') for line in uu_bytes.split(b'\n')]
+    while lines and not lines[0].strip():
+        lines.pop(0)
+
+    header_items = lines[0].split() if lines else []
+    variant = _VARIANTS.get(header_items[0]) if header_items else None
+    if variant is None:
+        raise InvalidUUDecodingError("Missing 'begin' section of header at start of file")
+
+    permissions_mode = header_items[1] if len(header_items) > 1 else b''
+    if variant == VARIANT_BASE64:
+        data = _decode_base64(lines=[line for line in lines[1:] if line], strict=strict)
+    else:
+        data = _decode_uu(lines=lines[1:], strict=strict)
+
+    if not data:
+        raise InvalidUUDecodingError(
+            "Apart from header there is no content in file, nothing was decoded"
+        )
+
+    return variant, permissions_mode, data
@@ -0,0 +1,336 @@
+import mmap
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from simple_uu.budget import MemoryBudget
+from simple_uu.decode import _parse_permissions_mode, decode
+from simple_uu.exceptions import InvalidPermissionsMode
+from simple_uu.types import UUDecodedFile
+from simple_uu.utils import BEGIN_CLAUSES, END_CLAUSES, parse_header
+
+# Start of the header line of each variant, with the space that follows the begin clause
+_HEADER_STARTS: Dict[str, bytes] = {
+    variant: begin_clause + b' ' for variant, begin_clause in BEGIN_CLAUSES.items()
+}
+
+# Permissions mode of a header line, as written by uuencode
+_PERMISSIONS_MODE = re.compile(rb'[0-7]{3,4}')
+
+# Any buffer supporting find and slicing can be scanned
+_Buffer = Union[bytes, bytearray, mmap.mmap]
+
+class UUBlock(NamedTuple):
+    """
+    Location of a single begin/end section within a larger buffer.
+
+    Args:
+        offset (int): The offset of the header line within the buffer.
+        length (int): The length of the section, including the header and end lines.
+        header (bytes): The header line of the section.
+    """
+    offset: int
+    length: int
+    header: bytes
+
+
+def _find_line_start(buffer: _Buffer, needle: bytes, start: int) -> int:
+    """
+    A private function to find the next occurrence of a needle at the start of a line.
+    Returns -1 if there are no more occurrences.
+    """
+    while True:
+        index = buffer.find(needle, start)
+        if index <= 0 or buffer[index - 1] == ord('\n'):
+            return index
+
+        start = index + 1
+
+
+def _find_end_line(buffer: _Buffer, start: int, end_clause: bytes) -> int:
+    """
+    A private function to find the offset just after the next end line, such as 'end'
+    or '====', including its line ending. Returns -1 if there is no end line.
+    """
+    while True:
+        index = _find_line_start(buffer=buffer, needle=end_clause, start=start)
+        if index == -1:
+            return -1
+
+        line_end = buffer.find(b'\n', index)
+        if line_end == -1:
+            line_end = len(buffer)
+
+        # The end line must only contain the end clause, as data lines can also start with it
+        if buffer[index:line_end].rstrip() == end_clause:
+            return min(line_end + 1, len(buffer))
+
+        start = line_end
+
+
+def _is_header(header_line: bytes) -> bool:
+    """
+    A private function to check that a line starting with a begin clause is a header,
+    with a permissions mode followed by a filename, rather than text such as
+    'begin the meeting at noon'. The permissions mode must also be one that decoding
+    accepts, so every section found can be decoded.
+    """
+    _, permissions_mode_uu, filename_uu = parse_header(header=header_line)
+    if (
+        permissions_mode_uu is None or
+        _PERMISSIONS_MODE.fullmatch(permissions_mode_uu) is None or
+        filename_uu is None
+    ):
+        return False
+
+    try:
+        _ = _parse_permissions_mode(permissions_mode_uu=permissions_mode_uu)
+    except InvalidPermissionsMode:
+        return False
+
+    return True
+
+
+@contextmanager
+def _open_buffer(file_object: Union[str, Path, bytes, bytearray]) -> Iterator[_Buffer]:
+    """
+    A private function to provide a buffer for a file object. Paths are memory-mapped
+    rather than read into memory.
+    """
+    if isinstance(file_object, (bytes, bytearray)):
+        yield file_object
+        return
+
+    if not isinstance(file_object, (str, Path)):
+        message_core = 'Expected a string, Path, bytes, or bytearray object'
+        raise TypeError(f"{message_core}, but got {type(file_object).__name__}")
+
+    if not os.path.isfile(file_object):
+        raise FileNotFoundError("File path is not valid")
+
+    # An empty file cannot be memory-mapped
+    if not os.path.getsize(file_object):
+        yield b''
+        return
+
+    with open(file_object, 'rb') as uu_file, mmap.mmap(
+        uu_file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        yield buffer
+
+
+def iter_scan(buffer: _Buffer) -> Iterator[UUBlock]:
+    """
+    Lazily locate every begin/end section within a buffer using substring search,
+    without iterating through each line of text. Sections of classic uu end with an
+    'end' line and sections of the base64 variant, which start with 'begin-base64',
+    end with a '====' line. A section without an end line extends to the end of the
+    buffer. Lines starting with a begin clause are only taken as a header when they
+    carry a permissions mode and a filename.
+
+    Args:
+        buffer (bytes | bytearray | mmap): A buffer containing uuencoded sections
+            mixed with other text.
+
+    Yields:
+        UUBlock: The location and header of each section, in order.
+    """
+    # The next header of each variant is only searched for again once it has been passed,
+    # so a variant that does not appear is only searched for once
+    next_headers: Dict[str, int] = dict()
+
+    position = 0
+    while True:
+        for variant, header_start in _HEADER_STARTS.items():
+            next_offset = next_headers.get(variant)
+            if next_offset is None or -1 < next_offset < position:
+                next_headers[variant] = _find_line_start(
+                    buffer=buffer, needle=header_start, start=position
+                )
+
+        found_headers = [
+            (offset, variant) for variant, offset in next_headers.items() if offset != -1
+        ]
+        if not found_headers:
+            return
+
+        offset, variant = min(found_headers)
+        header_end = buffer.find(b'\n', offset)
+        if header_end == -1:
+            header_end = len(buffer)
+
+        # Text that only starts like a header is passed over
+        header_line = bytes(buffer[offset:header_end]).rstrip(b'\r')
+        if not _is_header(header_line=header_line):
+            position = header_end
+            continue
+
+        block_end = _find_end_line(
+            buffer=buffer, start=header_end, end_clause=END_CLAUSES[variant]
+        )
+        if block_end == -1:
+            block_end = len(buffer)
+
+        yield UUBlock(
+            offset=offset,
+            length=block_end - offset,
+            header=header_line
+        )
+        position = block_end
+
+
+def scan(file_object: Union[str, Path, bytes, bytearray]) -> List[UUBlock]:
+    """
+    Locate every begin/end section within a file object, such as a mailbox export
+    where many uuencoded files are mixed with other text.
+
+    Args:
+        file_object (str | Path | bytes | bytearray): A file object is either a path
+            to a file, bytes or bytearray object.
+
+    Returns:
+        List[UUBlock]: An index of the offset, length and header of each section.
+    """
+    with _open_buffer(file_object=file_object) as buffer:
+        return list(iter_scan(buffer=buffer))
+
+
+def decode_block(
+    buffer: _Buffer,
+    block: UUBlock,
+    encoding_validation: bool = True,
+    strict: bool = True,
+    digests: Optional[Iterable[str]] = None,
+    budget: Optional[MemoryBudget] = None
+) -> UUDecodedFile:
+    """
+    Decode a single section of a buffer located by scan.
+
+    Args:
+        buffer (bytes | bytearray | mmap): The buffer that was scanned.
+        block (UUBlock): The location of the section to decode.
+        encoding_validation (bool): Boolean indicating whether to run encoding validation.
+        strict (bool): Boolean indicating whether a malformed line raises an error. If
+            False, malformed lines are repaired and recorded in line_errors instead.
+        digests (Iterable[str] | None): Names of digest algorithms (e.g., 'crc32', 'sha256')
+            to compute over the decoded data as it is decoded.
+        budget (MemoryBudget | None): A memory budget the decoded data is reserved from,
+            defaults to the budget of the process if one is set.
+
+    Returns:
+        UUDecodedFile: A UUDecodedFile instance providing the decoded data.
+    """
+    return decode(
+        file_object=bytes(buffer[block.offset:block.offset + block.length]),
+        encoding_validation=encoding_validation,
+        strict=strict,
+        digests=digests,
+        budget=budget
+    )
+
+
+def decode_all(
+    file_object: Union[str, Path, bytes, bytearray],
+    encoding_validation: bool = True,
+    strict: bool = True,
+    workers: Optional[int] = None,
+    digests: Optional[Iterable[str]] = None,
+    budget: Optional[MemoryBudget] = None
+) -> List[UUDecodedFile]:
+    """
+    Locate and decode every begin/end section within a file object. Encoding
+    validation is run on each section rather than on the whole file object.
+
+    Args:
+        file_object (str | Path | bytes | bytearray): A file object is either a path
+            to a file, bytes or bytearray object.
+        encoding_validation (bool): Boolean indicating whether to run encoding validation.
+        strict (bool): Boolean indicating whether a malformed line raises an error. If
+            False, malformed lines are repaired and recorded in line_errors instead.
+        workers (int | None): The number of threads used to decode sections in parallel.
+            If not provided, sections are decoded sequentially.
+        digests (Iterable[str] | None): Names of digest algorithms (e.g., 'crc32', 'sha256')
+            to compute over the decoded data of each section.
+        budget (MemoryBudget | None): A memory budget the decoded data of each section is
+            reserved from, which limits the sections in flight when decoding in parallel.
+            Defaults to the budget of the process if one is set.
+
+    Returns:
+        List[UUDecodedFile]: A UUDecodedFile instance for each section, in order.
+    """
+    # Names are materialized as they are shared between sections
+    if digests is not None:
+        digests = list(digests)
+
+    with _open_buffer(file_object=file_object) as buffer:
+        blocks: List[UUBlock] = list(iter_scan(buffer=buffer))
+
+        if workers is None or workers <= 1 or len(blocks) <= 1:
+            return [
+                decode_block(
+                    buffer=buffer,
+                    block=block,
+                    encoding_validation=encoding_validation,
+                    strict=strict,
+                    digests=digests,
+                    budget=budget
+                )
+                for block in blocks
+            ]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda block: decode_block(
+                        buffer=buffer,
+                        block=block,
+                        encoding_validation=encoding_validation,
+                        strict=strict,
+                        digests=digests,
+                        budget=budget
+                    ),
+                    blocks
+                )
+            )
+
+
+def iter_blocks(
+    file_object: Union[str, Path, bytes, bytearray],
+    encoding_validation: bool = True,
+    strict: bool = True,
+    digests: Optional[Iterable[str]] = None
+) -> Iterator[UUDecodedFile]:
+    """
+    Lazily locate and decode every begin/end section within a file object. Paths are
+    memory-mapped rather than read into memory, each section is only decoded when the
+    consumer asks for it and no reference to a section is kept once it has been yielded.
+    Encoding validation is run on each section rather than on the whole file.
+
+    Args:
+        file_object (str | Path | bytes | bytearray): A file object is either a path
+            to a file, bytes or bytearray object.
+        encoding_validation (bool): Boolean indicating whether to run encoding validation.
+        strict (bool): Boolean indicating whether a malformed line raises an error. If
+            False, malformed lines are repaired and recorded in line_errors instead.
+        digests (Iterable[str] | None): Names of digest algorithms (e.g., 'crc32', 'sha256')
+            to compute over the decoded data of each section.
+
+    Yields:
+        UUDecodedFile: A UUDecodedFile instance for each section, in order.
+    """
+    # Names are materialized as they are shared between sections
+    if digests is not None:
+        digests = list(digests)
+
+    with _open_buffer(file_object=file_object) as buffer:
+        for block in iter_scan(buffer=buffer):
+            yield decode_block(
+                buffer=buffer,
+                block=block,
+                encoding_validation=encoding_validation,
+                strict=strict,
+                digests=digests
+            )
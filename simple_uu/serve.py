@@ -0,0 +1,524 @@
+import io
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import stat
+import struct
+import threading
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union, cast
+
+from simple_uu.decode import _decode_to_sink
+from simple_uu.encode import (_encode_to_sink, _file_extension,
+                              _permissions_mode)
+from simple_uu.exceptions import UUServiceError
+from simple_uu.logger import LIBRARY_LOGGING, set_logging_mode
+from simple_uu.utils import VARIANT_UU, validate_variant
+
+# Commands accepted by the service
+SERVICE_ENCODE = b'E'
+SERVICE_DECODE = b'D'
+
+# Status sent in the trailer of each response
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+# A request starts with a command and the length of its JSON options
+_REQUEST_HEADER = struct.Struct('!cI')
+
+# Bodies are sent as chunks, each prefixed with its length and ended by an empty chunk
+_CHUNK_HEADER = struct.Struct('!I')
+
+# A response ends with a status and the length of its JSON metadata
+_TRAILER = struct.Struct('!BI')
+
+# Length of the chunks sent by the service and the client
+_CHUNK_LENGTH = 64 * 1024
+
+# Unix domain sockets are not available on every platform, such as Windows
+UNIX_SOCKETS_SUPPORTED = hasattr(socket, 'AF_UNIX')
+
+# Number of seconds between each check that the workers are still running
+_SUPERVISE_INTERVAL = 1.0
+
+def _read_exact(stream: BinaryIO, length: int) -> bytes:
+    """
+    A private function to read an exact number of bytes from a stream, raising an
+    error if the connection is closed first.
+    """
+    data = stream.read(length)
+    if len(data) != length:
+        raise ConnectionError('Connection closed in the middle of a frame')
+
+    return data
+
+
+class _ChunkReader(io.RawIOBase):
+    """
+    A private raw stream reading the body of a frame from a connection, which ends at
+    the first empty chunk.
+    """
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._remaining = 0
+        self._finished = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if self._finished:
+            return 0
+
+        if not self._remaining:
+            (self._remaining,) = _CHUNK_HEADER.unpack(
+                _read_exact(stream=self._stream, length=_CHUNK_HEADER.size)
+            )
+            if not self._remaining:
+                self._finished = True
+                return 0
+
+        data = self._stream.read(min(len(buffer), self._remaining))
+        if not data:
+            raise ConnectionError('Connection closed in the middle of a frame')
+
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+    def drain(self) -> None:
+        """Read and discard the rest of the body, so the next frame can be read."""
+        while self.read(_CHUNK_LENGTH):
+            pass
+
+
+class _ChunkWriter:
+    """
+    A private sink writing the body of a frame to a connection, buffering writes into
+    chunks. Closing the writer sends the empty chunk that ends the body.
+    """
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._buffer = bytearray()
+
+    def _send_chunk(self, chunk: Union[bytes, bytearray]) -> None:
+        self._stream.write(_CHUNK_HEADER.pack(len(chunk)))
+        self._stream.write(chunk)
+
+    def write(self, data: bytes, /) -> int:
+        self._buffer += data
+        if len(self._buffer) >= _CHUNK_LENGTH:
+            self._send_chunk(chunk=self._buffer)
+            self._buffer.clear()
+
+        return len(data)
+
+    def close(self) -> None:
+        if self._buffer:
+            self._send_chunk(chunk=self._buffer)
+            self._buffer.clear()
+
+        self._send_chunk(chunk=b'')
+
+
+def _run_request(
+    command: bytes, options: Dict[str, Any], source: BinaryIO, sink: _ChunkWriter
+) -> Dict[str, Any]:
+    """
+    A private function to stream the body of a request through the codec into the
+    body of the response, returning the metadata sent in the trailer.
+    """
+    if command == SERVICE_ENCODE:
+        validate_variant(variant=options.get('variant', VARIANT_UU))
+        filename = '_'.join(str(options.get('filename', 'payload')).split())
+        file_mime_type, file_extension, bytes_written = _encode_to_sink(
+            binary_stream=source,
+            sink=sink,
+            filename=filename,
+            permissions_mode=_permissions_mode(
+                octal_permission=options.get('octal_permission')
+            ),
+            file_extension=_file_extension(extension=options.get('extension')),
+            encoding_validation=options.get('encoding_validation', True),
+            binary_validation=options.get('binary_validation', True),
+            digest_set=None,
+            stats=None,
+            variant=options.get('variant', VARIANT_UU)
+        )
+        return {
+            'filename': filename,
+            'file_mime_type': file_mime_type,
+            'file_extension': file_extension,
+            'bytes_out': bytes_written
+        }
+    elif command == SERVICE_DECODE:
+        permissions_mode, filename_uu, bytes_written = _decode_to_sink(
+            binary_stream=source,
+            sink=cast(BinaryIO, sink),
+            encoding_validation=options.get('encoding_validation', True),
+            strict=options.get('strict', True),
+            stats=None
+        )
+        return {
+            'filename': None if filename_uu is None else filename_uu.decode('ascii'),
+            'permissions_mode': permissions_mode,
+            'bytes_out': bytes_written
+        }
+    else:
+        raise ValueError(f'Unknown command {command!r}')
+
+
+def _handle_connection(connection: socket.socket) -> None:
+    """
+    A private function to serve requests from a connection until the client closes it.
+    An error processing a request is sent in its trailer, so the connection stays usable.
+    """
+    with connection, connection.makefile('rb') as rfile, connection.makefile('wb') as wfile:
+        while True:
+            request_header = rfile.read(_REQUEST_HEADER.size)
+            if not request_header:
+                return
+            elif len(request_header) != _REQUEST_HEADER.size:
+                raise ConnectionError('Connection closed in the middle of a frame')
+
+            command, options_length = _REQUEST_HEADER.unpack(request_header)
+            options_json = _read_exact(stream=rfile, length=options_length)
+
+            reader = _ChunkReader(stream=rfile)
+            writer = _ChunkWriter(stream=wfile)
+            try:
+                metadata = _run_request(
+                    command=command,
+                    options=json.loads(options_json) if options_json else dict(),
+                    source=cast(BinaryIO, io.BufferedReader(reader, buffer_size=_CHUNK_LENGTH)),
+                    sink=writer
+                )
+                status = STATUS_OK
+            except ConnectionError:
+                raise
+            except Exception as exc_info:
+                metadata = {'error': f'{type(exc_info).__name__}: {exc_info}'}
+                status = STATUS_ERROR
+
+            reader.drain()
+            writer.close()
+
+            metadata_json = json.dumps(metadata).encode('utf-8')
+            wfile.write(_TRAILER.pack(status, len(metadata_json)))
+            wfile.write(metadata_json)
+            wfile.flush()
+
+
+def _serve_worker(listener: socket.socket) -> None:
+    """
+    A private function run by each worker process, accepting connections from the
+    shared listening socket and serving them one at a time.
+    """
+    # Forked workers inherit the handlers of the parent, which coordinates shutdown
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    set_logging_mode(mode=LIBRARY_LOGGING)
+    while True:
+        connection, _ = listener.accept()
+        try:
+            _handle_connection(connection=connection)
+        except OSError:
+            # A client that goes away only ends its own connection
+            continue
+
+
+class UUServer:
+    """
+    A local encode/decode service listening on a Unix domain socket, so that other
+    processes can use the codec without starting Python and importing simple_uu for
+    every request.
+
+    Worker processes are started once and kept warm, each accepting connections from
+    the shared socket, so as many clients as there are workers are served at once and
+    further clients wait in the listen backlog. Request and response bodies are
+    streamed through the codec in chunks, so neither is held in memory. Workers that
+    exit are restarted.
+
+    Each request is a command byte (b'E' to encode or b'D' to decode) and the length
+    of its JSON options, as an unsigned 32-bit big-endian integer, followed by the
+    options and the body. Bodies are sent as chunks that are each prefixed with their
+    length, also as an unsigned 32-bit integer, and are ended by an empty chunk. The
+    response body is sent the same way and is followed by a trailer, which is a status
+    byte (0 on success or 1 on error) and the length of its JSON metadata, followed
+    by the metadata. A connection can be used for any number of requests.
+
+    Args:
+        socket_path (str | Path): The path of the Unix domain socket.
+        workers (int | None): The number of worker processes, defaults to the number
+            of CPUs.
+        backlog (int): The number of pending connections the socket queues.
+    """
+    def __init__(
+        self, socket_path: Union[str, Path], workers: Optional[int] = None, backlog: int = 128
+    ):
+        if not UNIX_SOCKETS_SUPPORTED:
+            raise OSError('Unix domain sockets are not supported on this platform')
+
+        if workers is not None and workers < 1:
+            raise ValueError('Number of workers must be at least one')
+
+        self.socket_path = Path(socket_path)
+        self.workers = workers or os.cpu_count() or 1
+        self.backlog = backlog
+
+        self._listener: Optional[socket.socket] = None
+        self._processes: List[BaseProcess] = []
+        self._stop_event = threading.Event()
+
+    def __enter__(self) -> 'UUServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _start_worker(self) -> BaseProcess:
+        """
+        A private method to start a worker process accepting from the listening socket.
+        """
+        process = multiprocessing.get_context().Process(
+            target=_serve_worker, args=(self._listener,), daemon=True
+        )
+        process.start()
+        return process
+
+    def start(self) -> None:
+        """Bind the socket and start the worker processes, without blocking."""
+        if self._listener is not None:
+            return
+
+        # A socket left behind by a previous server is replaced
+        if self.socket_path.exists() and stat.S_ISSOCK(self.socket_path.stat().st_mode):
+            self.socket_path.unlink()
+
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(str(self.socket_path))
+        self._listener.listen(self.backlog)
+
+        self._processes = [self._start_worker() for _ in range(self.workers)]
+
+    def serve_forever(self) -> None:
+        """Serve requests until stop is called, restarting any worker that exits."""
+        self.start()
+        try:
+            while not self._stop_event.wait(_SUPERVISE_INTERVAL):
+                self._processes = [
+                    process if process.is_alive() else self._start_worker()
+                    for process in self._processes
+                ]
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        """Ask serve_forever to return, which is safe to call from another thread."""
+        self._stop_event.set()
+
+    def close(self) -> None:
+        """Stop the worker processes and remove the socket."""
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            self.socket_path.unlink(missing_ok=True)
+
+
+class UUClient:
+    """
+    A client for a UUServer, keeping a single connection open for its requests. A
+    client must not be shared between threads.
+
+    Args:
+        socket_path (str | Path): The path of the Unix domain socket.
+        timeout (float | None): The number of seconds to wait on the socket.
+    """
+    def __init__(self, socket_path: Union[str, Path], timeout: Optional[float] = None):
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+
+        self._connection: Optional[socket.socket] = None
+        self._rfile: Optional[BinaryIO] = None
+        self._wfile: Optional[BinaryIO] = None
+
+    def __enter__(self) -> 'UUClient':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _connect(self) -> Tuple[BinaryIO, BinaryIO]:
+        """
+        A private method to open the connection if it is not already open.
+        """
+        if not UNIX_SOCKETS_SUPPORTED:
+            raise OSError('Unix domain sockets are not supported on this platform')
+
+        if self._rfile is None or self._wfile is None:
+            self._connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._connection.settimeout(self.timeout)
+            self._connection.connect(str(self.socket_path))
+            self._rfile = self._connection.makefile('rb')
+            self._wfile = self._connection.makefile('wb')
+
+        return self._rfile, self._wfile
+
+    def request(
+        self, command: bytes, options: Dict[str, Any], source: BinaryIO, sink: BinaryIO
+    ) -> Dict[str, Any]:
+        """
+        Stream a body from a source through the service into a sink.
+
+        The body is sent from a separate thread while the response is read, so that
+        neither side blocks on a full socket buffer for large bodies.
+
+        Args:
+            command (bytes): The command, either b'E' to encode or b'D' to decode.
+            options (Dict[str, Any]): Keyword arguments for the command.
+            source (BinaryIO): A binary stream the body is read from.
+            sink (BinaryIO): A binary stream the response body is written to.
+
+        Returns:
+            Dict[str, Any]: The metadata of the response.
+        """
+        rfile, wfile = self._connect()
+
+        send_errors: List[Exception] = []
+
+        def _send() -> None:
+            try:
+                options_json = json.dumps(options).encode('utf-8')
+                wfile.write(_REQUEST_HEADER.pack(command, len(options_json)))
+                wfile.write(options_json)
+
+                writer = _ChunkWriter(stream=wfile)
+                while True:
+                    chunk = source.read(_CHUNK_LENGTH)
+                    if not chunk:
+                        break
+                    writer.write(chunk)
+
+                writer.close()
+                wfile.flush()
+            except Exception as exc_info:
+                send_errors.append(exc_info)
+
+        sender = threading.Thread(target=_send, daemon=True)
+        sender.start()
+        try:
+            reader = _ChunkReader(stream=rfile)
+            while True:
+                chunk = reader.read(_CHUNK_LENGTH)
+                if not chunk:
+                    break
+                sink.write(chunk)
+
+            status, metadata_length = _TRAILER.unpack(
+                _read_exact(stream=rfile, length=_TRAILER.size)
+            )
+            metadata: Dict[str, Any] = json.loads(_read_exact(stream=rfile, length=metadata_length))
+        except BaseException:
+            # The connection is out of step with the service, so it is not reused
+            self.close()
+            raise
+        finally:
+            sender.join()
+
+        if send_errors:
+            self.close()
+            raise send_errors[0]
+
+        if status != STATUS_OK:
+            raise UUServiceError(message=metadata['error'])
+
+        return metadata
+
+    def encode(
+        self,
+        data: Union[bytes, bytearray],
+        filename: str,
+        octal_permission: Optional[Union[str, int]] = None,
+        extension: Optional[str] = None,
+        encoding_validation: bool = True,
+        binary_validation: bool = True,
+        variant: str = VARIANT_UU
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Encode binary data into a uuencoded format using the service.
+
+        Args:
+            data (bytes | bytearray): The binary data to encode.
+            filename (str): The name of the file being encoded.
+            octal_permission (str | int | None): An octal permission as a string or integer.
+            extension (str | None): An extension for the file being encoded.
+            encoding_validation (bool): Boolean indicating whether to run encoding validation.
+            binary_validation (bool): Boolean indicating whether to run binary validation.
+            variant (str): The variant to encode with, either 'uu' or 'base64'.
+
+        Returns:
+            Tuple[bytes, Dict[str, Any]]: The uuencoded data and the metadata of the response.
+        """
+        sink = io.BytesIO()
+        metadata = self.request(
+            command=SERVICE_ENCODE,
+            options={
+                'filename': filename,
+                'octal_permission': octal_permission,
+                'extension': extension,
+                'encoding_validation': encoding_validation,
+                'binary_validation': binary_validation,
+                'variant': variant
+            },
+            source=io.BytesIO(data),
+            sink=sink
+        )
+        return sink.getvalue(), metadata
+
+    def decode(
+        self,
+        data: Union[bytes, bytearray],
+        encoding_validation: bool = True,
+        strict: bool = True
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Decode uuencoded data using the service.
+
+        Args:
+            data (bytes | bytearray): The uuencoded data to decode.
+            encoding_validation (bool): Boolean indicating whether to run encoding validation.
+            strict (bool): Boolean indicating whether a malformed line raises an error.
+
+        Returns:
+            Tuple[bytes, Dict[str, Any]]: The decoded data and the metadata of the response.
+        """
+        sink = io.BytesIO()
+        metadata = self.request(
+            command=SERVICE_DECODE,
+            options={'encoding_validation': encoding_validation, 'strict': strict},
+            source=io.BytesIO(data),
+            sink=sink
+        )
+        return sink.getvalue(), metadata
+
+    def close(self) -> None:
+        """Close the connection, which is reopened by the next request."""
+        for stream in (self._rfile, self._wfile, self._connection):
+            if stream is not None:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+
+        self._connection = self._rfile = self._wfile = None
@@ -0,0 +1,137 @@
+import threading
+from time import perf_counter
+from typing import Any, Dict
+
+
+class UUStats:
+    """
+    Statistics collected for a single encode/decode call. Stage durations are
+    measured in seconds and are keyed by stage name (e.g., 'load', 'validation',
+    'decode', 'detection').
+
+    Args:
+        operation (str): The name of the operation the statistics belong to.
+    """
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.stage_durations: Dict[str, float] = dict()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.line_count = 0
+        self.repaired_line_count = 0
+
+        self._stage_start = perf_counter()
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'operation={self.operation}, '
+            f'bytes_in={self.bytes_in}, '
+            f'bytes_out={self.bytes_out}, '
+            f'line_count={self.line_count}, '
+            f'repaired_line_count={self.repaired_line_count}, '
+            f'total_duration={self.total_duration:.6f})'
+        )
+
+    @property
+    def total_duration(self) -> float:
+        """Sum of all stage durations."""
+        return sum(self.stage_durations.values())
+
+    def stage(self, name: str) -> None:
+        """
+        Mark the end of a stage, attributing the time elapsed since the end of the
+        previous stage (or creation of the instance) to the stage name.
+
+        Args:
+            name (str): The name of the stage that just completed.
+        """
+        now = perf_counter()
+        self.stage_durations[name] = (
+            self.stage_durations.get(name, 0.0) + now - self._stage_start
+        )
+        self._stage_start = now
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Export the statistics as a dictionary.
+
+        Returns:
+            Dict[str, Any]: A dictionary representation of the statistics.
+        """
+        return {
+            'operation': self.operation,
+            'stage_durations': dict(self.stage_durations),
+            'total_duration': self.total_duration,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'line_count': self.line_count,
+            'repaired_line_count': self.repaired_line_count
+        }
+
+
+class UUStatsAggregator:
+    """
+    A thread-safe cumulative aggregator of UUStats instances. An instance is callable
+    and can be passed directly as the stats_callback of encode/decode.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Dict[str, Any]] = dict()
+
+    def __call__(self, stats: UUStats) -> None:
+        self.record(stats=stats)
+
+    def record(self, stats: UUStats) -> None:
+        """
+        Add a UUStats instance to the cumulative totals of its operation.
+
+        Args:
+            stats (UUStats): The statistics of a single call.
+        """
+        with self._lock:
+            totals = self._totals.setdefault(
+                stats.operation,
+                {
+                    'calls': 0,
+                    'stage_durations': dict(),
+                    'total_duration': 0.0,
+                    'bytes_in': 0,
+                    'bytes_out': 0,
+                    'line_count': 0,
+                    'repaired_line_count': 0
+                }
+            )
+            totals['calls'] += 1
+            totals['total_duration'] += stats.total_duration
+            totals['bytes_in'] += stats.bytes_in
+            totals['bytes_out'] += stats.bytes_out
+            totals['line_count'] += stats.line_count
+            totals['repaired_line_count'] += stats.repaired_line_count
+
+            stage_durations: Dict[str, float] = totals['stage_durations']
+            for stage, duration in stats.stage_durations.items():
+                stage_durations[stage] = stage_durations.get(stage, 0.0) + duration
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Export the cumulative totals keyed by operation, suitable for a metrics system.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The cumulative totals for each operation.
+        """
+        with self._lock:
+            return {
+                operation: {
+                    **totals, 'stage_durations': dict(totals['stage_durations'])
+                }
+                for operation, totals in self._totals.items()
+            }
+
+    def reset(self) -> None:
+        """Clear all cumulative totals."""
+        with self._lock:
+            self._totals.clear()
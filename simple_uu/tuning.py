@@ -0,0 +1,172 @@
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+from simple_uu.logger import set_up_logger
+
+logger = set_up_logger(__name__)
+
+# Version of the persisted profile format
+_PROFILE_VERSION = 1
+
+# Environment variable that can be used to load the profile from another path
+_PROFILE_PATH_ENV = 'SIMPLE_UU_PROFILE'
+
+_PROFILE_FILENAME = 'profile.json'
+
+# Length of a line of binary data, chunks are a whole number of lines
+_LINE_LENGTH = 45
+
+class TuningProfile(NamedTuple):
+    """
+    Settings calibrated for a host, used by encode, decode and the streaming and
+    parallel functions in place of their built-in defaults. Settings that are None
+    keep the built-in default.
+
+    Args:
+        chunk_length (int | None): The number of bytes of binary data encoded at a time,
+            a multiple of the line length of 45 bytes.
+        block_length (int | None): The number of decoded bytes collected before they
+            are digested or written, and of base64 characters decoded at a time.
+        workers (int | None): The number of threads used by encode_parallel and
+            decode_parallel when not given, where one selects the serial engine.
+        span_length (int | None): The number of bytes handled by each parallel task.
+    """
+    chunk_length: Optional[int] = None
+    block_length: Optional[int] = None
+    workers: Optional[int] = None
+    span_length: Optional[int] = None
+
+
+def _validate_profile(profile: TuningProfile) -> None:
+    """
+    A private function to validate that every setting of a profile is a positive integer.
+    """
+    for setting, value in profile._asdict().items():
+        if value is not None and (not isinstance(value, int) or value <= 0):
+            raise ValueError(f'Tuning setting {setting} must be a positive integer')
+
+    if profile.chunk_length is not None and profile.chunk_length % _LINE_LENGTH:
+        raise ValueError('Chunk length must be a multiple of the line length')
+
+
+def _user_cache_directory() -> Path:
+    """
+    A private function to find the cache directory of the user for the package.
+    """
+    if sys.platform == 'win32':
+        cache_directory = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+    elif sys.platform == 'darwin':
+        cache_directory = Path.home() / 'Library' / 'Caches'
+    else:
+        cache_directory = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+
+    return Path(cache_directory) / 'simple_uu'
+
+
+def profile_path() -> Path:
+    """
+    The path the profile is saved to and loaded from, within the cache directory of
+    the user unless overridden by the SIMPLE_UU_PROFILE environment variable.
+
+    Returns:
+        Path: The path of the profile.
+    """
+    path = os.environ.get(_PROFILE_PATH_ENV)
+    if path:
+        return Path(path)
+
+    return _user_cache_directory() / _PROFILE_FILENAME
+
+
+def save_profile(profile: TuningProfile, path: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Persist a profile as JSON, creating the directory if needed.
+
+    Args:
+        profile (TuningProfile): The profile to persist.
+        path (str | Path | None): A path to the profile, defaults to profile_path().
+
+    Returns:
+        Path: The path the profile was written to.
+    """
+    _validate_profile(profile=profile)
+    path = profile_path() if path is None else Path(path)
+
+    profile_data: Dict[str, Any] = {'version': _PROFILE_VERSION, **profile._asdict()}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(profile_data, indent=2))
+    return path
+
+
+def load_profile(path: Optional[Union[str, Path]] = None) -> TuningProfile:
+    """
+    Load a profile persisted with save_profile.
+
+    Args:
+        path (str | Path | None): A path to the profile, defaults to profile_path().
+
+    Returns:
+        TuningProfile: A TuningProfile instance.
+    """
+    path = profile_path() if path is None else Path(path)
+
+    profile_data: Dict[str, Any] = json.loads(path.read_text())
+    if not isinstance(profile_data, dict) or profile_data.get('version') != _PROFILE_VERSION:
+        raise ValueError('Unsupported profile version')
+
+    profile = TuningProfile(
+        **{setting: profile_data.get(setting) for setting in TuningProfile._fields}
+    )
+    _validate_profile(profile=profile)
+    return profile
+
+
+# Profile used by the process, loaded when first needed
+_profile: Optional[TuningProfile] = None
+_PROFILE_LOCK = threading.Lock()
+
+
+def get_profile() -> TuningProfile:
+    """
+    Get the profile used by the process. On first use it is loaded from profile_path(),
+    falling back to the built-in defaults if there is no profile or it cannot be read.
+
+    Returns:
+        TuningProfile: The profile of the process.
+    """
+    global _profile
+    if _profile is not None:
+        return _profile
+
+    with _PROFILE_LOCK:
+        if _profile is None:
+            path = profile_path()
+            try:
+                _profile = load_profile(path=path)
+            except FileNotFoundError:
+                _profile = TuningProfile()
+            except (OSError, ValueError, TypeError) as exc_info:
+                logger.warning("Tuning profile %s could not be loaded, %s", path, exc_info)
+                _profile = TuningProfile()
+
+        return _profile
+
+
+def set_profile(profile: Optional[TuningProfile]) -> None:
+    """
+    Set the profile used by the process.
+
+    Args:
+        profile (TuningProfile | None): The profile, or None to load it again from
+            profile_path() when next used.
+    """
+    global _profile
+    if profile is not None:
+        _validate_profile(profile=profile)
+
+    with _PROFILE_LOCK:
+        _profile = profile
@@ -1,7 +1,66 @@
+import json
+import os
+import struct
+import sys
 from abc import ABC, abstractmethod
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
 from textwrap import dedent
-from typing import Optional, Union
+from types import MappingProxyType
+from typing import (Any, Callable, Dict, List, Mapping, NamedTuple, Optional,
+                    Sequence, Set, Union, cast)
+
+from simple_uu.stats import UUStats
+
+# Layout of a decoded file in shared memory, a header holding a marker along with the
+# length of the data and of the metadata, followed by the data and then the metadata
+SHARED_MEMORY_HEADER = struct.Struct('<8sQQ')
+_SHARED_MEMORY_MARKER = b'simpleuu'
+
+# Room left for the metadata when a block is created before the data is decoded
+SHARED_MEMORY_METADATA_LENGTH = 4096
+
+# Names of the shared memory blocks created by this process
+_created_shared_memory: Set[str] = set()
+
+
+def _create_shared_memory(size: int) -> SharedMemory:
+    """
+    A private function to create a shared memory block, recording its name so that
+    attaching to it from the same process leaves it registered.
+    """
+    block = SharedMemory(create=True, size=size)
+    _created_shared_memory.add(block.name)
+    return block
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    """
+    A private function to attach to an existing shared memory block without tracking
+    it, so a consumer exiting does not unlink the block of the producer. Before Python
+    3.13, attaching registers the block with the resource tracker, so it is unregistered
+    unless it was created by this process.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    block = SharedMemory(name=name)
+    if os.name == 'posix' and block.name not in _created_shared_memory:
+        resource_tracker.unregister(block._name, 'shared_memory') # type: ignore[attr-defined]
+    return block
+
+
+class UULineError(NamedTuple):
+    """
+    A malformed line that was repaired when decoding in lenient mode.
+
+    Args:
+        line_number (int): The line number within the uuencoded data, starting from one.
+        reason (str): The reason the line was repaired.
+    """
+    line_number: int
+    reason: str
 
 
 class BaseUUFile(ABC):
@@ -26,7 +85,45 @@ class BaseUUFile(ABC):
         self.file_mime_type = file_mime_type
         self.file_extension = file_extension
 
-        self.__bytearray: bytearray = bytearray()
+        # Digests of the binary data, populated when requested
+        self.digests: Mapping[str, str] = dict()
+
+        self.__bytearray: Union[bytearray, bytes, memoryview] = bytearray()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f'{self.__class__.__name__} is frozen and cannot be modified')
+
+        super().__setattr__(name, value)
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the instance has been frozen and can no longer be modified."""
+        return getattr(self, '_frozen', False)
+
+    def freeze(self) -> 'BaseUUFile':
+        """
+        Make the instance immutable, so that it can be shared safely between threads.
+        The bytes are stored as an immutable bytes object, which uu_bytes then returns
+        without copying.
+
+        Returns:
+            BaseUUFile: The same instance, now frozen.
+        """
+        if not self.frozen:
+            self.__bytearray = bytes(self.__bytearray)
+            self.digests = MappingProxyType(dict(self.digests))
+            self._freeze_attributes()
+            object.__setattr__(self, '_frozen', True)
+
+        return self
+
+    def _freeze_attributes(self) -> None:
+        """
+        A private method for subclasses to convert their own attributes into
+        immutable types when the instance is frozen.
+        """
+        pass
 
     @property
     def full_filename(self) -> str:
@@ -39,11 +136,36 @@ class BaseUUFile(ABC):
         return bytes(self.__bytearray)
 
     @uu_bytes.setter
-    def uu_bytes(self, decoded_bytes: bytearray) -> None:
+    def uu_bytes(self, decoded_bytes: Union[bytearray, bytes, memoryview]) -> None:
         self.__bytearray = decoded_bytes
 
+    @property
+    def uu_view(self) -> memoryview:
+        """Bytes resulting from encoding/decoding returned as a read-only memoryview, without copying."""
+        return memoryview(self.__bytearray).toreadonly()
+
+    def _write_bytes(
+        self,
+        path: Path,
+        stats_callback: Optional[Callable[[UUStats], None]]
+    ) -> None:
+        """
+        A private method to write the bytes to a path, reporting statistics if requested.
+        """
+        if stats_callback is None:
+            path.write_bytes(self.uu_bytes)
+        else:
+            stats = UUStats(operation='write')
+            stats.bytes_in = stats.bytes_out = path.write_bytes(self.uu_bytes)
+            stats.stage('write')
+            stats_callback(stats)
+
     @abstractmethod
-    def write_file(self, path: Union[str, Path]) -> None:
+    def write_file(
+        self,
+        path: Union[str, Path],
+        stats_callback: Optional[Callable[[UUStats], None]] = None
+    ) -> None:
         pass
 
 
@@ -72,6 +194,14 @@ class UUDecodedFile(BaseUUFile):
             file_extension=file_extension
         )
 
+        # Malformed lines that were repaired when decoding in lenient mode
+        self.line_errors: Sequence[UULineError] = []
+
+        # Shared memory block holding the decoded data, if it was decoded into or
+        # attached from one, with the view released before the block is closed
+        self._shared_view: Optional[memoryview] = None
+        self.shared_memory: Optional[SharedMemory] = None
+
     def __str__(self) -> str:
         return repr(self)
 
@@ -85,12 +215,138 @@ class UUDecodedFile(BaseUUFile):
         )
         return dedent(text=class_repr)
 
-    def write_file(self, path: Union[str, Path]) -> None:
+    def _freeze_attributes(self) -> None:
+        self.line_errors = tuple(self.line_errors)
+
+    def _attach_view(self, block: SharedMemory, length: int) -> None:
+        """
+        A private method to back the decoded data with a read-only view of the data
+        held in a shared memory block.
+        """
+        self._shared_view = cast(memoryview, block.buf)[
+            SHARED_MEMORY_HEADER.size:SHARED_MEMORY_HEADER.size + length
+        ].toreadonly()
+        self.uu_bytes = self._shared_view
+        self.shared_memory = block
+
+    def to_shared_memory(self) -> SharedMemory:
+        """
+        Place the decoded data in a shared memory block, with the metadata alongside,
+        so that other processes can attach to it by name with from_shared_memory.
+        If the data is already held in a shared memory block with room for the
+        metadata, as when decoded with shared_memory=True, that block is returned
+        without copying the data.
+
+        The caller owns the block, and should close and unlink it once every
+        consumer has attached and finished with the data.
+
+        Returns:
+            SharedMemory: The shared memory block holding the decoded file.
+        """
+        metadata: bytes = json.dumps({
+            'filename': self.filename,
+            'permissions_mode': self.permissions_mode,
+            'file_mime_type': self.file_mime_type,
+            'file_extension': self.file_extension,
+            'digests': dict(self.digests),
+            'line_errors': [list(line_error) for line_error in self.line_errors]
+        }).encode('utf-8')
+
+        with self.uu_view as data:
+            data_start = SHARED_MEMORY_HEADER.size
+            metadata_start = data_start + len(data)
+            metadata_end = metadata_start + len(metadata)
+
+            block = self.shared_memory
+            if block is None or metadata_end > block.size:
+                block = _create_shared_memory(size=metadata_end)
+                cast(memoryview, block.buf)[data_start:metadata_start] = data
+
+        block_buffer = cast(memoryview, block.buf)
+        block_buffer[metadata_start:metadata_end] = metadata
+        SHARED_MEMORY_HEADER.pack_into(
+            block_buffer, 0, _SHARED_MEMORY_MARKER, metadata_start - data_start, len(metadata)
+        )
+        return block
+
+    @classmethod
+    def from_shared_memory(cls, name: str) -> 'UUDecodedFile':
+        """
+        Attach to a decoded file placed in a shared memory block by to_shared_memory.
+        The decoded data is not copied, uu_view returns a view of the block itself.
+        Call close once finished, which leaves the block in place for other consumers.
+
+        Args:
+            name (str): The name of the shared memory block.
+
+        Returns:
+            UUDecodedFile: A UUDecodedFile instance backed by the shared memory block.
+        """
+        block = _attach_shared_memory(name=name)
+        block_buffer = cast(memoryview, block.buf)
+        try:
+            marker, length, metadata_length = SHARED_MEMORY_HEADER.unpack_from(block_buffer, 0)
+            metadata_start = SHARED_MEMORY_HEADER.size + length
+            if (
+                marker != _SHARED_MEMORY_MARKER or
+                metadata_start + metadata_length > block.size
+            ):
+                raise ValueError('Shared memory block does not contain a decoded file')
+
+            metadata: Dict[str, Any] = json.loads(
+                bytes(block_buffer[metadata_start:metadata_start + metadata_length])
+            )
+        except BaseException:
+            block.close()
+            raise
+
+        decoded_file = cls(
+            filename=metadata['filename'],
+            permissions_mode=metadata['permissions_mode'],
+            file_mime_type=metadata['file_mime_type'],
+            file_extension=metadata['file_extension']
+        )
+        decoded_file.digests = metadata['digests']
+        decoded_file.line_errors = [
+            UULineError(*line_error) for line_error in metadata['line_errors']
+        ]
+        decoded_file._attach_view(block=block, length=length)
+        return decoded_file
+
+    def close(self) -> None:
+        """
+        Close the shared memory block holding the decoded data, if any, after which the
+        data is no longer available unless the instance was frozen. The block is not
+        unlinked, which is left to its owner. Any views taken from uu_view must be
+        released first.
+        """
+        block = self.shared_memory
+        if block is None:
+            return
+
+        if not self.frozen:
+            self.uu_bytes = bytearray()
+
+        if self._shared_view is not None:
+            self._shared_view.release()
+
+        # Frozen instances hold a copy of the data, so the block can still be closed
+        object.__setattr__(self, '_shared_view', None)
+        object.__setattr__(self, 'shared_memory', None)
+        block.close()
+
+    def write_file(
+        self,
+        path: Union[str, Path],
+        stats_callback: Optional[Callable[[UUStats], None]] = None
+    ) -> None:
         """
         Write the decoded bytes to a specified path.
 
         Args:
             path (str | Path): A path to an existing directory as a string or Path object.
+            stats_callback (Callable[[UUStats], None] | None): An optional callback receiving
+                the write duration and byte count.
         """
         if isinstance(path, str):
             path = Path(path)
@@ -100,7 +356,7 @@ class UUDecodedFile(BaseUUFile):
 
         # Add filename to compiled path
         path /= self.full_filename
-        path.write_bytes(self.uu_bytes)
+        self._write_bytes(path=path, stats_callback=stats_callback)
 
 
 class UUEncodedFile(BaseUUFile):
@@ -146,12 +402,18 @@ class UUEncodedFile(BaseUUFile):
         """Uuencoded output filename."""
         return self.filename + '.txt'
 
-    def write_file(self, path: Union[str, Path]) -> None:
+    def write_file(
+        self,
+        path: Union[str, Path],
+        stats_callback: Optional[Callable[[UUStats], None]] = None
+    ) -> None:
         """
         Write the uuencoded bytes to a specified path. File extension will be txt.
 
         Args:
             path (str | Path): A path to an existing directory as a string or Path object.
+            stats_callback (Callable[[UUStats], None] | None): An optional callback receiving
+                the write duration and byte count.
         """
         if isinstance(path, str):
             path = Path(path)
@@ -161,4 +423,60 @@ class UUEncodedFile(BaseUUFile):
 
         # Add filename to compiled path
         path /= self.output_filename
-        path.write_bytes(self.uu_bytes)
+        self._write_bytes(path=path, stats_callback=stats_callback)
+
+
+class UUWrittenFile:
+    """
+    Structure describing a file that was streamed directly to disk. Unlike the
+    in-memory structures, the encoded/decoded bytes are not retained.
+
+    Args:
+        filename (str): The filename of the written file, without extension.
+        permissions_mode (str): The Unix permissions mode of the written file.
+        file_mime_type (str | None): The mime type of the written file.
+        file_extension (str): The file extension of the written file.
+        path (Path): The full path of the written file.
+        size (int): The number of bytes written, before any compression.
+    """
+    def __init__(
+        self,
+        filename: str,
+        permissions_mode: str,
+        file_mime_type: Optional[str],
+        file_extension: str,
+        path: Path,
+        size: int
+    ):
+        self.filename = filename
+        self.permissions_mode = permissions_mode
+        self.file_mime_type = file_mime_type
+        self.file_extension = file_extension
+        self.path = path
+        self.size = size
+
+        # Digests of the binary data, populated when requested
+        self.digests: Dict[str, str] = dict()
+
+        # Malformed lines that were repaired when decoding in lenient mode
+        self.line_errors: List[UULineError] = []
+
+    def __str__(self) -> str:
+        return repr(self)
+
+    def __repr__(self) -> str:
+        class_repr = (
+            f'{self.__class__.__name__}('
+            f'filename={self.filename}, '
+            f'permissions_mode={self.permissions_mode}, '
+            f'file_mime_type={self.file_mime_type}, '
+            f'file_extension={self.file_extension}, '
+            f'path={self.path}, '
+            f'size={self.size})'
+        )
+        return dedent(text=class_repr)
+
+    @property
+    def full_filename(self) -> str:
+        """Full filename."""
+        return f'{self.filename}.{self.file_extension}'
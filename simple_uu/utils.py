@@ -1,12 +1,49 @@
+import errno
 import os
 import uuid
+from contextlib import contextmanager
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from types import TracebackType
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple, Type, Union
 
+from simple_uu.compression import open_compressed, open_decompressed
 from simple_uu.logger import set_up_logger
 
 logger = set_up_logger(__name__)
 
+# Default size of the buffer used when streaming data to disk
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Durability policies for files written to disk
+FSYNC_NONE = 'none'
+FSYNC_FILE = 'file'
+FSYNC_DIRECTORY = 'directory'
+
+_FSYNC_POLICIES = {FSYNC_NONE, FSYNC_FILE, FSYNC_DIRECTORY}
+
+# Errors raised when linking on file systems without hard links, such as FAT or exFAT
+_LINK_UNSUPPORTED = {errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+# Variants of uuencoded data, classic uu and the base64 variant written by uuencode -m
+VARIANT_UU = 'uu'
+VARIANT_BASE64 = 'base64'
+
+# Begin clause of the header and footer line of each variant
+BEGIN_CLAUSES: Dict[str, bytes] = {VARIANT_UU: b'begin', VARIANT_BASE64: b'begin-base64'}
+END_CLAUSES: Dict[str, bytes] = {VARIANT_UU: b'end', VARIANT_BASE64: b'===='}
+
+def validate_variant(variant: str) -> None:
+    """
+    Validate the name of a variant of uuencoded data.
+
+    Args:
+        variant (str): The variant, either 'uu' or 'base64'.
+    """
+    if variant not in BEGIN_CLAUSES:
+        raise ValueError("Variant must be either 'uu' or 'base64'")
+
+
 def load_file_object(file_object: Union[str, Path, bytes, bytearray]) -> bytes:
     """
     Loads a file object and return a bytes instance.
@@ -38,6 +75,255 @@ def load_file_object(file_object: Union[str, Path, bytes, bytearray]) -> bytes:
     return uu_encoded_bytes
 
 
+@contextmanager
+def _open_binary_stream(
+    file_object: Union[str, Path, bytes, bytearray, BinaryIO]
+) -> Iterator[BinaryIO]:
+    """
+    A private function to open a file object as a binary stream.
+    """
+    if isinstance(file_object, (bytes, bytearray)):
+        yield BytesIO(file_object)
+    elif isinstance(file_object, (str, Path)):
+        if not os.path.isfile(file_object):
+            raise FileNotFoundError("File path is not valid")
+
+        with open(file_object, 'rb') as binary_stream:
+            yield binary_stream
+    elif hasattr(file_object, 'read'):
+        yield file_object
+    else:
+        message_core = 'Expected a string, Path, bytes, bytearray, or binary stream object'
+        raise TypeError(f"{message_core}, but got {type(file_object).__name__}")
+
+
+@contextmanager
+def open_file_object(
+    file_object: Union[str, Path, bytes, bytearray, BinaryIO],
+    compression: Optional[str] = None
+) -> Iterator[BinaryIO]:
+    """
+    Opens a file object as a binary stream without loading a file into memory. Binary
+    streams that are passed in are yielded as is and are not closed.
+
+    Compressed data is decompressed chunk by chunk as the stream is read, if either
+    a compression format is given or 'auto' is given and the format is detected from
+    the magic bytes at the start of the data.
+
+    Args:
+        file_object (str | Path | bytes | bytearray | BinaryIO): A file object is either
+            a path to a file, bytes, bytearray or binary stream object.
+        compression (str | None): The compression format of the data, either 'auto',
+            'gzip', 'bz2', 'xz' or 'zstd'. If not provided, data is read as is.
+
+    Yields:
+        BinaryIO: A binary stream.
+    """
+    with _open_binary_stream(file_object=file_object) as binary_stream:
+        if compression is None:
+            yield binary_stream
+            return
+
+        decompressed_stream = open_decompressed(
+            binary_stream=binary_stream, compression=compression
+        )
+        try:
+            yield decompressed_stream
+        finally:
+            # Closing the decompressed stream does not close the underlying stream
+            if decompressed_stream is not binary_stream:
+                decompressed_stream.close()
+
+
+class AtomicFileWriter:
+    """
+    Writes to a temporary file in a directory, which is atomically renamed into place
+    on commit so that readers never see a partially written file. If the writer is
+    closed without being committed, the temporary file is removed.
+
+    The fsync policy trades durability against throughput. With 'none' the data is
+    left to the operating system, with 'file' the file is flushed to storage before
+    the rename and with 'directory' the containing directory is also flushed after
+    the rename so that the rename itself is durable.
+
+    A temporary file can also be given a fixed name, in which case writing continues
+    from an offset within any existing file of that name and the file is kept when
+    the writer is closed without being committed, so that it can be resumed.
+
+    Args:
+        directory (str | Path): A path to an existing directory as a string or Path object.
+        buffer_size (int): The size of the write buffer in bytes.
+        fsync (str): The fsync policy, either 'none', 'file' or 'directory'.
+        temp_name (str | None): A fixed name for the temporary file within the directory.
+        offset (int): The offset to continue writing from in a named temporary file,
+            anything after it is discarded.
+        compression (str | None): The compression format data is compressed with as it
+            is written, either 'gzip', 'bz2', 'xz' or 'zstd'. If not provided, data is
+            written as is.
+    """
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        buffer_size: int = WRITE_BUFFER_SIZE,
+        fsync: str = FSYNC_NONE,
+        temp_name: Optional[str] = None,
+        offset: int = 0,
+        compression: Optional[str] = None
+    ):
+        if isinstance(directory, str):
+            directory = Path(directory)
+
+        if not directory.is_dir():
+            raise NotADirectoryError("Not a valid path for writing file")
+
+        if fsync not in _FSYNC_POLICIES:
+            raise ValueError("Fsync policy must be one of 'none', 'file' or 'directory'")
+
+        self.directory = directory
+        self.fsync = fsync
+        self.committed = False
+
+        self.resumable = temp_name is not None
+
+        # The temporary file is created with the default mode so that the umask applies
+        flags = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        if temp_name is None:
+            self.temp_path = directory / f'.simple-uu-{uuid.uuid4().hex[:8]}.part'
+            flags |= os.O_EXCL
+        else:
+            self.temp_path = directory / temp_name
+
+        file_descriptor = os.open(self.temp_path, flags, 0o666)
+        if temp_name is not None:
+            os.ftruncate(file_descriptor, offset)
+            os.lseek(file_descriptor, offset, os.SEEK_SET)
+
+        self._file: BinaryIO = os.fdopen(file_descriptor, 'wb', buffering=buffer_size)
+
+        # Data is compressed chunk by chunk on its way into the temporary file
+        self._stream: BinaryIO = self._file
+        if compression is not None:
+            try:
+                self._stream = open_compressed(binary_stream=self._file, compression=compression)
+            except BaseException:
+                self.abort()
+                raise
+
+    def __enter__(self) -> 'AtomicFileWriter':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        if not self.committed:
+            self.abort()
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> int:
+        """
+        Write data to the temporary file.
+
+        Args:
+            data (bytes | bytearray | memoryview): The data to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        return self._stream.write(data)
+
+    def flush(self) -> None:
+        """
+        Flush buffered data to the temporary file, also flushing it to storage unless
+        the fsync policy is 'none'.
+        """
+        if self._stream is not self._file:
+            self._stream.flush()
+        self._sync()
+
+    def _sync(self) -> None:
+        """
+        A private method to flush the temporary file, also flushing it to storage
+        unless the fsync policy is 'none'.
+        """
+        self._file.flush()
+        if self.fsync != FSYNC_NONE:
+            os.fsync(self._file.fileno())
+
+    def commit(
+        self, filename: str, permissions_mode: Optional[str] = None, overwrite: bool = True
+    ) -> Path:
+        """
+        Close the temporary file, apply a permissions mode and atomically rename it.
+
+        Args:
+            filename (str): The final filename within the directory.
+            permissions_mode (str | None): A Unix permissions mode (e.g., '644').
+            overwrite (bool): Boolean indicating whether an existing file of the same
+                name is replaced. If False, FileExistsError is raised instead.
+
+        Returns:
+            Path: The path of the committed file.
+        """
+        # The file must stay within the directory
+        if filename in {'', '.', '..'} or '/' in filename or '\\' in filename:
+            raise ValueError('Filename must not contain a path')
+
+        # Closing the compressed stream finishes the compressed data
+        if self._stream is not self._file:
+            self._stream.close()
+        self._sync()
+        self._file.close()
+
+        if permissions_mode is not None:
+            os.chmod(self.temp_path, int(permissions_mode, 8))
+
+        path = self.directory / filename
+        if overwrite:
+            os.replace(self.temp_path, path)
+        else:
+            self._link(path=path)
+        self.committed = True
+
+        # Directories cannot be opened for syncing on Windows
+        if self.fsync == FSYNC_DIRECTORY and os.name == 'posix':
+            directory_descriptor = os.open(self.directory, os.O_RDONLY)
+            try:
+                os.fsync(directory_descriptor)
+            finally:
+                os.close(directory_descriptor)
+
+        return path
+
+    def _link(self, path: Path) -> None:
+        """
+        A private method to move the temporary file to a path that must not exist.
+        Linking fails if the file exists. On file systems without hard links, the path
+        is reserved by creating it exclusively before the temporary file replaces it.
+        """
+        try:
+            os.link(self.temp_path, path)
+        except OSError as exc_info:
+            if exc_info.errno not in _LINK_UNSUPPORTED:
+                raise
+
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+            os.replace(self.temp_path, path)
+        else:
+            os.unlink(self.temp_path)
+
+    def abort(self) -> None:
+        """Close and remove the temporary file, unless it has a fixed name."""
+        try:
+            if self._stream is not self._file:
+                self._stream.close()
+        finally:
+            self._file.close()
+        if not self.resumable:
+            self.temp_path.unlink(missing_ok=True)
+
+
 def construct_filename(filename_from_uu: Optional[str]) -> str:
     """
     Constructs a filename based on filename included in header. If a filename could not
@@ -55,7 +341,8 @@ def construct_filename(filename_from_uu: Optional[str]) -> str:
         file_name_generated = f'simple-uu-decode-{uu_8_file_id}'
 
         logger.info(
-            f"Filename did not appear in the uu header, auto-generating filename {file_name_generated}"
+            "Filename did not appear in the uu header, auto-generating filename %s",
+            file_name_generated
         )
         return file_name_generated
     else:
@@ -79,6 +366,12 @@ def decompose_filename(
     if filename_from_uu is None:
         return None, None
 
+    # Keep only the final component of any path so that a header cannot place the file
+    # outside of the directory it is written to
+    filename_from_uu = filename_from_uu.replace(b'\\', b'/').rsplit(b'/', 1)[-1]
+    if filename_from_uu in {b'', b'.', b'..'}:
+        return None, None
+
     # Decode bytes into a string
     filename_from_uu: str = filename_from_uu.decode('ascii')
 
@@ -0,0 +1,281 @@
+import fnmatch
+import os
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                wait)
+from pathlib import Path
+from time import monotonic
+from typing import Any, Deque, Dict, Optional, Tuple, Union
+
+from simple_uu.cli import (_PARTIAL_PREFIX, COMMAND_DECODE, FileResult,
+                           process_file)
+from simple_uu.logger import LIBRARY_LOGGING, set_logging_mode, set_up_logger
+
+logger = set_up_logger(__name__)
+
+# Default number of seconds between each poll of the directory
+_DEFAULT_POLL_INTERVAL = 1.0
+
+class WatchCounters:
+    """
+    Thread-safe counters describing the progress of a FolderWatcher, which can be read
+    from another thread while the watcher is running.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = monotonic()
+
+        self.queued = 0
+        self.in_flight = 0
+        self.processed = 0
+        self.failed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def _update(self, **changes: int) -> None:
+        """
+        A private method to apply changes to the counters atomically.
+        """
+        with self._lock:
+            for name, change in changes.items():
+                setattr(self, name, getattr(self, name) + change)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Export the counters as a dictionary, suitable for a metrics system.
+
+        Returns:
+            Dict[str, Any]: A dictionary representation of the counters.
+        """
+        with self._lock:
+            elapsed = monotonic() - self._started
+            return {
+                'queue_depth': self.queued + self.in_flight,
+                'queued': self.queued,
+                'in_flight': self.in_flight,
+                'processed': self.processed,
+                'failed': self.failed,
+                'bytes_in': self.bytes_in,
+                'bytes_out': self.bytes_out,
+                'elapsed': elapsed,
+                'files_per_second': (self.processed + self.failed) / elapsed if elapsed else 0.0,
+                'throughput_mb_s': self.bytes_in / elapsed / 1024 ** 2 if elapsed else 0.0
+            }
+
+
+def _move_aside(path: Path, directory: Path) -> Path:
+    """
+    A private function to move a file into a directory without replacing a file of the
+    same name that is already there.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+
+    destination = directory / path.name
+    if destination.exists():
+        destination = directory / f'{path.stem}-{uuid.uuid4().hex[:8]}{path.suffix}'
+
+    os.replace(path, destination)
+    return destination
+
+
+class FolderWatcher:
+    """
+    Watches a spool directory and decodes files as they arrive, using a bounded pool
+    of worker processes.
+
+    The directory is polled, and a file is only considered complete once its size and
+    modification time have not changed between polls, so files that are still being
+    written are left alone. Complete files are queued and handed to the pool, with at
+    most twice as many files in flight as there are workers. Each file is streamed to
+    disk with decode_to_file and is then moved into the processed or failed directory.
+
+    Args:
+        directory (str | Path): The spool directory to watch.
+        output_dir (str | Path): The directory decoded files are written to.
+        workers (int): The number of worker processes.
+        poll_interval (float): The number of seconds between each poll.
+        pattern (str): A glob pattern that filenames must match (e.g., '*.uue').
+        processed_dir (str | Path | None): The directory processed files are moved to,
+            defaults to a 'processed' directory within the spool directory.
+        failed_dir (str | Path | None): The directory failed files are moved to,
+            defaults to a 'failed' directory within the spool directory.
+        options (Dict[str, Any] | None): Keyword arguments passed on to decode_to_file.
+            Existing output files are not replaced unless overwrite is given as True,
+            so a file whose header names an existing output is moved to failed_dir.
+    """
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        output_dir: Union[str, Path],
+        workers: int = 1,
+        poll_interval: float = _DEFAULT_POLL_INTERVAL,
+        pattern: str = '*',
+        processed_dir: Optional[Union[str, Path]] = None,
+        failed_dir: Optional[Union[str, Path]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ):
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise NotADirectoryError("Not a valid path for watching")
+
+        if workers < 1:
+            raise ValueError('Number of workers must be at least one')
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.pattern = pattern
+        self.processed_dir = Path(
+            self.directory / 'processed' if processed_dir is None else processed_dir
+        )
+        self.failed_dir = Path(self.directory / 'failed' if failed_dir is None else failed_dir)
+        self.options: Dict[str, Any] = {'overwrite': False, **(options or dict())}
+
+        self.counters = WatchCounters()
+
+        self._stop_event = threading.Event()
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # Size and modification time of files seen on the previous poll
+        self._candidates: Dict[Path, Tuple[int, int]] = dict()
+        self._queue: Deque[Path] = deque()
+        self._in_flight: Dict['Future[FileResult]', Path] = dict()
+
+    def __enter__(self) -> 'FolderWatcher':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def _tracked(self) -> int:
+        """Number of files that have been queued and not yet moved aside."""
+        return len(self._queue) + len(self._in_flight)
+
+    def _find_complete_files(self) -> None:
+        """
+        A private method to queue files whose size and modification time have not
+        changed since the previous poll.
+        """
+        tracked = set(self._queue).union(self._in_flight.values())
+
+        candidates: Dict[Path, Tuple[int, int]] = dict()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if (
+                    not entry.is_file() or
+                    entry.name.startswith(_PARTIAL_PREFIX) or
+                    not fnmatch.fnmatch(entry.name, self.pattern)
+                ):
+                    continue
+
+                path = Path(entry.path)
+                if path in tracked:
+                    continue
+
+                file_stat = entry.stat()
+                signature = (file_stat.st_size, file_stat.st_mtime_ns)
+                if self._candidates.get(path) == signature:
+                    self._queue.append(path)
+                    self.counters._update(queued=1)
+                else:
+                    candidates[path] = signature
+
+        self._candidates = candidates
+
+    def _collect_results(self) -> None:
+        """
+        A private method to move aside the files that workers have finished with.
+        """
+        for future in [future for future in self._in_flight if future.done()]:
+            path = self._in_flight.pop(future)
+            self.counters._update(in_flight=-1)
+
+            try:
+                result = future.result()
+            except Exception as exc_info:
+                result = FileResult(
+                    path=str(path),
+                    output=None,
+                    bytes_in=0,
+                    bytes_out=0,
+                    error=f'{type(exc_info).__name__}: {exc_info}'
+                )
+
+            if result.error is None:
+                _move_aside(path=path, directory=self.processed_dir)
+                self.counters._update(
+                    processed=1, bytes_in=result.bytes_in, bytes_out=result.bytes_out
+                )
+            else:
+                logger.warning('Failed to decode %s: %s', path, result.error)
+                _move_aside(path=path, directory=self.failed_dir)
+                self.counters._update(failed=1)
+
+    def _submit_queued(self) -> None:
+        """
+        A private method to hand queued files to the pool, keeping the number of files
+        in flight bounded.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=set_logging_mode,
+                initargs=(LIBRARY_LOGGING,)
+            )
+
+        while self._queue and len(self._in_flight) < 2 * self.workers:
+            path = self._queue.popleft()
+            future = self._executor.submit(
+                process_file,
+                command=COMMAND_DECODE,
+                path=path,
+                output_dir=self.output_dir,
+                options=self.options
+            )
+            self._in_flight[future] = path
+            self.counters._update(queued=-1, in_flight=1)
+
+    def poll(self) -> None:
+        """
+        Poll the directory once, moving aside finished files, queueing complete files
+        and handing queued files to the pool. Does not wait for files to be processed.
+        """
+        self._collect_results()
+        self._find_complete_files()
+        self._submit_queued()
+
+    def drain(self) -> None:
+        """Wait until every queued and in-flight file has been processed."""
+        while self._tracked:
+            self._submit_queued()
+            _ = wait(list(self._in_flight), return_when=FIRST_COMPLETED)
+            self._collect_results()
+
+    def run(self) -> None:
+        """
+        Poll the directory until stop is called, then wait for the files already
+        queued to be processed.
+        """
+        try:
+            while not self._stop_event.is_set():
+                self.poll()
+                self._stop_event.wait(self.poll_interval)
+
+            self.drain()
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        """Ask a running watcher to stop, which is safe to call from another thread."""
+        self._stop_event.set()
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=False)
+            self._executor = None
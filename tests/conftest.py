@@ -0,0 +1,18 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from simple_uu import set_profile
+
+
+@pytest.fixture(autouse=True)
+def isolated_profile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """
+    Keep the tuning profile of the host out of every test, so that tests run with the
+    built-in defaults unless they set a profile themselves.
+    """
+    monkeypatch.setenv('SIMPLE_UU_PROFILE', str(tmp_path / 'missing-profile.json'))
+    set_profile(profile=None)
+    yield
+    set_profile(profile=None)
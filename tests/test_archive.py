@@ -0,0 +1,77 @@
+from io import BytesIO
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from simple_uu import (ArchiveEntry, InvalidUUEncodingError, decode_all,
+                       encode, encode_archive, scan)
+
+
+def _example_entries() -> List[ArchiveEntry]:
+    return [
+        ArchiveEntry(
+            file_object=f'./tests/examples/decoded/example_{example}.{extension}',
+            filename=f'example_{example}',
+            octal_permission=0o640
+        )
+        for example, extension in [(1, 'jpg'), (2, 'xlsx'), (3, 'docx'), (4, 'pptx')]
+    ] * 3
+
+
+def test_encode_archive(tmp_path: Path) -> None:
+    """
+    Test encoding many files into a single archive in a deterministic order.
+    """
+    entries = _example_entries()
+    archive_path = tmp_path / 'bundle.txt'
+
+    sequential_blocks = encode_archive(entries=entries, dst=archive_path)
+    sequential_archive = archive_path.read_bytes()
+
+    # Parallel encoding writes the same sections in the same order
+    parallel_blocks = encode_archive(
+        entries=iter(entries), dst=archive_path, workers=4, max_in_flight=3
+    )
+    assert parallel_blocks == sequential_blocks
+    assert archive_path.read_bytes() == sequential_archive
+    assert scan(file_object=archive_path) == parallel_blocks
+
+    expected_archive = b''.join(
+        bytes(
+            encode(
+                file_object=entry.file_object,
+                filename=entry.filename,
+                octal_permission=entry.octal_permission
+            ).uu_bytes
+        ) + b'\n'
+        for entry in entries
+    )
+    assert sequential_archive == expected_archive
+
+    decoded_files = decode_all(file_object=archive_path)
+    assert [decoded_file.full_filename for decoded_file in decoded_files] == [
+        Path(str(entry.file_object)).name for entry in entries
+    ]
+    assert {decoded_file.permissions_mode for decoded_file in decoded_files} == {'640'}
+
+    # Binary streams are written to directly
+    archive_stream = BytesIO()
+    assert encode_archive(entries=entries, dst=archive_stream, workers=2) == parallel_blocks
+    assert archive_stream.getvalue() == sequential_archive
+
+
+def test_encode_archive_error(tmp_path: Path) -> None:
+    """
+    Test that a failed entry does not leave a partial archive behind.
+    """
+    entries = _example_entries()
+    entries.insert(5, ArchiveEntry(file_object=b'plain text', filename='text'))
+
+    with pytest.raises(InvalidUUEncodingError):
+        _ = encode_archive(entries=entries, dst=tmp_path / 'bundle.txt', workers=4)
+    assert not list(tmp_path.iterdir())
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = encode_archive(entries=entries, dst=tmp_path / 'bundle.txt', max_in_flight=0)
+    assert str(exc_info.value) == 'Maximum number of entries in flight must be at least one'
@@ -0,0 +1,46 @@
+import random
+import zlib
+
+import pytest
+
+from simple_uu import decode, encode, encode_batch
+
+
+def test_encode_batch() -> None:
+    """
+    Test that each item of a batch matches encoding its payload on its own.
+    """
+    payloads = [random.Random(size).randbytes(size) for size in [0, 1, 44, 45, 46, 512, 1000]]
+    batch = encode_batch(
+        buffers=payloads, filename='payload', octal_permission=0o600, extension='bin', checksums=True
+    )
+
+    assert len(batch) == len(payloads)
+    assert list(batch.input_lengths) == [len(payload) for payload in payloads]
+    assert batch.offsets[0] == 0 and batch.offsets[-1] == len(batch.data)
+    assert batch.crc32s is not None
+    assert list(batch.crc32s) == [zlib.crc32(payload) for payload in payloads]
+
+    for index, payload in enumerate(payloads):
+        if not payload:
+            assert bytes(batch.item(index=index)) == b'begin 600 payload_0.bin\n\nend'
+            continue
+
+        encoded_file = encode(
+            file_object=payload,
+            filename=f'payload_{index}',
+            octal_permission=0o600,
+            extension='bin',
+            encoding_validation=False,
+            binary_validation=False
+        )
+        assert batch.item(index=index) == encoded_file.uu_bytes
+
+    decoded_file = decode(file_object=bytes(batch.item(index=-1)), encoding_validation=False)
+    assert decoded_file.uu_bytes == payloads[-1]
+    assert [bytes(item) for item in batch][1] == bytes(batch.item(index=1))
+
+    with pytest.raises(IndexError):
+        _ = batch.item(index=len(payloads))
+    with pytest.raises(TypeError):
+        batch.item(index=0)[0] = 0
@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+from simple_uu.bench import (compare_to_baseline, generate_payload, main,
+                             parse_size, run_thread_scaling_benchmarks)
+from simple_uu.logger import set_logging_mode
+
+
+def test_parse_size() -> None:
+    """
+    Test parsing of human readable payload sizes.
+    """
+    assert parse_size(size='512') == 512
+    assert parse_size(size='1KB') == 1024
+    assert parse_size(size='64kb') == 64 * 1024
+    assert parse_size(size='1.5MB') == int(1.5 * 1024 ** 2)
+    assert parse_size(size='1GB') == 1024 ** 3
+
+
+def test_generate_payload() -> None:
+    """
+    Test that generated payloads are deterministic and of the requested size.
+    """
+    assert len(generate_payload(size=1000)) == 1000
+    assert len(generate_payload(size=2)) == 2
+    assert generate_payload(size=100) == generate_payload(size=100)
+
+
+def test_bench_main(tmp_path: Path) -> None:
+    """
+    Test a small benchmark run along with baseline regression detection.
+    """
+    output_path = tmp_path / 'results.json'
+    try:
+        exit_code = main([
+            '--sizes', '1KB',
+            '--repeat', '1',
+            '--batch-items', '50',
+            '--output', str(output_path)
+        ])
+    finally:
+        set_logging_mode(mode='rich')
+    assert exit_code == 0
+
+    results = json.loads(output_path.read_text())
+    assert len(results) == 8
+    assert {result['operation'] for result in results} == {
+        'encode', 'decode', 'encode_loop', 'encode_batch'
+    }
+    assert all(
+        result['latency_per_item'] > 0
+        for result in results if result['operation'] in {'encode_loop', 'encode_batch'}
+    )
+    assert all(result['peak_memory'] > 0 for result in results)
+
+    # A baseline with a far higher throughput should be flagged as a regression
+    baseline = [{**result, 'throughput_mb_s': result['throughput_mb_s'] * 100} for result in results]
+    regressions = compare_to_baseline(results=results, baseline=baseline)
+    assert len(regressions) == len(results)
+    assert compare_to_baseline(results=results, baseline=results) == []
+
+
+def test_thread_scaling_benchmarks() -> None:
+    """
+    Test that the thread scaling benchmark reports a speedup for each thread count.
+    """
+    results = run_thread_scaling_benchmarks(size=256 * 1024, max_threads=3, repeat=1)
+
+    assert [result['name'] for result in results] == [
+        f'{operation}[size={256 * 1024},threads={threads}]'
+        for operation in ['encode_parallel', 'decode_parallel'] for threads in [1, 2, 3]
+    ]
+    assert all(result['speedup'] > 0 for result in results)
+    assert all(isinstance(result['gil_enabled'], bool) for result in results)
+    assert results[0]['speedup'] == results[3]['speedup'] == 1
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from simple_uu import (MemoryBudget, decode, decode_all, decode_parallel,
+                       decode_to_file, encode, encode_batch, encode_to_file,
+                       get_default_budget, set_default_budget)
+from simple_uu.bench import generate_payload
+
+
+def test_memory_budget() -> None:
+    """
+    Test that producers block until enough of the budget has been released.
+    """
+    budget = MemoryBudget(limit=100)
+    assert budget.acquire(nbytes=60) == 60
+
+    acquired = threading.Event()
+
+    def _producer() -> None:
+        with budget.reserve(nbytes=50):
+            acquired.set()
+
+    thread = threading.Thread(target=_producer)
+    thread.start()
+    assert not acquired.wait(timeout=0.1)
+
+    budget.release(nbytes=60)
+    thread.join(timeout=5)
+    assert acquired.is_set()
+
+    # Reservations larger than the budget wait for the whole budget
+    with budget.reserve(nbytes=1000) as reserved:
+        assert reserved == 100
+        with pytest.raises(TimeoutError):
+            _ = budget.acquire(nbytes=1, timeout=0.05)
+
+    telemetry = budget.as_dict()
+    assert telemetry['in_use'] == 0
+    assert telemetry['peak'] == 100
+    assert telemetry['peak_utilization'] == 1.0
+    assert telemetry['acquisitions'] == 3
+    assert telemetry['waits'] == 2
+    assert telemetry['wait_time'] > 0
+
+    with pytest.raises(ValueError):
+        budget.release(nbytes=1)
+    with pytest.raises(ValueError):
+        _ = MemoryBudget(limit=0)
+
+
+def test_memory_budget_async() -> None:
+    """
+    Test that async producers await the budget without blocking the event loop.
+    """
+    budget = MemoryBudget(limit=100)
+
+    async def _run() -> List[str]:
+        order: List[str] = []
+
+        async def _producer(name: str, nbytes: int) -> None:
+            async with budget.reserve_async(nbytes=nbytes):
+                order.append(name)
+                await asyncio.sleep(0.05)
+
+        await asyncio.gather(_producer('first', 80), _producer('second', 80))
+
+        # A release from another thread wakes the event loop
+        budget.acquire(nbytes=100)
+        threading.Timer(0.05, budget.release, kwargs={'nbytes': 100}).start()
+        async with budget.reserve_async(nbytes=10):
+            order.append('third')
+
+        return order
+
+    assert asyncio.run(_run()) == ['first', 'second', 'third']
+    assert budget.as_dict()['waits'] == 2
+    assert budget.in_use == 0
+
+
+def test_memory_budget_backpressure(tmp_path: Path) -> None:
+    """
+    Test that encode and decode calls draw from a budget shared between threads.
+    """
+    payload = generate_payload(size=450 * 1024)
+    uu_bytes = encode(file_object=payload, filename='example').uu_bytes
+
+    # Each decode reserves three quarters of its input, so only one fits at a time
+    budget = MemoryBudget(limit=len(uu_bytes))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        decoded_files = list(
+            executor.map(lambda _: decode(file_object=uu_bytes, budget=budget), range(8))
+        )
+    assert all(decoded_file.uu_bytes == payload for decoded_file in decoded_files)
+    assert budget.as_dict()['peak'] <= budget.limit
+    assert budget.as_dict()['acquisitions'] == 8
+
+    assert decode_parallel(
+        file_object=uu_bytes, workers=4, span_length=64 * 1024, budget=budget
+    ).uu_bytes == payload
+    mailbox = bytes(uu_bytes) + b'\n' + bytes(uu_bytes)
+    assert decode_all(file_object=mailbox, workers=2, budget=budget)[1].uu_bytes == payload
+    assert len(encode_batch(buffers=[payload[:1000]] * 10, budget=budget)) == 10
+
+    written_file = encode_to_file(
+        file_object=payload, directory=tmp_path, filename='example', budget=budget
+    )
+    assert decode_to_file(
+        file_object=written_file.path, directory=tmp_path, budget=budget
+    ).path.read_bytes() == payload
+    assert budget.in_use == 0
+
+
+def test_default_budget() -> None:
+    """
+    Test that calls draw from the default budget of the process when not given one.
+    """
+    budget = MemoryBudget(limit=1024 ** 2)
+    set_default_budget(budget=budget)
+    try:
+        assert get_default_budget() is budget
+        _ = encode(file_object=generate_payload(size=1000), filename='example')
+    finally:
+        set_default_budget(budget=None)
+
+    assert get_default_budget() is None
+    assert budget.as_dict()['acquisitions'] == 1
+
+    # Once removed, the budget is no longer used
+    _ = encode(file_object=generate_payload(size=1000), filename='example')
+    assert budget.as_dict()['acquisitions'] == 1
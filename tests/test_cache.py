@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from simple_uu import UUCache, decode
+
+
+def test_cache_decode() -> None:
+    """
+    Test that identical content is only decoded once and shared as a frozen result.
+    """
+    cache = UUCache()
+    encoded_path = Path('./tests/examples/encoded/example_1.txt')
+
+    decoded_file = cache.decode(file_object=encoded_path)
+    assert decoded_file.frozen
+    assert decoded_file.uu_bytes == decode(file_object=encoded_path).uu_bytes
+
+    # A path and bytes with the same content share an entry
+    assert cache.decode(file_object=encoded_path.read_bytes()) is decoded_file
+    assert cache.decode(file_object=encoded_path, encoding_validation=False) is not decoded_file
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 2
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: cache.decode(file_object=encoded_path), range(8)))
+    assert all(result is decoded_file for result in results)
+
+    with pytest.raises(AttributeError):
+        decoded_file.filename = 'changed'
+    with pytest.raises(AttributeError):
+        decoded_file.uu_bytes = bytearray()
+    with pytest.raises(TypeError):
+        decoded_file.digests['sha256'] = '' # type: ignore[index]
+
+
+def test_cache_encode_eviction() -> None:
+    """
+    Test that encode results are keyed by parameters and evicted within the budget.
+    """
+    decoded_path = './tests/examples/decoded/example_1.jpg'
+    encoded_size = len(UUCache().encode(file_object=decoded_path, filename='example').uu_bytes)
+
+    cache = UUCache(max_bytes=encoded_size * 2)
+    first_file = cache.encode(file_object=decoded_path, filename='example')
+    assert cache.encode(file_object=decoded_path, filename='example') is first_file
+    assert cache.encode(file_object=decoded_path, filename='other') is not first_file
+
+    # The least recently used entry is evicted once the budget is exceeded
+    _ = cache.encode(file_object=decoded_path, filename='example', octal_permission=0o600)
+    stats = cache.stats()
+    assert stats['entries'] == 2
+    assert stats['evictions'] == 1
+    assert stats['current_bytes'] <= cache.max_bytes
+    assert cache.encode(file_object=decoded_path, filename='example') is not first_file
+
+    # Results larger than the budget are not cached
+    small_cache = UUCache(max_bytes=10)
+    _ = small_cache.encode(file_object=decoded_path, filename='example')
+    assert len(small_cache) == 0
+
+    cache.clear()
+    assert cache.stats()['hits'] == 0 and len(cache) == 0
+
+    with pytest.raises(ValueError):
+        _ = UUCache(max_bytes=-1)
@@ -0,0 +1,150 @@
+import gzip
+import shutil
+import sys
+from io import BytesIO, TextIOWrapper
+from pathlib import Path
+
+import pytest
+
+from simple_uu import decode
+from simple_uu.cli import expand_paths, main
+
+
+def test_expand_paths(tmp_path: Path) -> None:
+    """
+    Test expanding files, directories and glob patterns into a list of files.
+    """
+    (tmp_path / 'nested').mkdir()
+    for name in ['a.txt', 'b.txt', 'c.jpg', 'nested/d.txt', '.simple-uu-1234.part']:
+        (tmp_path / name).write_bytes(b'')
+
+    assert expand_paths(paths=[str(tmp_path)]) == [
+        tmp_path / 'a.txt', tmp_path / 'b.txt', tmp_path / 'c.jpg'
+    ]
+    assert expand_paths(paths=[str(tmp_path / '**' / '*.txt'), str(tmp_path / 'a.txt')]) == [
+        tmp_path / 'a.txt', tmp_path / 'b.txt', tmp_path / 'nested' / 'd.txt'
+    ]
+    assert len(expand_paths(paths=[str(tmp_path)], recursive=True)) == 4
+
+
+def test_cli_files(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """
+    Test encoding and decoding directories with a worker pool, reporting failures.
+    """
+    input_dir = tmp_path / 'input'
+    shutil.copytree('./tests/examples/decoded', input_dir)
+    (input_dir / 'notes.txt').write_text('plain text is not binary')
+
+    exit_code = main(['encode', str(input_dir), '-o', str(tmp_path / 'encoded'), '-j', '2'])
+    captured = capsys.readouterr()
+    assert exit_code == 1
+    assert f'error: {input_dir / "notes.txt"}: InvalidUUEncodingError' in captured.err
+    assert '4 succeeded, 1 failed' in captured.err
+
+    exit_code = main([
+        'decode', str(tmp_path / 'encoded' / '*.txt'), '-o', str(tmp_path / 'decoded')
+    ])
+    captured = capsys.readouterr()
+    assert exit_code == 0
+    assert '4 succeeded, 0 failed' in captured.err
+
+    for example_path in Path('./tests/examples/decoded').iterdir():
+        decoded_path = tmp_path / 'decoded' / example_path.name
+        decoded_path.chmod(0o644)
+        assert decoded_path.read_bytes() == example_path.read_bytes()
+
+
+def test_cli_files_overwrite(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """
+    Test refusing to replace an input or an existing output without --force.
+    """
+    data_path = tmp_path / 'data.txt'
+    data_path.write_bytes(b'plain text')
+    assert main(['encode', '--no-validation', str(data_path)]) == 1
+    assert 'FileExistsError' in capsys.readouterr().err
+    assert data_path.read_bytes() == b'plain text'
+    assert sorted(tmp_path.iterdir()) == [data_path]
+
+    note_path = tmp_path / 'in' / 'note.txt'
+    note_path.parent.mkdir()
+    note_path.write_bytes(b'begin 644 note.txt\n#86)C\n`\nend\n')
+    assert main(['decode', str(note_path)]) == 1
+    assert 'FileExistsError' in capsys.readouterr().err
+    assert note_path.read_bytes() == b'begin 644 note.txt\n#86)C\n`\nend\n'
+
+    assert main(['decode', '--force', str(note_path)]) == 0
+    assert note_path.read_bytes() == b'abc'
+
+
+def test_cli_files_rerun(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """
+    Test that outputs of an earlier run over a directory are not processed as inputs.
+    """
+    input_dir = tmp_path / 'input'
+    shutil.copytree('./tests/examples/decoded', input_dir)
+
+    assert main(['encode', str(input_dir)]) == 0
+    assert '4 succeeded, 0 failed' in capsys.readouterr().err
+    encoded_paths = sorted(input_dir.glob('*.txt'))
+    assert len(encoded_paths) == 4
+
+    assert main(['encode', str(input_dir)]) == 1
+    captured = capsys.readouterr()
+    assert '0 succeeded, 4 failed, 4 skipped' in captured.err
+    assert 'FileExistsError' in captured.err
+    assert (
+        f'skipped: {input_dir / "example_1.txt"}: output of {input_dir / "example_1.jpg"}'
+        in captured.err
+    )
+
+    assert main(['encode', '--force', str(input_dir)]) == 0
+    assert '4 succeeded, 0 failed, 4 skipped' in capsys.readouterr().err
+    assert sorted(input_dir.glob('*.txt')) == encoded_paths
+
+    # Decoding in place and running again only decodes the uuencoded files
+    decoded_dir = tmp_path / 'decoded'
+    decoded_dir.mkdir()
+    for encoded_path in encoded_paths:
+        shutil.copy(encoded_path, decoded_dir)
+
+    assert main(['decode', str(decoded_dir)]) == 0
+    assert '4 succeeded, 0 failed' in capsys.readouterr().err
+    assert main(['decode', '--force', str(decoded_dir)]) == 0
+    assert '4 succeeded, 0 failed, 4 skipped' in capsys.readouterr().err
+    assert len(list(decoded_dir.iterdir())) == 8
+
+    # Files named explicitly are always processed
+    report_dir = tmp_path / 'report'
+    report_dir.mkdir()
+    (report_dir / 'report.pdf').write_bytes(b'%PDF-1.4 report')
+    (report_dir / 'report.txt').write_bytes(b'plain text')
+    assert main([
+        'encode', '--no-validation', str(report_dir / 'report.pdf'), str(report_dir / 'report.txt')
+    ]) == 1
+    captured = capsys.readouterr()
+    assert '0 succeeded, 2 failed' in captured.err
+    assert 'skipped' not in captured.err
+
+
+def test_cli_stream(monkeypatch: pytest.MonkeyPatch, capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+    """
+    Test streaming stdin to stdout, with compressed output.
+    """
+    payload = Path('./tests/examples/decoded/example_1.jpg').read_bytes()
+
+    monkeypatch.setattr(sys, 'stdin', TextIOWrapper(BytesIO(payload)))
+    assert main(['encode', '--name', 'photo', '--mode', '600', '--compress', 'gzip']) == 0
+    captured = capsysbinary.readouterr()
+    assert b'1 succeeded, 0 failed' in captured.err
+
+    encoded = gzip.decompress(captured.out)
+    assert encoded.startswith(b'begin 600 photo.jpg\n')
+    assert decode(file_object=encoded).uu_bytes == payload
+
+    monkeypatch.setattr(sys, 'stdin', TextIOWrapper(BytesIO(gzip.compress(encoded))))
+    assert main(['decode', '-']) == 0
+    assert capsysbinary.readouterr().out == payload
+
+    monkeypatch.setattr(sys, 'stdin', TextIOWrapper(BytesIO(b'not uuencoded')))
+    assert main(['decode']) == 1
+    assert b"error: -: InvalidUUDecodingError: Missing 'begin'" in capsysbinary.readouterr().err
@@ -0,0 +1,103 @@
+import bz2
+import gzip
+import lzma
+from io import BytesIO
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import pytest
+
+from simple_uu import decode, decode_to_file, encode, encode_to_file
+from simple_uu.compression import detect_compression, open_decompressed
+
+
+def test_detect_compression() -> None:
+    """
+    Test detecting the compression format from magic bytes without consuming data.
+    """
+    data = b'begin 644 example.txt\n'
+    compressors: List[Tuple[Callable[[bytes], bytes], str]] = [
+        (gzip.compress, 'gzip'), (bz2.compress, 'bz2'), (lzma.compress, 'xz')
+    ]
+    for compress, compression in compressors:
+        compressed_stream = BytesIO(compress(data))
+        assert detect_compression(binary_stream=compressed_stream) == compression
+        assert compressed_stream.tell() == 0
+
+        decompressed_stream = open_decompressed(
+            binary_stream=compressed_stream, compression='auto'
+        )
+        assert decompressed_stream.read() == data
+
+    plain_stream = BytesIO(data)
+    assert detect_compression(binary_stream=plain_stream) is None
+    assert open_decompressed(binary_stream=plain_stream, compression='auto') is plain_stream
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = open_decompressed(binary_stream=plain_stream, compression='zip')
+    assert str(exc_info.value) == "Compression must be one of 'gzip', 'bz2', 'xz' or 'zstd'"
+
+
+def test_decode_to_file_compressed(tmp_path: Path) -> None:
+    """
+    Test decoding compressed sources and compressing the decoded output.
+    """
+    encoded_path = Path('./tests/examples/encoded/example_1.txt')
+    decoded_file = decode(file_object=encoded_path)
+
+    # The format of the source is detected by default
+    compressed_path = tmp_path / 'example_1.txt.gz'
+    compressed_path.write_bytes(gzip.compress(encoded_path.read_bytes()))
+    written_file = decode_to_file(file_object=compressed_path, directory=tmp_path)
+    written_file.path.chmod(0o644)
+    assert written_file.path == tmp_path / 'example_1.jpg'
+    assert written_file.path.read_bytes() == decoded_file.uu_bytes
+
+    written_file = decode_to_file(
+        file_object=bz2.compress(encoded_path.read_bytes()),
+        directory=tmp_path,
+        source_compression='bz2',
+        compression='xz'
+    )
+    written_file.path.chmod(0o644)
+    assert written_file.path == tmp_path / 'example_1.jpg.xz'
+    assert written_file.size == len(decoded_file.uu_bytes)
+    assert lzma.decompress(written_file.path.read_bytes()) == decoded_file.uu_bytes
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = decode_to_file(
+            file_object=encoded_path,
+            directory=tmp_path,
+            checkpoint_interval=64 * 1024,
+            compression='gzip'
+        )
+    assert str(exc_info.value) == 'Compressed output cannot be checkpointed'
+
+
+def test_encode_to_file_compressed(tmp_path: Path) -> None:
+    """
+    Test encoding compressed sources and compressing the encoded output.
+    """
+    decoded_path = Path('./tests/examples/decoded/example_1.jpg')
+    encoded_file = encode(file_object=decoded_path, filename='example_1')
+
+    written_file = encode_to_file(
+        file_object=gzip.compress(decoded_path.read_bytes()),
+        directory=tmp_path,
+        filename='example_1',
+        source_compression='auto',
+        compression='gzip'
+    )
+    assert written_file.path == tmp_path / 'example_1.txt.gz'
+    assert written_file.file_extension == 'jpg'
+    assert gzip.decompress(written_file.path.read_bytes()) == encoded_file.uu_bytes
+
+    # Failed writes do not leave a partial file behind
+    with pytest.raises(ValueError):
+        _ = encode_to_file(
+            file_object=decoded_path,
+            directory=tmp_path,
+            filename='example_1',
+            compression='zip'
+        )
+    assert not list(tmp_path.glob('.simple-uu-*'))
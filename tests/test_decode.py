@@ -1,7 +1,31 @@
+import base64
+import hashlib
+import json
+import os
+import stat
+from io import BytesIO
+from pathlib import Path
+
 import pytest
 
 from simple_uu import (FileExtensionNotFoundError, InvalidPermissionsMode,
-                       InvalidUUDecodingError, decode)
+                       InvalidUUDecodingError, UULineError, decode,
+                       decode_to_file, encode, find_checkpoint)
+from simple_uu.bench import generate_payload
+
+
+class _InterruptedStream(BytesIO):
+    """
+    A binary stream that fails once a number of bytes have been read.
+    """
+    def __init__(self, data: bytes, limit: int):
+        super().__init__(data)
+        self.limit = limit
+
+    def __next__(self) -> bytes:
+        if self.tell() > self.limit:
+            raise OSError('Stream was interrupted')
+        return super().__next__()
 
 
 def test_decode_error_character_encoding() -> None:
@@ -96,6 +120,33 @@ def test_decode_illegal_character() -> None:
     )
 
 
+def test_decode_lenient() -> None:
+    """
+    Test repairing malformed lines and collecting their errors in lenient mode.
+    """
+    example_file_object = bytearray( # The lowercase q and trailing garbage are the issues
+        b'begin 742 example.jpg\n'
+        b'M./JH%ZQWFGW/;*I&+I^#6:.8U9AY_Y>IF/5Y&%,q*_8PIJL2,EV7D*E10J:;\n'
+        b'M./JH%ZQWFGW/;*I&+I^#6:.8U9AY_Y>IF/5Y&%,Q*_8PIJL2,EV7D*E10J:;\n'
+        b'#86)C**\n'
+        b'`\nend'
+    )
+    decoded_file = decode(file_object=example_file_object, strict=False)
+    assert decoded_file.line_errors == [
+        UULineError(line_number=2, reason='illegal characters'),
+        UULineError(line_number=4, reason='trailing characters')
+    ]
+    assert len(decoded_file.uu_bytes) == 45 + 45 + 3
+    assert decoded_file.uu_bytes[45:90] == decode(
+        file_object=example_file_object.replace(b'q', b'Q'), strict=False
+    ).uu_bytes[45:90]
+    assert decoded_file.uu_bytes[90:] == b'abc'
+
+    # Strict mode is unchanged and raises on the first malformed line
+    with pytest.raises(InvalidUUDecodingError):
+        _ = decode(file_object=example_file_object)
+
+
 def test_decode_error_file_extension() -> None:
     """
     Test error handling for an unknown file extension/type.
@@ -244,3 +295,268 @@ def test_decode_complete() -> None:
     assert example_4_decode.full_filename == 'example_4.pptx'
     assert example_4_decode.permissions_mode == '741'
     assert example_4_decode.uu_bytes == example_4_decoded_test
+
+
+def test_decode_to_file(tmp_path: Path) -> None:
+    """
+    Testing the decode_to_file function streams the same output as decode.
+    """
+    for example, extension in [(1, 'jpg'), (2, 'xlsx'), (3, 'docx'), (4, 'pptx')]:
+        encoded_path = f'./tests/examples/encoded/example_{example}.txt'
+        decoded_file = decode(file_object=encoded_path)
+        written_file = decode_to_file(file_object=encoded_path, directory=tmp_path)
+
+        assert written_file.path == tmp_path / f'example_{example}.{extension}'
+        assert written_file.full_filename == decoded_file.full_filename
+        assert written_file.file_mime_type == decoded_file.file_mime_type
+        assert written_file.permissions_mode == decoded_file.permissions_mode
+        assert written_file.size == len(decoded_file.uu_bytes)
+
+        if os.name == 'posix':
+            file_mode = stat.S_IMODE(written_file.path.stat().st_mode)
+            assert file_mode == int(decoded_file.permissions_mode, 8)
+
+        # Permissions mode from header may not allow reading
+        written_file.path.chmod(0o644)
+        assert written_file.path.read_bytes() == decoded_file.uu_bytes
+
+    # No temporary files should be left behind
+    assert not list(tmp_path.glob('.simple-uu-*'))
+
+
+def test_decode_to_file_path_traversal(tmp_path: Path) -> None:
+    """
+    Test that a path in the header cannot place the file outside of the directory.
+    """
+    directory = tmp_path / 'output'
+    directory.mkdir()
+    payload = generate_payload(size=1000)
+
+    for filename in ['../escaped.jpg', str(tmp_path / 'escaped.jpg')]:
+        uu_bytes = encode(file_object=payload, filename='escaped').uu_bytes
+        uu_bytes = uu_bytes.replace(b'escaped.jpg', filename.encode('ascii'), 1)
+
+        written_file = decode_to_file(file_object=uu_bytes, directory=directory)
+        assert written_file.path == directory / 'escaped.jpg'
+        assert written_file.path.read_bytes() == payload
+        assert list(tmp_path.iterdir()) == [directory]
+
+
+def test_decode_to_file_lenient(tmp_path: Path) -> None:
+    """
+    Test repairing malformed lines when decoding directly to a file.
+    """
+    example_file_object = bytearray(
+        b'\n\nbegin 644 example.txt\n#86)C**\n#86)C\n`\nend\n'
+    )
+    written_file = decode_to_file(
+        file_object=example_file_object, directory=tmp_path, strict=False
+    )
+    assert written_file.line_errors == [
+        UULineError(line_number=4, reason='trailing characters')
+    ]
+    assert written_file.path.read_bytes() == b'abcabc'
+
+
+def test_decode_to_file_error(tmp_path: Path) -> None:
+    """
+    Test that a failed decode_to_file does not leave a partial file behind.
+    """
+    example_file_object = bytearray( # The lowercase q is the issue in this example
+        b'begin 742 example.jpg\nM./JH%ZQWFGW/;*I&+I^#6:.8U9AY_Y>IF/5Y&%,q*_8PIJL2,EV7D*E10J:;\nend'
+    )
+    with pytest.raises(InvalidUUDecodingError):
+        _ = decode_to_file(file_object=example_file_object, directory=tmp_path)
+    assert not list(tmp_path.iterdir())
+
+    with pytest.raises(InvalidUUDecodingError) as exc_info:
+        _ = decode_to_file(
+            file_object=b'begin 777 example.jpg\n\xC3\x28\x96\xA0\nend', directory=tmp_path
+        )
+    assert str(exc_info.value) == (
+        'Invalid character encoding, file must have an ascii character encoding'
+    )
+    assert not list(tmp_path.iterdir())
+
+    with pytest.raises(NotADirectoryError):
+        _ = decode_to_file(
+            file_object='./tests/examples/encoded/example_1.txt',
+            directory=tmp_path / 'missing'
+        )
+
+
+def test_decode_to_file_resume(tmp_path: Path) -> None:
+    """
+    Test resuming an interrupted decode_to_file from its last checkpoint.
+    """
+    payload = generate_payload(size=400 * 1024)
+    uu_bytes = bytes(
+        encode(
+            file_object=payload,
+            filename='example',
+            octal_permission=0o644,
+            extension='jpg',
+            encoding_validation=False
+        ).uu_bytes
+    )
+
+    with pytest.raises(OSError):
+        _ = decode_to_file(
+            file_object=_InterruptedStream(data=uu_bytes, limit=len(uu_bytes) * 3 // 4),
+            directory=tmp_path,
+            checkpoint_interval=64 * 1024
+        )
+
+    # The partial output and its checkpoint are kept
+    checkpoint_path = find_checkpoint(file_object=uu_bytes, directory=tmp_path)
+    assert checkpoint_path is not None
+    assert len(list(tmp_path.glob('.simple-uu-*.part'))) == 1
+
+    written_file = decode_to_file(
+        file_object=uu_bytes,
+        directory=tmp_path,
+        checkpoint_interval=64 * 1024,
+        resume_from=checkpoint_path,
+        digests=['sha256']
+    )
+    assert written_file.path.read_bytes() == payload
+    assert written_file.size == len(payload)
+    assert written_file.digests == {'sha256': hashlib.sha256(payload).hexdigest()}
+    assert find_checkpoint(file_object=uu_bytes, directory=tmp_path) is None
+    assert not list(tmp_path.glob('.simple-uu-*'))
+
+
+def test_decode_to_file_resume_error(tmp_path: Path) -> None:
+    """
+    Test that resuming fails if the partial output does not match the checkpoint.
+    """
+    payload = generate_payload(size=400 * 1024)
+    uu_bytes = bytes(
+        encode(
+            file_object=payload,
+            filename='example',
+            octal_permission=0o644,
+            extension='jpg',
+            encoding_validation=False
+        ).uu_bytes
+    )
+
+    with pytest.raises(OSError):
+        _ = decode_to_file(
+            file_object=_InterruptedStream(data=uu_bytes, limit=len(uu_bytes) // 2),
+            directory=tmp_path,
+            checkpoint_interval=64 * 1024
+        )
+
+    checkpoint_path = find_checkpoint(file_object=uu_bytes, directory=tmp_path)
+    assert checkpoint_path is not None
+
+    part_path = next(tmp_path.glob('.simple-uu-*.part'))
+    with open(part_path, 'r+b') as part_file:
+        part_file.write(b'\x00')
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = decode_to_file(
+            file_object=uu_bytes, directory=tmp_path, resume_from=checkpoint_path
+        )
+    assert str(exc_info.value) == 'Partial output does not match checkpoint'
+
+    # A checkpoint cannot point the resumed write outside of the directory
+    checkpoint_data = json.loads(checkpoint_path.read_text())
+    for part_name in ['../escaped.part', str(tmp_path.parent / 'escaped.part')]:
+        checkpoint_path.write_text(json.dumps({**checkpoint_data, 'part_name': part_name}))
+        with pytest.raises(ValueError) as exc_info:
+            _ = decode_to_file(
+                file_object=uu_bytes, directory=tmp_path, resume_from=checkpoint_path
+            )
+        assert str(exc_info.value) == 'Checkpoint does not name the partial output of its header'
+    assert not (tmp_path.parent / 'escaped.part').exists()
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = decode_to_file(
+            file_object=uu_bytes, directory=tmp_path, checkpoint_interval=0
+        )
+    assert str(exc_info.value) == 'Checkpoint interval must be a positive number of bytes'
+
+
+def test_decode_base64(tmp_path: Path) -> None:
+    """
+    Test decoding the begin-base64 variant, detected from the header.
+    """
+    binary_data = Path('./tests/examples/decoded/example_1.jpg').read_bytes()
+
+    # Lines of any length are accepted, such as those of base64.encodebytes
+    uu_bytes = (
+        b'begin-base64 640 example_1.jpg\n' + base64.encodebytes(binary_data) + b'====\n'
+    )
+    decoded_file = decode(file_object=uu_bytes)
+    assert decoded_file.uu_bytes == binary_data
+    assert decoded_file.full_filename == 'example_1.jpg'
+    assert decoded_file.permissions_mode == '640'
+
+    encoded_file = encode(file_object=binary_data, filename='example_1', variant='base64')
+    assert decode(file_object=encoded_file.uu_bytes).uu_bytes == binary_data
+
+    written_file = decode_to_file(file_object=encoded_file.uu_bytes, directory=tmp_path)
+    assert written_file.path.read_bytes() == binary_data
+
+    # Illegal characters and an incomplete final quantum are repaired in lenient mode
+    malformed_bytes = b'begin-base64 644 example.jpg\n/9j/4AAQ\nSkZJ*RgAB\nAQE\n====\n'
+    with pytest.raises(InvalidUUDecodingError) as exc_info:
+        _ = decode(file_object=malformed_bytes)
+    assert str(exc_info.value).startswith('Invalid base64 data')
+
+    decoded_file = decode(file_object=malformed_bytes, strict=False)
+    assert decoded_file.uu_bytes == base64.b64decode(b'/9j/4AAQSkZJRgABAQE=')
+    assert decoded_file.line_errors == [
+        UULineError(line_number=3, reason='illegal characters'),
+        UULineError(line_number=4, reason='incomplete base64 data')
+    ]
+
+    # Padding that no longer ends a quantum after a line was lost is rejected or redone
+    truncated_bytes = b'begin-base64 644 example.jpg\n/9j/4AAQ\nSkZ\nAQE=\n====\n'
+    with pytest.raises(InvalidUUDecodingError):
+        _ = decode(file_object=truncated_bytes, encoding_validation=False)
+
+    decoded_file = decode(file_object=truncated_bytes, encoding_validation=False, strict=False)
+    assert decoded_file.uu_bytes == base64.b64decode(b'/9j/4AAQSkZAQE==')
+
+    # Padding in the middle of the data is rejected in strict mode
+    padded_bytes = b'begin-base64 644 example.jpg\n/9j/4A==\nSkZJRgAB\n====\n'
+    with pytest.raises(InvalidUUDecodingError) as exc_info:
+        _ = decode(file_object=padded_bytes, encoding_validation=False)
+    assert str(exc_info.value) == 'Invalid base64 data, padding is misplaced'
+
+
+def test_decode_to_file_resume_base64(tmp_path: Path) -> None:
+    """
+    Test resuming an interrupted decode_to_file of the begin-base64 variant.
+    """
+    payload = generate_payload(size=400 * 1024)
+    uu_bytes = bytes(
+        encode(
+            file_object=payload,
+            filename='example',
+            extension='jpg',
+            encoding_validation=False,
+            variant='base64'
+        ).uu_bytes
+    )
+
+    with pytest.raises(OSError):
+        _ = decode_to_file(
+            file_object=_InterruptedStream(data=uu_bytes, limit=len(uu_bytes) * 3 // 4),
+            directory=tmp_path,
+            checkpoint_interval=64 * 1024
+        )
+
+    checkpoint_path = find_checkpoint(file_object=uu_bytes, directory=tmp_path)
+    assert checkpoint_path is not None
+
+    written_file = decode_to_file(
+        file_object=uu_bytes,
+        directory=tmp_path,
+        checkpoint_interval=64 * 1024,
+        resume_from=checkpoint_path
+    )
+    assert written_file.path.read_bytes() == payload
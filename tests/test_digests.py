@@ -0,0 +1,65 @@
+import hashlib
+import zlib
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from simple_uu import decode, decode_to_file, encode, encode_to_file
+from simple_uu.digests import DigestSet
+
+
+def _expected_digests(data: bytes) -> Dict[str, str]:
+    return {
+        'crc32': f'{zlib.crc32(data):08x}',
+        'sha256': hashlib.sha256(data).hexdigest()
+    }
+
+
+def test_digest_set() -> None:
+    """
+    Test incremental digests match digests computed in a single pass.
+    """
+    data = bytes(range(256)) * 1000
+
+    digest_set = DigestSet(names=['crc32', 'SHA256'])
+    buffer = bytearray()
+    digested_length = 0
+    for index in range(0, len(data), 999):
+        buffer.extend(data[index:index + 999])
+        digested_length = digest_set.update_from(buffer=buffer, start=digested_length)
+
+    assert digested_length == len(data)
+    assert digest_set.hexdigests() == _expected_digests(data=data)
+
+    with pytest.raises(ValueError) as exc_info:
+        DigestSet(names=['fake'])
+    assert str(exc_info.value) == 'Unsupported digest algorithm fake'
+
+
+def test_digests_encode_decode(tmp_path: Path) -> None:
+    """
+    Test digests computed while encoding and decoding, in memory and streamed to disk.
+    """
+    for example, extension in [(1, 'jpg'), (2, 'xlsx')]:
+        decoded_path = f'./tests/examples/decoded/example_{example}.{extension}'
+        encoded_path = f'./tests/examples/encoded/example_{example}.txt'
+        expected_digests = _expected_digests(data=Path(decoded_path).read_bytes())
+
+        assert encode(
+            file_object=decoded_path, filename='example', digests=['crc32', 'sha256']
+        ).digests == expected_digests
+        assert encode_to_file(
+            file_object=decoded_path,
+            directory=tmp_path,
+            filename='example',
+            digests=['crc32', 'sha256']
+        ).digests == expected_digests
+        assert decode(
+            file_object=encoded_path, digests=['crc32', 'sha256']
+        ).digests == expected_digests
+        assert decode_to_file(
+            file_object=encoded_path, directory=tmp_path, digests=['crc32', 'sha256']
+        ).digests == expected_digests
+
+    assert decode(file_object='./tests/examples/encoded/example_1.txt').digests == dict()
@@ -1,7 +1,10 @@
+import base64
+from pathlib import Path
+
 import pytest
 
 from simple_uu import (FileExtensionNotDetected, InvalidPermissionsMode,
-                       InvalidUUEncodingError, encode)
+                       InvalidUUEncodingError, encode, encode_to_file)
 
 
 def _normalize_newlines(data: bytes) -> bytes:
@@ -242,3 +245,89 @@ def test_encode_complete() -> None:
     assert example_4_encode.full_filename == 'example_4.pptx'
     assert example_4_encode.permissions_mode == '741'
     assert example_4_encode.uu_bytes == example_4_encoded_test
+
+
+def test_encode_to_file(tmp_path: Path) -> None:
+    """
+    Testing the encode_to_file function streams the same output as encode.
+    """
+    for example, extension in [(1, 'jpg'), (2, 'xlsx'), (3, 'docx'), (4, 'pptx')]:
+        decoded_path = f'./tests/examples/decoded/example_{example}.{extension}'
+        encoded_file = encode(
+            file_object=decoded_path, filename=f'example_{example}', octal_permission='644'
+        )
+
+        for fsync in ['none', 'file', 'directory']:
+            written_file = encode_to_file(
+                file_object=decoded_path,
+                directory=tmp_path,
+                filename=f'example_{example}',
+                octal_permission='644',
+                buffer_size=4096,
+                fsync=fsync
+            )
+
+            assert written_file.path == tmp_path / encoded_file.output_filename
+            assert written_file.full_filename == encoded_file.full_filename
+            assert written_file.file_mime_type == encoded_file.file_mime_type
+            assert written_file.permissions_mode == '644'
+            assert written_file.size == len(encoded_file.uu_bytes)
+            assert written_file.path.read_bytes() == encoded_file.uu_bytes
+
+    # No temporary files should be left behind
+    assert not list(tmp_path.glob('.simple-uu-*'))
+
+
+def test_encode_to_file_error(tmp_path: Path) -> None:
+    """
+    Test error handling for encode_to_file.
+    """
+    with pytest.raises(ValueError) as exc_info:
+        _ = encode_to_file(
+            file_object='./tests/examples/decoded/example_1.jpg',
+            directory=tmp_path,
+            filename='example_1',
+            fsync='always'
+        )
+    assert str(exc_info.value) == (
+        "Fsync policy must be one of 'none', 'file' or 'directory'"
+    )
+
+    with pytest.raises(InvalidUUEncodingError):
+        _ = encode_to_file(
+            file_object=bytearray(b'this is clearly not binary data, should throw an error'),
+            directory=tmp_path,
+            filename='example',
+            extension='jpg'
+        )
+    assert not list(tmp_path.iterdir())
+
+
+def test_encode_base64(tmp_path: Path) -> None:
+    """
+    Test encoding with the begin-base64 variant, as written by uuencode -m.
+    """
+    decoded_path = './tests/examples/decoded/example_1.jpg'
+    binary_data = Path(decoded_path).read_bytes()
+
+    encoded_file = encode(
+        file_object=decoded_path, filename='example_1', octal_permission='644', variant='base64'
+    )
+    lines = bytes(encoded_file.uu_bytes).split(b'\n')
+    assert lines[0] == b'begin-base64 644 example_1.jpg'
+    assert lines[-1] == b'===='
+    assert {len(line) for line in lines[1:-2]} == {60}
+    assert base64.b64decode(b''.join(lines[1:-1])) == binary_data
+
+    written_file = encode_to_file(
+        file_object=decoded_path,
+        directory=tmp_path,
+        filename='example_1',
+        octal_permission='644',
+        variant='base64'
+    )
+    assert written_file.path.read_bytes() == encoded_file.uu_bytes
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = encode(file_object=decoded_path, filename='example_1', variant='base85')
+    assert str(exc_info.value) == "Variant must be either 'uu' or 'base64'"
@@ -0,0 +1,39 @@
+import json
+from pathlib import Path
+
+from simple_uu.fuzz import generate_cases, main, run_fuzz, summarize
+from simple_uu.logger import set_logging_mode
+
+
+def test_generate_cases() -> None:
+    """
+    Test that cases are deterministic and cover every kind and variant.
+    """
+    cases = generate_cases(count=40, seed=1, max_size=2048)
+
+    assert cases == generate_cases(count=40, seed=1, max_size=2048)
+    assert {case.kind for case in cases} == {'valid', 'crlf', 'header', 'malformed'}
+    assert {case.variant for case in cases} == {'uu', 'base64'}
+    assert all(b'\r\n' in case.uu_bytes for case in cases if case.kind == 'crlf')
+
+
+def test_run_fuzz(tmp_path: Path) -> None:
+    """
+    Test that every engine matches the reference and that throughput is recorded.
+    """
+    results = run_fuzz(cases=generate_cases(count=40, seed=2, max_size=2048))
+
+    assert {result['engine'] for result in results} == {
+        'encode', 'encode_parallel', 'encode_to_file', 'encode_batch', 'decode',
+        'decode_parallel', 'decode_to_file', 'decode_to_file_stream', 'decode_all'
+    }
+    assert summarize(results=results)['mismatches'] == []
+    assert all(result['throughput_mb_s'] > 0 for result in results)
+
+    output_path = tmp_path / 'results.json'
+    try:
+        exit_code = main(['--cases', '8', '--max-size', '1KB', '--output', str(output_path)])
+    finally:
+        set_logging_mode(mode='rich')
+    assert exit_code == 0
+    assert all(result['match'] for result in json.loads(output_path.read_text()))
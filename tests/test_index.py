@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from simple_uu import UUIndex, decode
+
+
+def test_index_read_range() -> None:
+    """
+    Test decoding byte ranges using an index against a full decode.
+    """
+    for example in range(1, 5):
+        encoded_path = f'./tests/examples/encoded/example_{example}.txt'
+        decoded_bytes = decode(file_object=encoded_path).uu_bytes
+        index = UUIndex.build(file_object=encoded_path)
+
+        assert index.decoded_size == len(decoded_bytes)
+
+        decoded_size = len(decoded_bytes)
+        for offset, length in [
+            (0, 1),
+            (0, 4096),
+            (44, 2),
+            (45, 45),
+            (1000, 10000),
+            (decoded_size - 4096, 4096),
+            (decoded_size - 1, 100),
+            (0, decoded_size)
+        ]:
+            assert index.read_range(offset=offset, length=length) == (
+                decoded_bytes[offset:offset + length]
+            )
+
+        assert index.read_range(offset=decoded_size, length=10) == b''
+
+
+def test_index_mixed_line_endings() -> None:
+    """
+    Test an index over data with mixed line endings and blank lines.
+    """
+    encoded_bytes = Path('./tests/examples/encoded/example_1.txt').read_bytes()
+    lines = encoded_bytes.replace(b'\r\n', b'\n').split(b'\n')
+    mixed_bytes = b'\n\n' + b''.join(
+        line + (b'\r\n' if number % 3 else b'\n') + (b'\n' if number == 10 else b'')
+        for number, line in enumerate(lines)
+    )
+
+    decoded_bytes = decode(file_object=mixed_bytes).uu_bytes
+    index = UUIndex.build(file_object=mixed_bytes)
+
+    assert index.decoded_size == len(decoded_bytes)
+    assert index.read_range(offset=0, length=len(decoded_bytes)) == decoded_bytes
+    assert index.read_range(offset=400, length=1234) == decoded_bytes[400:1634]
+
+
+def test_index_save_load(tmp_path: Path) -> None:
+    """
+    Test persisting and loading an index.
+    """
+    encoded_path = './tests/examples/encoded/example_2.txt'
+    index = UUIndex.build(file_object=encoded_path)
+    index.save(path=tmp_path / 'example_2.index')
+
+    loaded_index = UUIndex.load(path=tmp_path / 'example_2.index', file_object=encoded_path)
+    assert loaded_index.header == index.header
+    assert loaded_index.decoded_size == index.decoded_size
+    assert loaded_index.read_range(offset=123, length=456) == (
+        index.read_range(offset=123, length=456)
+    )
+
+    with pytest.raises(ValueError) as exc_info:
+        UUIndex.load(path=tmp_path / 'example_2.index').read_range(offset=0, length=1)
+    assert str(exc_info.value) == 'Index does not have a file object to read from'
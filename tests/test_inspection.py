@@ -0,0 +1,84 @@
+import gzip
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from simple_uu import (InvalidUUDecodingError, UULineError, decode, encode,
+                       inspect)
+from simple_uu.bench import generate_payload
+
+
+def test_inspect_header(tmp_path: Path) -> None:
+    """
+    Test reading metadata from the header alone.
+    """
+    uu_bytes = b'begin 755 example.jpg\n' + b'not uuencoded data\n' * 10
+
+    inspection = inspect(file_object=uu_bytes)
+    assert inspection.variant == 'uu'
+    assert inspection.filename == 'example'
+    assert inspection.file_extension == 'jpg'
+    assert inspection.permissions_mode == '755'
+    assert not inspection.scanned
+    assert inspection.valid is None
+
+    path = tmp_path / 'example.uue'
+    path.write_bytes(b'\n\n' + uu_bytes)
+    assert inspect(file_object=path) == inspection
+    assert inspect(file_object=gzip.compress(uu_bytes), compression='auto') == inspection
+
+    inspection = inspect(file_object=BytesIO(b'begin-base64 644 example\n===='))
+    assert inspection.variant == 'base64'
+    assert inspection.file_extension is None
+
+    with pytest.raises(InvalidUUDecodingError):
+        _ = inspect(file_object=b'start 644 example.jpg\nend')
+
+
+def test_inspect_scan() -> None:
+    """
+    Test scanning the structure of the data to find its decoded size and end line.
+    """
+    for size in [1034, 1035, 1036, 10_000]:
+        payload = generate_payload(size=size)
+
+        for variant in ['uu', 'base64']:
+            uu_bytes = encode(file_object=payload, filename='example', variant=variant).uu_bytes
+            inspection = inspect(file_object=uu_bytes + b'\nother text\n', scan=True)
+
+            assert inspection.valid
+            assert inspection.decoded_size == len(payload)
+            assert inspection.end_offset == len(uu_bytes) + 1
+            assert inspection.decoded_size == len(decode(file_object=uu_bytes).uu_bytes)
+
+
+def test_inspect_scan_malformed() -> None:
+    """
+    Test reporting malformed lines and a missing end line found by the scan.
+    """
+    uu_bytes = (
+        b'begin 644 example.jpg\n'
+        b'M./JH%ZQWFGW/;*I&+I^#6:.8U9AY_Y>IF/5Y&%,q*_8PIJL2,EV7D*E10J:;\n'
+        b'#86)C**\n'
+        b'`\n'
+    )
+    inspection = inspect(file_object=uu_bytes, scan=True)
+    assert not inspection.valid
+    assert inspection.decoded_size == 45 + 3
+    assert inspection.line_count == 3
+    assert inspection.end_offset is None
+    assert inspection.line_errors == (
+        UULineError(line_number=2, reason='illegal characters'),
+        UULineError(line_number=3, reason='trailing characters')
+    )
+
+    inspection = inspect(file_object=b'begin-base64 644 example\nYWJj*ZA\n====', scan=True)
+    assert inspection.end_offset is not None
+    assert inspection.line_errors == (
+        UULineError(line_number=2, reason='illegal characters'),
+        UULineError(line_number=2, reason='incomplete base64 data')
+    )
+
+    # Nothing to decode is not valid
+    assert not inspect(file_object=b'begin 644 example.jpg\n`\nend', scan=True).valid
@@ -0,0 +1,55 @@
+import logging
+
+import pytest
+
+from simple_uu import set_logging_mode
+from simple_uu.logger import RateLimitedWarning, set_up_logger
+
+
+def test_set_logging_mode() -> None:
+    """
+    Test switching between rich and library logging modes.
+    """
+    package_logger = logging.getLogger('simple_uu')
+
+    try:
+        set_logging_mode(mode='library')
+        assert len(package_logger.handlers) == 1
+        assert isinstance(package_logger.handlers[0], logging.NullHandler)
+        assert package_logger.propagate
+
+        set_logging_mode(mode='rich')
+        assert len(package_logger.handlers) == 1
+        assert not isinstance(package_logger.handlers[0], logging.NullHandler)
+        assert not package_logger.propagate
+    finally:
+        set_logging_mode(mode='rich')
+
+    with pytest.raises(ValueError) as exc_info:
+        set_logging_mode(mode='fake')
+    assert str(exc_info.value) == "Logging mode must be either 'rich' or 'library'"
+
+
+def test_rate_limited_warning(caplog: pytest.LogCaptureFixture) -> None:
+    """
+    Test that repeated warnings are suppressed and aggregated.
+    """
+    logger = set_up_logger('test_logger')
+    rate_limited_warning = RateLimitedWarning(logger=logger, interval=3600)
+
+    try:
+        set_logging_mode(mode='library')
+        with caplog.at_level(logging.WARNING, logger='simple_uu'):
+            for _ in range(5):
+                rate_limited_warning.warning('extension mismatch')
+
+            assert [record.getMessage() for record in caplog.records] == ['extension mismatch']
+
+            rate_limited_warning.interval = 0
+            rate_limited_warning.warning('extension mismatch')
+
+        assert caplog.records[-1].getMessage() == (
+            'extension mismatch (4 similar warnings suppressed)'
+        )
+    finally:
+        set_logging_mode(mode='rich')
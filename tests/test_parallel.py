@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from simple_uu import (InvalidUUDecodingError, decode, decode_parallel, encode,
+                       encode_parallel)
+from simple_uu.bench import generate_payload
+
+
+def test_decode_parallel() -> None:
+    """
+    Test that decoding in spans gives the same result as decode.
+    """
+    for example in range(1, 5):
+        example_path = f'./tests/examples/encoded/example_{example}.txt'
+        example_decode = decode(file_object=example_path, digests=['sha256'])
+
+        for span_length in [61, 1000, 1024 * 1024]:
+            decoded_file = decode_parallel(
+                file_object=example_path,
+                digests=['sha256'],
+                workers=4,
+                span_length=span_length
+            )
+            assert decoded_file.uu_bytes == example_decode.uu_bytes
+            assert decoded_file.filename == example_decode.filename
+            assert decoded_file.file_extension == example_decode.file_extension
+            assert decoded_file.permissions_mode == example_decode.permissions_mode
+            assert decoded_file.digests == example_decode.digests
+
+
+def test_decode_parallel_lenient() -> None:
+    """
+    Test that line errors are reported with the same line numbers across spans.
+    """
+    payload = generate_payload(size=45 * 40)
+    uu_bytes = bytearray(encode(file_object=payload, filename='example').uu_bytes)
+    lines = uu_bytes.split(b'\n')
+    lines[3] = lines[3].replace(lines[3][5:6], b'q', 1)
+    lines[30] = lines[30] + b'garbage'
+    malformed_bytes = b'\n' + b'\n'.join(lines)
+
+    decoded_file = decode_parallel(
+        file_object=malformed_bytes, strict=False, workers=3, span_length=200
+    )
+    example_decode = decode(file_object=malformed_bytes, strict=False)
+    assert decoded_file.uu_bytes == example_decode.uu_bytes
+    assert decoded_file.line_errors == example_decode.line_errors
+    assert len(decoded_file.line_errors) == 2
+
+    # The first malformed line raises the same error as decode
+    with pytest.raises(InvalidUUDecodingError) as exc_info:
+        _ = decode(file_object=malformed_bytes)
+    with pytest.raises(InvalidUUDecodingError) as parallel_exc_info:
+        _ = decode_parallel(file_object=malformed_bytes, workers=3, span_length=200)
+    assert str(parallel_exc_info.value) == str(exc_info.value)
+
+    with pytest.raises(InvalidUUDecodingError) as parallel_exc_info:
+        _ = decode_parallel(file_object=b'\n\nbegin 644 example.jpg', workers=2)
+    assert str(parallel_exc_info.value) == 'There is no content in file, nothing was decoded'
+
+
+def test_encode_parallel() -> None:
+    """
+    Test that encoding in spans gives the same result as encode, for both variants.
+    """
+    for size in [1000, 45 * 100, 45 * 100 + 7, 45 * 100 + 44]:
+        payload = generate_payload(size=size)
+        for variant in ['uu', 'base64']:
+            example_encode = encode(
+                file_object=payload, filename='example', extension='jpg', variant=variant
+            )
+            encoded_file = encode_parallel(
+                file_object=payload,
+                filename='example',
+                extension='jpg',
+                variant=variant,
+                workers=4,
+                span_length=100
+            )
+            assert encoded_file.uu_bytes == example_encode.uu_bytes
+            assert encoded_file.file_mime_type == example_encode.file_mime_type
+
+    with pytest.raises(ValueError):
+        _ = encode_parallel(file_object=b'abc', filename='example', span_length=44)
+
+
+def test_concurrent_encode_decode() -> None:
+    """
+    Test that encode and decode give the same results when called from many threads.
+    """
+    payloads = [generate_payload(size=45 * 200 + seed, seed=seed) for seed in range(16)]
+
+    def _round_trip(payload: bytes) -> bytes:
+        uu_bytes = encode(file_object=payload, filename='example', digests=['crc32']).uu_bytes
+        return bytes(decode(file_object=uu_bytes).uu_bytes)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(_round_trip, payloads)) == payloads
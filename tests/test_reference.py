@@ -0,0 +1,52 @@
+import binascii
+
+import pytest
+
+from simple_uu import InvalidUUDecodingError, encode
+from simple_uu.bench import generate_payload
+from simple_uu.reference import reference_decode, reference_encode
+
+
+def test_reference_round_trip() -> None:
+    """
+    Test that the reference codec matches encode and round trips around line boundaries.
+    """
+    for size in [1, 2, 3, 44, 45, 46, 89, 90, 91, 1000]:
+        payload = generate_payload(size=size, seed=size)
+        for variant in ['uu', 'base64']:
+            uu_bytes = reference_encode(
+                data=payload, full_filename='example.jpg', permissions_mode='600', variant=variant
+            )
+            assert uu_bytes == encode(
+                file_object=payload,
+                filename='example',
+                octal_permission='600',
+                extension='jpg',
+                encoding_validation=False,
+                binary_validation=False,
+                variant=variant
+            ).uu_bytes
+            assert reference_decode(uu_bytes=uu_bytes) == (variant, b'600', payload)
+            assert reference_decode(uu_bytes=uu_bytes.replace(b'\n', b'\r\n'))[2] == payload
+
+
+def test_reference_decode_malformed() -> None:
+    """
+    Test the handling of malformed lines by the reference decoder.
+    """
+    line = binascii.b2a_uu(b'abc').rstrip(b'\n')
+
+    # Characters beyond those needed are ignored, illegal characters are zero bits if not strict
+    assert reference_decode(uu_bytes=b'begin 644 a.jpg\n' + line + b'!!\nend')[2] == b'abc'
+    with pytest.raises(InvalidUUDecodingError):
+        _ = reference_decode(uu_bytes=b'begin 644 a.jpg\n#8q)C\nend')
+    assert reference_decode(uu_bytes=b'begin 644 a.jpg\n#8q)C\nend', strict=False)[2] == (
+        binascii.a2b_uu(b'#8`)C')
+    )
+
+    with pytest.raises(InvalidUUDecodingError):
+        _ = reference_decode(uu_bytes=b'begin-base64 644 a.jpg\nYWJ\n====')
+    assert reference_decode(uu_bytes=b'begin-base64 644 a.jpg\nYWJ\n====', strict=False)[2] == b'ab'
+
+    with pytest.raises(InvalidUUDecodingError):
+        _ = reference_decode(uu_bytes=b'644 a.jpg\n' + line + b'\nend')
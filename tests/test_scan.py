@@ -0,0 +1,138 @@
+from pathlib import Path
+
+from simple_uu import decode, decode_all, encode, iter_blocks, scan
+
+
+def _mailbox() -> bytes:
+    """
+    Build a mailbox export containing multiple uuencoded sections mixed with text.
+    """
+    example_1 = open('./tests/examples/encoded/example_1.txt', 'rb').read()
+    example_2 = encode(
+        file_object=b'\x89PNG\r\n\x1a\n' + bytes(range(256)) * 3,
+        filename='example_2',
+        octal_permission='600'
+    ).uu_bytes
+    return (
+        b'From someone@example.com\nSubject: attachments\n\n'
+        b'Please find the files to begin with below.\n\n'
+        + example_1 + b'\n\nSecond attachment:\n' + example_2 + b'\n-- \nsignature\n'
+    )
+
+
+def test_scan() -> None:
+    """
+    Test locating every section in a buffer mixed with text.
+    """
+    mailbox = _mailbox()
+    blocks = scan(file_object=mailbox)
+
+    assert [block.header for block in blocks] == [
+        b'begin 420 example_1.jpg', b'begin 600 example_2.png'
+    ]
+    for block in blocks:
+        section = mailbox[block.offset:block.offset + block.length]
+        assert section.startswith(b'begin ')
+        assert section.rstrip().endswith(b'end')
+
+    assert scan(file_object=b'no sections in here\nend\n') == []
+
+
+def test_scan_missing_end() -> None:
+    """
+    Test that a section without an end line extends to the end of the buffer.
+    """
+    buffer = b'text\nbegin 644 example.jpg\nM_]C_X  02D9)1@ ! 0$ 8 !@  #_X0)F17AI9@  34T *@    @  P$2\n'
+    blocks = scan(file_object=buffer)
+
+    assert len(blocks) == 1
+    assert blocks[0].offset == 5
+    assert blocks[0].offset + blocks[0].length == len(buffer)
+
+
+def test_scan_false_header() -> None:
+    """
+    Test that text starting with 'begin ' is not taken as the header of a section.
+    """
+    example_1 = open('./tests/examples/encoded/example_1.txt', 'rb').read()
+    mailbox = b'begin the meeting at noon\n\n' + b'begin\nbegin 644\n' + example_1
+    blocks = scan(file_object=mailbox)
+
+    assert [block.header for block in blocks] == [b'begin 420 example_1.jpg']
+    assert blocks[0].offset == mailbox.index(example_1)
+
+    decoded_files = decode_all(file_object=mailbox)
+    assert len(decoded_files) == 1
+    assert decoded_files[0].full_filename == 'example_1.jpg'
+
+    # Modes that decoding rejects are not taken as a header, while leading zeros are
+    mailbox = b'begin 1755 example.txt\n\n' + example_1.replace(b'begin 420', b'begin 0420', 1)
+    blocks = scan(file_object=mailbox)
+    assert [block.header for block in blocks] == [b'begin 0420 example_1.jpg']
+    assert decode_all(file_object=mailbox)[0].permissions_mode == '420'
+
+
+def test_decode_all() -> None:
+    """
+    Test decoding every section, sequentially and in parallel.
+    """
+    mailbox = _mailbox()
+    example_1_decode = decode(file_object='./tests/examples/encoded/example_1.txt')
+
+    for workers in [None, 2]:
+        decoded_files = decode_all(file_object=mailbox, workers=workers)
+
+        assert [decoded_file.full_filename for decoded_file in decoded_files] == [
+            'example_1.jpg', 'example_2.png'
+        ]
+        assert decoded_files[0].uu_bytes == example_1_decode.uu_bytes
+        assert decoded_files[1].permissions_mode == '600'
+        assert decoded_files[1].uu_bytes == b'\x89PNG\r\n\x1a\n' + bytes(range(256)) * 3
+
+
+def test_iter_blocks(tmp_path: Path) -> None:
+    """
+    Test lazily decoding every section from a memory-mapped file.
+    """
+    mailbox_path = tmp_path / 'mailbox.mbox'
+    mailbox_path.write_bytes(_mailbox())
+
+    blocks = iter_blocks(file_object=mailbox_path)
+    first_decoded_file = next(blocks)
+    assert first_decoded_file.full_filename == 'example_1.jpg'
+
+    remaining_decoded_files = list(blocks)
+    assert [decoded_file.full_filename for decoded_file in remaining_decoded_files] == [
+        'example_2.png'
+    ]
+
+    assert [
+        decoded_file.uu_bytes for decoded_file in iter_blocks(file_object=_mailbox())
+    ] == [
+        decoded_file.uu_bytes for decoded_file in decode_all(file_object=_mailbox())
+    ]
+
+    empty_path = tmp_path / 'empty.mbox'
+    empty_path.write_bytes(b'')
+    assert list(iter_blocks(file_object=empty_path)) == []
+
+
+def test_scan_base64() -> None:
+    """
+    Test locating and decoding sections of both variants in a buffer mixed with text.
+    """
+    binary_data = b'\x89PNG\r\n\x1a\n' + bytes(range(256)) * 3
+    example_base64 = encode(
+        file_object=binary_data, filename='example_3', octal_permission='600', variant='base64'
+    ).uu_bytes
+
+    # The end line of classic uu does not end a section of the base64 variant
+    mailbox = _mailbox() + b'Third attachment:\n' + example_base64 + b'\nend\n'
+    blocks = scan(file_object=mailbox)
+    assert [block.header for block in blocks] == [
+        b'begin 420 example_1.jpg', b'begin 600 example_2.png', b'begin-base64 600 example_3.png'
+    ]
+    assert mailbox[blocks[2].offset:blocks[2].offset + blocks[2].length] == (
+        example_base64 + b'\n'
+    )
+    assert decode_all(file_object=mailbox)[2].uu_bytes == binary_data
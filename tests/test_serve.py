@@ -0,0 +1,101 @@
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import pytest
+
+from simple_uu import UUServiceError, decode, encode
+from simple_uu.cli import main
+from simple_uu.loadtest import run_load_test
+from simple_uu.serve import UNIX_SOCKETS_SUPPORTED, UUClient, UUServer
+
+
+@pytest.fixture
+def socket_dir() -> Iterator[Path]:
+    """
+    A short directory for sockets, as the length of their paths is limited on macOS.
+    """
+    directory = tempfile.mkdtemp(prefix='uu')
+    try:
+        yield Path(directory)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.mark.skipif(not UNIX_SOCKETS_SUPPORTED, reason='Unix domain sockets are not supported')
+def test_serve(socket_dir: Path) -> None:
+    """
+    Test encoding and decoding over the socket, with errors leaving the connection usable.
+    """
+    example_bytes = Path('./tests/examples/decoded/example_1.jpg').read_bytes()
+    encoded_file = encode(
+        file_object=example_bytes, filename='example_1', octal_permission=0o640
+    )
+
+    with UUServer(socket_path=socket_dir / 'uu.sock', workers=2) as server:
+        with UUClient(socket_path=server.socket_path) as client:
+            uu_bytes, metadata = client.encode(
+                data=example_bytes, filename='example_1', octal_permission=0o640
+            )
+            assert uu_bytes == bytes(encoded_file.uu_bytes)
+            assert metadata['file_extension'] == 'jpg'
+
+            with pytest.raises(UUServiceError) as exc_info:
+                _ = client.decode(data=b'plain text')
+            assert str(exc_info.value).startswith('InvalidUUDecodingError')
+
+            decoded_bytes, metadata = client.decode(data=uu_bytes)
+            assert decoded_bytes == bytes(decode(file_object=uu_bytes).uu_bytes)
+            assert decoded_bytes == example_bytes
+            assert metadata == {
+                'filename': 'example_1.jpg',
+                'permissions_mode': '640',
+                'bytes_out': len(example_bytes)
+            }
+
+        # Concurrent clients each receive their own results
+        payloads = {
+            index: bytes(encode(file_object=example_bytes, filename=f'example_{index}').uu_bytes)
+            for index in range(8)
+        }
+        results: Dict[int, List[bytes]] = dict()
+
+        def _decode(index: int) -> None:
+            with UUClient(socket_path=server.socket_path) as client:
+                results[index] = [client.decode(data=payloads[index])[0] for _ in range(3)]
+
+        threads = [threading.Thread(target=_decode, args=(index,)) for index in payloads]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == {index: [example_bytes] * 3 for index in payloads}
+
+        load_test = run_load_test(
+            socket_path=server.socket_path, payload_size=4096, clients=3, requests=20
+        )
+        assert load_test['requests'] == 20
+        assert load_test['errors'] == 0
+        assert load_test['latency_p99'] >= load_test['latency_p50'] > 0
+
+    assert not server.socket_path.exists()
+
+
+def test_serve_unsupported(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """
+    Test that serving fails clearly on platforms without Unix domain sockets.
+    """
+    monkeypatch.setattr('simple_uu.serve.UNIX_SOCKETS_SUPPORTED', False)
+    monkeypatch.setattr('simple_uu.cli.UNIX_SOCKETS_SUPPORTED', False)
+
+    assert main(['serve', '--socket', 'uu.sock']) == 2
+    assert 'error: Unix domain sockets are not supported' in capsys.readouterr().err
+
+    with pytest.raises(OSError):
+        _ = UUServer(socket_path='uu.sock')
+    with pytest.raises(OSError):
+        _ = UUClient(socket_path='uu.sock').decode(data=b'')
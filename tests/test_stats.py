@@ -0,0 +1,58 @@
+from typing import List
+
+import pytest
+
+from simple_uu import UUStats, UUStatsAggregator, decode, encode
+
+
+def test_stats_callback() -> None:
+    """
+    Test the statistics reported by the encode and decode stats callbacks.
+    """
+    collected_stats: List[UUStats] = []
+
+    encoded_file = encode(
+        file_object='./tests/examples/decoded/example_1.jpg',
+        filename='example_1',
+        stats_callback=collected_stats.append
+    )
+    decoded_file = decode(
+        file_object=encoded_file.uu_bytes, stats_callback=collected_stats.append
+    )
+
+    encode_stats, decode_stats = collected_stats
+    assert isinstance(encode_stats, UUStats)
+    assert encode_stats.operation == 'encode'
+    assert set(encode_stats.stage_durations) == {'load', 'validation', 'detection', 'encode'}
+    assert encode_stats.bytes_in == len(decoded_file.uu_bytes)
+    assert encode_stats.bytes_out == len(encoded_file.uu_bytes)
+
+    assert decode_stats.operation == 'decode'
+    assert set(decode_stats.stage_durations) == {'load', 'validation', 'decode', 'detection'}
+    assert decode_stats.bytes_in == len(encoded_file.uu_bytes)
+    assert decode_stats.bytes_out == len(decoded_file.uu_bytes)
+    assert decode_stats.line_count == encode_stats.line_count
+    assert decode_stats.repaired_line_count == 0
+
+
+def test_stats_aggregator() -> None:
+    """
+    Test cumulative aggregation of statistics across calls.
+    """
+    aggregator = UUStatsAggregator()
+    for _ in range(3):
+        decode(
+            file_object='./tests/examples/encoded/example_1.txt',
+            stats_callback=aggregator
+        )
+
+    totals = aggregator.as_dict()
+    assert list(totals) == ['decode']
+    assert totals['decode']['calls'] == 3
+    assert totals['decode']['bytes_out'] > 0
+    assert totals['decode']['total_duration'] == pytest.approx(
+        sum(totals['decode']['stage_durations'].values())
+    )
+
+    aggregator.reset()
+    assert aggregator.as_dict() == dict()
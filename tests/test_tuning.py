@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from simple_uu import (TuningProfile, decode, decode_parallel, decode_to_file,
+                       encode, encode_parallel, encode_to_file, get_profile,
+                       set_profile)
+from simple_uu.bench import calibrate, generate_payload
+from simple_uu.cli import main
+from simple_uu.logger import set_logging_mode
+from simple_uu.tuning import load_profile, profile_path, save_profile
+
+
+def test_profile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test saving a profile and loading it automatically when first used.
+    """
+    profile = TuningProfile(chunk_length=45 * 100, block_length=1024, workers=2)
+    path = save_profile(profile=profile, path=tmp_path / 'cache' / 'profile.json')
+    assert load_profile(path=path) == profile
+
+    monkeypatch.setenv('SIMPLE_UU_PROFILE', str(path))
+    assert profile_path() == path
+    try:
+        set_profile(profile=None)
+        assert get_profile() == profile
+
+        # A profile that cannot be read falls back to the built-in defaults
+        path.write_text(json.dumps({'version': 1, 'workers': -1}))
+        set_profile(profile=None)
+        assert get_profile() == TuningProfile()
+
+        path.unlink()
+        set_profile(profile=None)
+        assert get_profile() == TuningProfile()
+    finally:
+        set_profile(profile=None)
+
+    with pytest.raises(ValueError):
+        _ = save_profile(profile=TuningProfile(chunk_length=100), path=path)
+    with pytest.raises(ValueError):
+        set_profile(profile=TuningProfile(span_length=0))
+
+
+def test_profile_settings(tmp_path: Path) -> None:
+    """
+    Test that every engine produces the same output with the settings of a profile.
+    """
+    payload = generate_payload(size=300_000)
+    uu_bytes = encode(file_object=payload, filename='example').uu_bytes
+    base64_bytes = encode(file_object=payload, filename='example', variant='base64').uu_bytes
+
+    set_profile(
+        profile=TuningProfile(chunk_length=45, block_length=100, workers=3, span_length=45 * 100)
+    )
+    try:
+        assert encode(file_object=payload, filename='example').uu_bytes == uu_bytes
+        assert encode_parallel(file_object=payload, filename='example').uu_bytes == uu_bytes
+        assert encode_to_file(
+            file_object=payload, directory=tmp_path, filename='example'
+        ).path.read_bytes() == uu_bytes
+
+        for encoded in [uu_bytes, base64_bytes]:
+            assert decode(file_object=encoded, digests=['crc32']).uu_bytes == payload
+            assert decode_to_file(
+                file_object=encoded, directory=tmp_path
+            ).path.read_bytes() == payload
+        assert decode_parallel(file_object=uu_bytes).uu_bytes == payload
+    finally:
+        set_profile(profile=None)
+
+
+def test_calibrate(tmp_path: Path) -> None:
+    """
+    Test calibrating a profile against a directory and saving it from the command line.
+    """
+    previous_profile = get_profile()
+
+    profile, results = calibrate(directory=tmp_path, size=64 * 1024, repeat=1, max_threads=2)
+    assert get_profile() == previous_profile
+    assert list(tmp_path.iterdir()) == []
+
+    settings = {setting for result in results for setting in result['flags']}
+    assert {'chunk_length', 'block_length', 'workers'} <= settings
+    assert all(result['throughput_mb_s'] for result in results)
+    save_profile(profile=profile, path=tmp_path / 'calibrated.json')
+
+    try:
+        assert main([
+            'tune',
+            '--directory', str(tmp_path),
+            '--size', '64KB',
+            '--repeat', '1',
+            '--max-threads', '1',
+            '--profile', str(tmp_path / 'profile.json')
+        ]) == 0
+    finally:
+        set_profile(profile=None)
+        set_logging_mode(mode='rich')
+
+    # A single thread is either the built-in default or selects the serial engine
+    assert load_profile(path=tmp_path / 'profile.json').workers in {None, 1}
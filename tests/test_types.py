@@ -0,0 +1,151 @@
+import multiprocessing
+import subprocess
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from typing import Tuple, cast
+
+import pytest
+
+from simple_uu import FileExtensionNotFoundError, UUDecodedFile, decode, encode
+from simple_uu.bench import generate_payload
+from simple_uu.types import SHARED_MEMORY_HEADER
+
+# Script of a consumer that is not started by the process that created the block
+_CONSUMER_SCRIPT = """
+import sys
+from simple_uu import UUDecodedFile
+
+decoded_file = UUDecodedFile.from_shared_memory(name=sys.argv[1])
+print(len(decoded_file.uu_bytes))
+decoded_file.close()
+"""
+
+
+def _consume_shared_memory(name: str) -> Tuple[str, int, bytes]:
+    """
+    Attach to a decoded file in shared memory from another process.
+    """
+    decoded_file = UUDecodedFile.from_shared_memory(name=name)
+    try:
+        with decoded_file.uu_view as data:
+            return decoded_file.full_filename, len(data), bytes(data[:16])
+    finally:
+        decoded_file.close()
+
+
+def test_shared_memory() -> None:
+    """
+    Test placing a decoded file in shared memory and attaching to it without copying.
+    """
+    payload = generate_payload(size=100_000)
+    decoded_file = decode(
+        file_object=encode(file_object=payload, filename='example').uu_bytes,
+        digests=['sha256']
+    )
+
+    block = decoded_file.to_shared_memory()
+    try:
+        attached_file = UUDecodedFile.from_shared_memory(name=block.name)
+        assert attached_file.shared_memory is not None
+        assert attached_file.full_filename == decoded_file.full_filename
+        assert attached_file.permissions_mode == decoded_file.permissions_mode
+        assert attached_file.digests == decoded_file.digests
+        assert attached_file.uu_bytes == payload
+
+        # The view of an attached file is backed by the block itself
+        cast(memoryview, block.buf)[SHARED_MEMORY_HEADER.size] = 0
+        assert attached_file.uu_view[0] == 0
+
+        attached_file.close()
+        assert attached_file.shared_memory is None
+        assert attached_file.uu_bytes == b''
+
+        # Consumers in other processes attach by name
+        with multiprocessing.get_context('spawn').Pool(processes=1) as pool:
+            full_filename, length, start = pool.apply(_consume_shared_memory, (block.name,))
+        assert full_filename == decoded_file.full_filename
+        assert length == len(payload)
+        assert start == b'\x00' + payload[1:16]
+
+        # A consumer exiting leaves the block to the process that created it
+        consumer = subprocess.run(
+            [sys.executable, '-c', _CONSUMER_SCRIPT, block.name],
+            capture_output=True,
+            check=True,
+            text=True
+        )
+        assert consumer.stdout.strip() == str(len(payload))
+        assert 'leaked shared_memory' not in consumer.stderr
+
+        attached_file = UUDecodedFile.from_shared_memory(name=block.name)
+        assert attached_file.uu_bytes[1:] == payload[1:]
+        attached_file.close()
+    finally:
+        block.close()
+        block.unlink()
+
+    with pytest.raises(ValueError):
+        empty_block = SharedMemory(create=True, size=64)
+        try:
+            _ = UUDecodedFile.from_shared_memory(name=empty_block.name)
+        finally:
+            empty_block.close()
+            empty_block.unlink()
+
+
+def test_decode_shared_memory() -> None:
+    """
+    Test decoding straight into a shared memory block.
+    """
+    payload = generate_payload(size=100_000)
+    for variant in ['uu', 'base64']:
+        uu_bytes = encode(file_object=payload, filename='example', variant=variant).uu_bytes
+
+        decoded_file = decode(file_object=uu_bytes, shared_memory=True, digests=['crc32'])
+        block = decoded_file.shared_memory
+        assert block is not None
+        try:
+            assert decoded_file.uu_bytes == payload
+            assert decoded_file.digests == decode(
+                file_object=uu_bytes, digests=['crc32']
+            ).digests
+
+            # The block already holds the metadata, so it is exported without copying
+            assert decoded_file.to_shared_memory() is block
+            attached_file = UUDecodedFile.from_shared_memory(name=block.name)
+            assert attached_file.uu_bytes == payload
+            assert attached_file.full_filename == decoded_file.full_filename
+            attached_file.close()
+
+            # A frozen instance keeps its own copy of the data once closed
+            decoded_file.freeze()
+            decoded_file.close()
+            assert decoded_file.uu_bytes == payload
+        finally:
+            block.unlink()
+
+
+def test_decode_shared_memory_metadata() -> None:
+    """
+    Test moving data to a new block when the metadata does not fit in the room left.
+    """
+    lines = [b'M' + b'`' * 60 + b'trailing'] * 200 + [b'`', b'end']
+    uu_bytes = b'begin 644 example.jpg\n' + b'\n'.join(lines)
+
+    decoded_file = decode(file_object=uu_bytes, strict=False, shared_memory=True)
+    block = decoded_file.shared_memory
+    assert block is not None
+    try:
+        assert len(decoded_file.line_errors) == 200
+        assert decoded_file.uu_bytes == bytes(45 * 200)
+
+        attached_file = UUDecodedFile.from_shared_memory(name=block.name)
+        assert attached_file.line_errors == decoded_file.line_errors
+        attached_file.close()
+    finally:
+        decoded_file.close()
+        block.unlink()
+
+    # Blocks are unlinked when decoding fails
+    with pytest.raises(FileExtensionNotFoundError):
+        _ = decode(file_object=b'begin 644 example\nM' + b'!' * 60 + b'\nend', shared_memory=True)
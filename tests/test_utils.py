@@ -1,8 +1,12 @@
-from simple_uu.utils import (
-    construct_filename,
-    decompose_filename,
-    parse_header
-)
+import errno
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from simple_uu.utils import (AtomicFileWriter, construct_filename,
+                             decompose_filename, parse_header)
 
 
 def test_construct_filename() -> None:
@@ -24,6 +28,12 @@ def test_decompose_filename() -> None:
     assert decompose_filename(filename_from_uu=None) == (None, None)
     assert decompose_filename(filename_from_uu=b'example_1') == ('example_1', None)
 
+    # Only the final component of a path is kept
+    assert decompose_filename(filename_from_uu=b'../example_1.jpg') == ('example_1', 'jpg')
+    assert decompose_filename(filename_from_uu=b'/tmp/example_1.jpg') == ('example_1', 'jpg')
+    assert decompose_filename(filename_from_uu=b'..\\example_1.jpg') == ('example_1', 'jpg')
+    assert decompose_filename(filename_from_uu=b'..') == (None, None)
+
 
 def test_parse_header() -> None:
     """
@@ -37,4 +47,28 @@ def test_parse_header() -> None:
     )
     assert parse_header(header=b'begin 777 really cool example.docx') == (
         b'begin', b'777', b'really cool example.docx'
-    )
\ No newline at end of file
+    )
+
+
+def test_atomic_file_writer_no_overwrite(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test committing without replacing an existing file, with and without hard links.
+    """
+    for link_error in [None, errno.EPERM, errno.ENOTSUP]:
+        if link_error is not None:
+            def _link(*_: Any, error: int = link_error) -> None:
+                raise OSError(error, os.strerror(error))
+            monkeypatch.setattr(os, 'link', _link)
+
+        with AtomicFileWriter(directory=tmp_path) as writer:
+            writer.write(b'first')
+            path = writer.commit(filename=f'example_{link_error}', overwrite=False)
+        assert path.read_bytes() == b'first'
+
+        with pytest.raises(FileExistsError), AtomicFileWriter(directory=tmp_path) as writer:
+            writer.write(b'second')
+            _ = writer.commit(filename=f'example_{link_error}', overwrite=False)
+        assert path.read_bytes() == b'first'
+
+    # No temporary files should be left behind
+    assert not list(tmp_path.glob('.simple-uu-*'))
@@ -0,0 +1,123 @@
+import shutil
+import signal
+import threading
+from pathlib import Path
+
+import pytest
+
+from simple_uu.cli import main
+from simple_uu.watch import FolderWatcher
+
+
+def test_folder_watcher(tmp_path: Path) -> None:
+    """
+    Test decoding complete files from a spool directory and moving them aside.
+    """
+    spool_dir = tmp_path / 'spool'
+    shutil.copytree('./tests/examples/encoded', spool_dir)
+    (spool_dir / 'broken.txt').write_bytes(b'plain text')
+    (spool_dir / 'ignored.dat').write_bytes(b'plain text')
+
+    with FolderWatcher(
+        directory=spool_dir, output_dir=tmp_path / 'decoded', workers=2, pattern='*.txt'
+    ) as watcher:
+        # Files are only queued once they are unchanged between two polls
+        watcher.poll()
+        assert watcher.counters.as_dict()['queue_depth'] == 0
+
+        # A file that is still being written is left alone
+        partial_path = spool_dir / 'partial.txt'
+        partial_path.write_bytes(b'begin 644 partial.bin\n')
+        watcher.poll()
+        assert watcher.counters.as_dict()['queue_depth'] == 5
+        assert watcher.counters.as_dict()['in_flight'] == 4
+
+        partial_path.unlink()
+        watcher.drain()
+
+    counters = watcher.counters.as_dict()
+    assert counters['queue_depth'] == 0
+    assert counters['processed'] == 4
+    assert counters['failed'] == 1
+    assert counters['bytes_in'] > counters['bytes_out'] > 0
+
+    assert sorted(path.name for path in spool_dir.iterdir() if path.is_file()) == [
+        'ignored.dat'
+    ]
+    assert (spool_dir / 'failed' / 'broken.txt').exists()
+    assert len(list((spool_dir / 'processed').iterdir())) == 4
+
+    for example_path in Path('./tests/examples/decoded').iterdir():
+        decoded_path = tmp_path / 'decoded' / example_path.name
+        decoded_path.chmod(0o644)
+        assert decoded_path.read_bytes() == example_path.read_bytes()
+
+
+def test_folder_watcher_path_traversal(tmp_path: Path) -> None:
+    """
+    Test that a path in the header cannot place a file outside of the output directory.
+    """
+    spool_dir = tmp_path / 'spool'
+    spool_dir.mkdir()
+    uu_bytes = Path('./tests/examples/encoded/example_1.txt').read_bytes()
+    for index, filename in enumerate(['../escaped.jpg', str(tmp_path / 'absolute.jpg')]):
+        (spool_dir / f'escaped_{index}.txt').write_bytes(
+            uu_bytes.replace(b'example_1.jpg', filename.encode('ascii'), 1)
+        )
+
+    with FolderWatcher(directory=spool_dir, output_dir=tmp_path / 'decoded') as watcher:
+        watcher.poll()
+        watcher.poll()
+        watcher.drain()
+
+    assert watcher.counters.as_dict()['processed'] == 2
+    assert sorted(path.name for path in (tmp_path / 'decoded').iterdir()) == [
+        'absolute.jpg', 'escaped.jpg'
+    ]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['decoded', 'spool']
+
+
+def test_folder_watcher_existing_output(tmp_path: Path) -> None:
+    """
+    Test that a file naming an existing output is moved to the failed directory.
+    """
+    spool_dir = tmp_path / 'spool'
+    spool_dir.mkdir()
+    uu_bytes = Path('./tests/examples/encoded/example_1.txt').read_bytes()
+    for name in ['first.txt', 'second.txt']:
+        (spool_dir / name).write_bytes(uu_bytes)
+
+    with FolderWatcher(directory=spool_dir, output_dir=tmp_path / 'decoded') as watcher:
+        watcher.poll()
+        watcher.poll()
+        watcher.drain()
+
+    counters = watcher.counters.as_dict()
+    assert counters['processed'] == 1
+    assert counters['failed'] == 1
+    assert [path.name for path in (tmp_path / 'decoded').iterdir()] == ['example_1.jpg']
+    assert len(list((spool_dir / 'processed').iterdir())) == 1
+    assert len(list((spool_dir / 'failed').iterdir())) == 1
+
+
+def test_cli_watch(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """
+    Test that the watch command drains its queue when it is stopped.
+    """
+    spool_dir = tmp_path / 'spool'
+    shutil.copytree('./tests/examples/encoded', spool_dir)
+
+    timer = threading.Timer(0.5, signal.raise_signal, args=(signal.SIGTERM,))
+    timer.start()
+    exit_code = main([
+        'watch', str(spool_dir), '-o', str(tmp_path / 'decoded'), '--interval', '0.1'
+    ])
+    timer.join()
+
+    assert exit_code == 0
+    assert '4 processed, 0 failed' in capsys.readouterr().err
+    assert len(list((tmp_path / 'decoded').iterdir())) == 4
+
+    with pytest.raises(ValueError) as exc_info:
+        _ = FolderWatcher(directory=spool_dir, output_dir=tmp_path / 'decoded', workers=0)
+    assert str(exc_info.value) == 'Number of workers must be at least one'